@@ -0,0 +1,136 @@
+# ruff: noqa: T201
+
+import argparse
+import resource
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the orchestration overhead of a large dynamic fan-out. The job looks like this:
+
+    (emit) --[N mapped keys]--> (first) --> (second) --> (collect)
+
+N is configurable via the `--num-mapped-keys` arg. No op compute is run: the script drives the
+execution plan the way an executor does, handing the plan a synthetic output and success event for
+each step it vends, so the times reported are for plan resolution and step bookkeeping only. Peak
+memory (max RSS) of the process is reported at the end.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="dynamic_fan_out",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-mapped-keys",
+    type=int,
+    default=100_000,
+    help="Set the number of mapping keys yielded by `emit`.",
+)
+
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=64,
+    help="Set the maximum number of steps requested from the plan at a time.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op(out=DynamicOut())
+def emit():
+    yield DynamicOutput(0, mapping_key="0")
+
+
+@op
+def first(x):
+    return x
+
+
+@op
+def second(x):
+    return x
+
+
+@op
+def collect(xs):
+    return len(xs)
+
+
+@job
+def fan_out_job():
+    collect(emit().map(first).map(second).collect())
+
+
+def _output_event(step_key: str, mapping_key=None) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        fan_out_job.name,
+        step_key=step_key,
+        event_specific_data=StepOutputData(StepOutputHandle(step_key, "result", mapping_key)),
+    )
+
+
+def _success_event(step_key: str) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        fan_out_job.name,
+        step_key=step_key,
+        event_specific_data=StepSuccessData(duration_ms=0.0),
+    )
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_mapped_keys: int, batch_size: int) -> None:
+    session = ProfilingSession(
+        name="Dynamic fan-out",
+        experiment_settings={"num_mapped_keys": num_mapped_keys, "batch_size": batch_size},
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build execution plan"):
+        plan = create_execution_plan(fan_out_job)
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        with session.logged_execution_time(f"Resolve {num_mapped_keys} mapping keys"):
+            [emit_step] = active_execution.get_steps_to_execute()
+            for i in range(num_mapped_keys):
+                active_execution.handle_event(_output_event(emit_step.key, str(i)))
+            active_execution.handle_event(_success_event(emit_step.key))
+            steps = active_execution.get_steps_to_execute(limit=batch_size)
+
+        num_steps = 1
+        with session.logged_execution_time(f"Execute {2 * num_mapped_keys + 1} downstream steps"):
+            while not active_execution.is_complete:
+                for step in steps:
+                    active_execution.get_known_state_for_steps([step])
+                    active_execution.handle_event(_output_event(step.key))
+                    active_execution.handle_event(_success_event(step.key))
+                num_steps += len(steps)
+                steps = active_execution.get_steps_to_execute(limit=batch_size)
+
+        assert num_steps == 2 * num_mapped_keys + 2, num_steps
+
+    session.log_result_summary()
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"Peak memory (max RSS): {max_rss / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_mapped_keys, args.batch_size)
@@ -0,0 +1,117 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+
+from dagster import AssetKey, AssetMaterialization, DagsterEventType
+from dagster._core.events import DagsterEvent, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.storage.dagster_run import DagsterRun
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the read throughput of full event log records, which deserialize every event, with record
+views, which read the indexed columns of each record and only deserialize events on access. A
+single run with N asset materializations is stored, each with `--num-metadata-entries` metadata
+entries, and then read back in both ways, reading the asset key and partition of each record.
+
+N is configurable via the `--num-events` arg.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="event_log_record_views",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=10000,
+    help="Set the number of materialization events stored for the run.",
+)
+
+parser.add_argument(
+    "--num-metadata-entries",
+    type=int,
+    default=20,
+    help="Set the number of metadata entries on each materialization.",
+)
+
+
+def _materialization_event(run_id: str, index: int, num_metadata_entries: int) -> EventLogEntry:
+    materialization = AssetMaterialization(
+        asset_key=AssetKey(["benchmark", f"asset_{index % 100}"]),
+        partition=str(index),
+        metadata={f"entry_{i}": f"value {i} of event {index}" for i in range(num_metadata_entries)},
+    )
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="materialize",
+        job_name="benchmark_job",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "benchmark_job",
+            event_specific_data=StepMaterializationData(materialization),
+            step_key="materialize",
+        ),
+    )
+
+
+def main(num_events: int, num_metadata_entries: int) -> None:
+    with instance_for_test() as instance:
+        run = instance.add_run(DagsterRun(job_name="benchmark_job"))
+        for i in range(num_events):
+            instance.event_log_storage.store_event(
+                _materialization_event(run.run_id, i, num_metadata_entries)
+            )
+
+        session = ProfilingSession(
+            name="Event log record views",
+            experiment_settings={
+                "num_events": num_events,
+                "num_metadata_entries": num_metadata_entries,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        rates = {}
+        for label, read_fn in [
+            (
+                "full records",
+                lambda: [
+                    (record.asset_key, record.partition_key)
+                    for record in instance.get_records_for_run(
+                        run.run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION
+                    ).records
+                ],
+            ),
+            (
+                "record views",
+                lambda: [
+                    (view.asset_key, view.partition_key)
+                    for view in instance.get_record_views_for_run(
+                        run.run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION
+                    )
+                ],
+            ),
+        ]:
+            start = time.perf_counter()
+            with session.logged_execution_time(f"Read {num_events} {label}"):
+                assert len(read_fn()) == num_events
+            rates[label] = num_events / (time.perf_counter() - start)
+
+        session.log_result_summary()
+        for label, rate in rates.items():
+            print(f"{label}: {rate:,.0f} records/sec")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_events, args.num_metadata_entries)
@@ -0,0 +1,114 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+
+from dagster import DynamicOut, DynamicOutput, in_process_executor, job, op, reconstructable
+from dagster._core.execution.api import execute_job
+from dagster._core.instance_for_test import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare execution time of an I/O-bound fan-out job under the in-process executor, running steps
+serially and concurrently on threads. The job looks like this:
+
+    (emit) --[N mapped steps]--> (wait) --> (collect)
+
+Each `wait` step sleeps for `--step-duration` seconds to simulate waiting on a remote service. N is
+configurable via the `--num-steps` arg and the number of threads via `--max-concurrent`.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="in_process_concurrency",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    default=50,
+    help="Set the number of mapped `wait` steps.",
+)
+
+parser.add_argument(
+    "--step-duration",
+    type=float,
+    default=0.2,
+    help="Set the number of seconds each `wait` step sleeps for.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=16,
+    help="Set `max_concurrent` for the concurrent execution.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op(out=DynamicOut(), config_schema={"num_steps": int})
+def emit(context):
+    for i in range(context.op_config["num_steps"]):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op(config_schema={"step_duration": float})
+def wait(context, x):
+    time.sleep(context.op_config["step_duration"])
+    return x
+
+
+@op
+def collect(xs):
+    return len(xs)
+
+
+@job(executor_def=in_process_executor)
+def fan_out_job():
+    collect(emit().map(wait).collect())
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps: int, step_duration: float, max_concurrent: int) -> None:
+    ops_config = {
+        "emit": {"config": {"num_steps": num_steps}},
+        "wait": {"config": {"step_duration": step_duration}},
+    }
+    with instance_for_test() as instance:
+        session = ProfilingSession(
+            name="In-process concurrency",
+            experiment_settings={
+                "num_steps": num_steps,
+                "step_duration": step_duration,
+                "max_concurrent": max_concurrent,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        for label, execution_config in [
+            ("serially", {}),
+            (f"on {max_concurrent} threads", {"max_concurrent": max_concurrent}),
+        ]:
+            with session.logged_execution_time(f"Execute {num_steps} I/O-bound steps {label}"):
+                with execute_job(
+                    reconstructable(fan_out_job),
+                    instance=instance,
+                    run_config={"ops": ops_config, "execution": {"config": execution_config}},
+                ) as result:
+                    assert result.success
+
+        session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.step_duration, args.max_concurrent)
@@ -0,0 +1,242 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from urllib.parse import quote
+
+import sqlalchemy as db
+from dagster import AssetKey, AssetMaterialization, DagsterEventType, EventRecordsFilter
+from dagster._core.events import DagsterEvent, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._serdes import serialize_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare asset and run queries against an unpartitioned Postgres event_logs table and one that is
+range-partitioned by event timestamp. N synthetic events spread over `--num-days` days are
+generated server-side into a separate schema for each layout, 10% of them asset materializations
+across `--num-assets` assets and `--num-partitions` partitions, and the same queries are then timed
+against both layouts, taking the median of `--repeat` runs.
+
+N is configurable via the `--num-events` arg, and defaults to 100M. Generating that many events
+takes a while and needs tens of GBs of disk.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="postgres_event_log_partitioning",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--postgres-url",
+    type=str,
+    required=True,
+    help="The url of the Postgres database to generate the benchmark schemas in.",
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=100_000_000,
+    help="Set the number of events generated for each layout.",
+)
+
+parser.add_argument(
+    "--num-days",
+    type=int,
+    default=365,
+    help="Set the number of days the generated events are spread over.",
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=1000,
+    help="Set the number of assets materialized by the generated events.",
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=365,
+    help="Set the number of partitions of each asset.",
+)
+
+parser.add_argument(
+    "--interval",
+    type=str,
+    default="month",
+    choices=["day", "week", "month"],
+    help="Set the partition interval of the partitioned layout.",
+)
+
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=5,
+    help="Set the number of times each query is run.",
+)
+
+EVENTS_PER_RUN = 1000
+GENERATE_BATCH_SIZE = 1_000_000
+
+GENERATE_EVENTS_SQL = """
+INSERT INTO event_logs
+    (run_id, event, dagster_event_type, timestamp, step_key, asset_key, partition)
+SELECT
+    'run_' || (i / :events_per_run),
+    :event,
+    CASE WHEN i % 10 = 0 THEN 'ASSET_MATERIALIZATION' ELSE 'ENGINE_EVENT' END,
+    CAST(:start AS TIMESTAMP) + (i * :seconds_per_event) * INTERVAL '1 second',
+    'benchmark_step',
+    CASE WHEN i % 10 = 0 THEN '["asset_' || ((i / 10) % :num_assets) || '"]' END,
+    CASE WHEN i % 10 = 0 THEN 'partition_' || ((i / 10) % :num_partitions) END
+FROM generate_series(:batch_start, :batch_end - 1) AS i
+"""
+
+
+def _template_event() -> str:
+    # every generated row shares a single serialized event, since the queries under test only
+    # filter on the indexed columns
+    return serialize_value(
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="benchmark_run",
+            timestamp=time.time(),
+            step_key="benchmark_step",
+            job_name="benchmark_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "benchmark_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(asset_key="benchmark_asset", partition="partition_0")
+                ),
+                step_key="benchmark_step",
+            ),
+        )
+    )
+
+
+def _schema_url(postgres_url: str, schema: str) -> str:
+    separator = "&" if "?" in postgres_url else "?"
+    return f"{postgres_url}{separator}options={quote(f'-csearch_path={schema}')}"
+
+
+def _median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def main(
+    postgres_url: str,
+    num_events: int,
+    num_days: int,
+    num_assets: int,
+    num_partitions: int,
+    interval: str,
+    repeat: int,
+) -> None:
+    from dagster_postgres.event_log import PostgresEventLogStorage
+    from dagster_postgres.event_log.partitioning import create_partitions, next_partition_start
+
+    end = datetime.utcnow().replace(microsecond=0)
+    start = end - timedelta(days=num_days)
+    seconds_per_event = num_days * 24 * 60 * 60 / num_events
+    event = _template_event()
+
+    session = ProfilingSession(
+        name="Postgres event log partitioning",
+        experiment_settings={
+            "num_events": num_events,
+            "num_days": num_days,
+            "num_assets": num_assets,
+            "num_partitions": num_partitions,
+            "interval": interval,
+        },
+    ).start()
+    session.log_start_message()
+
+    asset_key = AssetKey("asset_1")
+    run_id = f"run_{num_events // EVENTS_PER_RUN // 2}"
+    queries = {
+        "materializations in the last day": lambda storage: storage.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                after_timestamp=(end - timedelta(days=1)).timestamp(),
+            ),
+            limit=100,
+        ),
+        "latest storage id by partition": (
+            lambda storage: storage.get_latest_storage_id_by_partition(
+                asset_key, DagsterEventType.ASSET_MATERIALIZATION
+            )
+        ),
+        "records for run": lambda storage: storage.get_records_for_run(run_id),
+    }
+
+    engine = db.create_engine(postgres_url, isolation_level="AUTOCOMMIT")
+    timings = {}
+    for layout in ["unpartitioned", "partitioned"]:
+        schema = f"dagster_benchmark_{layout}"
+        with engine.connect() as conn:
+            conn.execute(db.text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            conn.execute(db.text(f"CREATE SCHEMA {schema}"))
+
+        storage = PostgresEventLogStorage(
+            _schema_url(postgres_url, schema),
+            event_log_partitioning={"interval": interval} if layout == "partitioned" else None,
+        )
+        with session.logged_execution_time(f"Generate {num_events} events ({layout})"):
+            with storage.index_connection() as conn:
+                if layout == "partitioned":
+                    create_partitions(conn, start, next_partition_start(end, interval), interval)
+                for batch_start in range(0, num_events, GENERATE_BATCH_SIZE):
+                    conn.execute(
+                        db.text(GENERATE_EVENTS_SQL),
+                        {
+                            "events_per_run": EVENTS_PER_RUN,
+                            "event": event,
+                            "start": start,
+                            "seconds_per_event": seconds_per_event,
+                            "num_assets": num_assets,
+                            "num_partitions": num_partitions,
+                            "batch_start": batch_start,
+                            "batch_end": min(batch_start + GENERATE_BATCH_SIZE, num_events),
+                        },
+                    )
+                conn.execute(db.text("ANALYZE event_logs"))
+
+        for label, query in queries.items():
+            with session.logged_execution_time(f"Query {label} ({layout})"):
+                durations = []
+                for _ in range(repeat):
+                    query_start = time.perf_counter()
+                    query(storage)
+                    durations.append(time.perf_counter() - query_start)
+            timings[(label, layout)] = _median(durations)
+
+        storage.dispose()
+
+    session.log_result_summary()
+    for label in queries:
+        print(
+            f"{label}: {timings[(label, 'unpartitioned')] * 1000:,.1f}ms unpartitioned,"
+            f" {timings[(label, 'partitioned')] * 1000:,.1f}ms partitioned"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(
+        args.postgres_url,
+        args.num_events,
+        args.num_days,
+        args.num_assets,
+        args.num_partitions,
+        args.interval,
+        args.repeat,
+    )
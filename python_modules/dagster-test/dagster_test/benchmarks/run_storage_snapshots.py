@@ -0,0 +1,181 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+
+import sqlalchemy as db
+from dagster import Field, GraphDefinition, In, Nothing, OpDefinition
+from dagster._core.definitions.dependency import DependencyDefinition
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.snap import snapshot_from_execution_plan
+from dagster._core.storage.runs.schema import SnapshotChunksTable, SnapshotsTable
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.sqlalchemy_compat import db_select
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the storage size and fetch latency of job and execution plan snapshots stored whole with
+those stored as content-addressed chunks. `--num-jobs` jobs are built from the same
+`--num-ops` configurable ops wired in different orders, and `--num-plans` execution plans are
+built for the first job, each executing a different subset of its steps. The snapshots are stored
+both whole and chunked, each in a fresh run storage, and the stored bytes are compared. Snapshots
+are then fetched from both storages with the in-process snapshot cache cleared before each fetch,
+and from the chunked storage with the cache warm, taking the median of `--repeat` fetches.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="run_storage_snapshots",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-ops",
+    type=int,
+    default=200,
+    help="Set the number of ops in each job.",
+)
+
+parser.add_argument(
+    "--num-jobs",
+    type=int,
+    default=20,
+    help="Set the number of jobs sharing the same ops.",
+)
+
+parser.add_argument(
+    "--num-plans",
+    type=int,
+    default=50,
+    help="Set the number of execution plans of the first job.",
+)
+
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=5,
+    help="Set the number of times each snapshot is fetched.",
+)
+
+
+def _build_ops(num_ops: int):
+    return [
+        OpDefinition(
+            name=f"op_{i}",
+            ins={"upstream": In(Nothing)},
+            compute_fn=lambda context, **kwargs: None,
+            config_schema={f"field_{j}": Field(str, default_value=str(j)) for j in range(10)},
+        )
+        for i in range(num_ops)
+    ]
+
+
+def _build_job(ops, offset: int):
+    # chain the same ops starting from a different one in each job
+    ordered = ops[offset:] + ops[:offset]
+    return GraphDefinition(
+        name=f"job_{offset}",
+        node_defs=ops,
+        dependencies={
+            downstream.name: {"upstream": DependencyDefinition(upstream.name)}
+            for upstream, downstream in zip(ordered, ordered[1:])
+        },
+    ).to_job()
+
+
+def _median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def _stored_bytes(storage: SqlRunStorage, chunked: bool) -> int:
+    with storage.connect() as conn:
+        snapshot_bytes = sum(
+            len(row[0]) for row in conn.execute(db_select([SnapshotsTable.c.snapshot_body]))
+        )
+        chunk_bytes = (
+            sum(len(row[0]) for row in conn.execute(db_select([SnapshotChunksTable.c.chunk_body])))
+            if chunked
+            else 0
+        )
+    return snapshot_bytes + chunk_bytes
+
+
+def main(num_ops: int, num_jobs: int, num_plans: int, repeat: int) -> None:
+    ops = _build_ops(num_ops)
+    jobs = [_build_job(ops, offset) for offset in range(num_jobs)]
+    job_snapshots = [job.get_job_snapshot() for job in jobs]
+    plan_snapshots = [
+        snapshot_from_execution_plan(
+            create_execution_plan(
+                jobs[0],
+                step_keys_to_execute=[f"op_{j}" for j in range(num_ops) if j != i % num_ops],
+            ),
+            jobs[0].get_job_snapshot_id(),
+        )
+        for i in range(num_plans)
+    ]
+
+    session = ProfilingSession(
+        name="Run storage snapshots",
+        experiment_settings={
+            "num_ops": num_ops,
+            "num_jobs": num_jobs,
+            "num_plans": num_plans,
+        },
+    ).start()
+    session.log_start_message()
+
+    stored_bytes = {}
+    timings = {}
+    for layout in ["whole", "chunked"]:
+        with instance_for_test() as instance:
+            storage = instance.run_storage
+            assert isinstance(storage, SqlRunStorage)
+            if layout == "whole":
+                # without the chunks table, snapshots are stored whole as before
+                with storage.connect() as conn:
+                    conn.execute(db.text(f"DROP TABLE {SnapshotChunksTable.name}"))
+
+            with session.logged_execution_time(f"Store snapshots ({layout})"):
+                job_snapshot_ids = [
+                    storage.add_job_snapshot(snapshot) for snapshot in job_snapshots
+                ]
+                plan_snapshot_ids = [
+                    storage.add_execution_plan_snapshot(snapshot) for snapshot in plan_snapshots
+                ]
+            stored_bytes[layout] = _stored_bytes(storage, layout == "chunked")
+
+            fetches = {
+                "job snapshot": lambda: storage.get_job_snapshot(job_snapshot_ids[-1]),
+                "execution plan snapshot": lambda: storage.get_execution_plan_snapshot(
+                    plan_snapshot_ids[-1]
+                ),
+            }
+            for label, fetch in fetches.items():
+                for cached in [False, True]:
+                    durations = []
+                    for _ in range(repeat):
+                        if not cached:
+                            storage._snapshot_cache.clear()  # noqa: SLF001
+                        fetch_start = time.perf_counter()
+                        fetch()
+                        durations.append(time.perf_counter() - fetch_start)
+                    timings[(label, layout, cached)] = _median(durations)
+
+    session.log_result_summary()
+    print(
+        f"stored bytes: {stored_bytes['whole']:,} whole, {stored_bytes['chunked']:,} chunked"
+        f" ({stored_bytes['chunked'] / stored_bytes['whole']:.1%})"
+    )
+    for label in ["job snapshot", "execution plan snapshot"]:
+        print(
+            f"fetch {label}: {timings[(label, 'whole', False)] * 1000:,.2f}ms whole,"
+            f" {timings[(label, 'chunked', False)] * 1000:,.2f}ms chunked,"
+            f" {timings[(label, 'chunked', True)] * 1000:,.3f}ms cached"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_jobs, args.num_plans, args.repeat)
@@ -16,10 +16,13 @@
     python_origin_target_argument,
 )
 from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.definitions.reconstruct import ReconstructableJob
+from dagster._core.definitions.repository_definition import RepositoryLoadData
 from dagster._core.errors import DagsterExecutionInterruptedError
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.origin import (
@@ -27,6 +30,7 @@
     JobPythonOrigin,
     get_python_environment_entry_point,
 )
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._grpc import DagsterGrpcClient, DagsterGrpcServer
@@ -392,10 +396,14 @@ def _execute_step_command_body(
             if not success:
                 return
 
+        execution_plan_snapshot = (
+            instance.get_execution_plan_snapshot(dagster_run.execution_plan_snapshot_id)
+            if dagster_run.execution_plan_snapshot_id
+            else None
+        )
+
         if dagster_run.has_repository_load_data:
-            repository_load_data = instance.get_execution_plan_snapshot(
-                check.not_none(dagster_run.execution_plan_snapshot_id)
-            ).repository_load_data
+            repository_load_data = check.not_none(execution_plan_snapshot).repository_load_data
         else:
             repository_load_data = None
 
@@ -409,12 +417,8 @@ def _execute_step_command_body(
             )
         )
 
-        execution_plan = create_execution_plan(
-            recon_job,
-            run_config=dagster_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            known_state=args.known_state,
-            repository_load_data=repository_load_data,
+        execution_plan = _get_step_execution_plan(
+            args, dagster_run, recon_job, execution_plan_snapshot, repository_load_data
         )
 
         yield from execute_plan_iterator(
@@ -443,6 +447,38 @@ def _execute_step_command_body(
         raise
 
 
+def _get_step_execution_plan(
+    args: ExecuteStepArgs,
+    dagster_run: DagsterRun,
+    recon_job: ReconstructableJob,
+    execution_plan_snapshot: Optional[ExecutionPlanSnapshot],
+    repository_load_data: Optional[RepositoryLoadData],
+) -> ExecutionPlan:
+    # Rebuild only the steps this worker executes from the run's persisted plan snapshot, rather
+    # than building and validating the plan for the whole job. Memoized runs still need the full
+    # plan to compute step versions, and old snapshots can't be used to reconstruct the plan.
+    if (
+        args.step_keys_to_execute
+        and execution_plan_snapshot is not None
+        and execution_plan_snapshot.can_reconstruct_plan
+        and not recon_job.get_definition().is_using_memoization(dagster_run.tags)
+    ):
+        return ExecutionPlan.rebuild_subset_from_snapshot(
+            dagster_run.job_name,
+            execution_plan_snapshot,
+            step_keys_to_execute=args.step_keys_to_execute,
+            known_state=args.known_state,
+        )
+
+    return create_execution_plan(
+        recon_job,
+        run_config=dagster_run.run_config,
+        step_keys_to_execute=args.step_keys_to_execute,
+        known_state=args.known_state,
+        repository_load_data=repository_load_data,
+    )
+
+
 @api_cli.command(name="grpc", help="Serve the Dagster inter-process API over GRPC")
 @click.option(
     "--port",
@@ -269,6 +269,8 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore  # (possible none)
         marker_to_close=config.get("marker_to_close"),  # type: ignore  # (should be str)
+        max_concurrent=check.opt_int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
     )
 
 
@@ -280,6 +282,16 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
             is_required=False,
             description="[DEPRECATED]",
         ),
+        "max_concurrent": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "The number of steps that may run concurrently on threads in the process. "
+                "By default, or if set to 0 or 1, steps are executed one at a time. Intended "
+                "for ops that spend most of their time waiting on I/O."
+            ),
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(),
     },
     description="Execute all steps in a single process.",
 )
@@ -299,6 +311,20 @@ def in_process_executor(init_context):
         execution:
           in_process:
 
+    Steps that spend most of their time waiting on I/O can be run concurrently on a pool of threads
+    in the process by setting ``max_concurrent``. Run-scoped ``tag_concurrency_limits`` are
+    respected the same way as in the multiprocess executor:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            max_concurrent: 8
+            tag_concurrency_limits:
+              - key: database
+                value: redshift
+                limit: 2
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -513,7 +539,8 @@ def multi_or_in_process_executor(init_context: "InitExecutorContext") -> "Execut
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
-    When using the in_process mode, then only retries can be configured.
+    When using the in_process mode, ``retries`` can be configured, as well as ``max_concurrent``
+    and ``tag_concurrency_limits`` to run steps concurrently on threads within the process.
 
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
@@ -68,6 +68,85 @@ def asset_observation(self) -> Optional[AssetObservation]:
         return self.event_log_entry.asset_observation
 
 
+class EventLogRecordView:
+    """A view of a stored event log record that exposes the fields event log storages index as
+    columns, deserializing the event itself only when ``event_log_entry`` is accessed.
+
+    The ``timestamp`` is read from the indexed column, and so may be stored at a lower precision
+    than the timestamp of the event.
+
+    Users should not instantiate this class directly.
+    """
+
+    __slots__ = (
+        "storage_id",
+        "run_id",
+        "timestamp",
+        "dagster_event_type",
+        "step_key",
+        "asset_key",
+        "partition_key",
+        "_load_event_log_entry",
+        "_event_log_entry",
+    )
+
+    def __init__(
+        self,
+        storage_id: int,
+        run_id: str,
+        timestamp: float,
+        dagster_event_type: Optional[DagsterEventType],
+        step_key: Optional[str],
+        asset_key: Optional[AssetKey],
+        partition_key: Optional[str],
+        load_event_log_entry: Callable[[], EventLogEntry],
+    ):
+        self.storage_id = storage_id
+        self.run_id = run_id
+        self.timestamp = timestamp
+        self.dagster_event_type = dagster_event_type
+        self.step_key = step_key
+        self.asset_key = asset_key
+        self.partition_key = partition_key
+        self._load_event_log_entry = load_event_log_entry
+        self._event_log_entry: Optional[EventLogEntry] = None
+
+    @staticmethod
+    def from_record(record: EventLogRecord) -> "EventLogRecordView":
+        """Builds a view of an already deserialized record."""
+        entry = record.event_log_entry
+        dagster_event = entry.dagster_event
+        view = EventLogRecordView(
+            storage_id=record.storage_id,
+            run_id=entry.run_id,
+            timestamp=entry.timestamp,
+            dagster_event_type=dagster_event.event_type if dagster_event else None,
+            step_key=dagster_event.step_key if dagster_event else entry.step_key,
+            asset_key=record.asset_key,
+            partition_key=record.partition_key,
+            load_event_log_entry=lambda: entry,
+        )
+        view._event_log_entry = entry  # noqa: SLF001
+        return view
+
+    @property
+    def is_dagster_event(self) -> bool:
+        return self.dagster_event_type is not None
+
+    @property
+    def is_event_log_entry_loaded(self) -> bool:
+        return self._event_log_entry is not None
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:
+        if self._event_log_entry is None:
+            self._event_log_entry = self._load_event_log_entry()
+        return self._event_log_entry
+
+    def to_record(self) -> EventLogRecord:
+        return EventLogRecord(storage_id=self.storage_id, event_log_entry=self.event_log_entry)
+
+
 @whitelist_for_serdes
 class EventRecordsFilter(
     NamedTuple(
@@ -6,6 +6,7 @@
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
     Dict,
     Iterable,
     List,
@@ -600,19 +601,27 @@ def _submit_runs_and_update_backfill_in_chunks(
             mid_iteration_cancel_requested = True
             break
 
-        # Submit runs in the chunk
+        # Create the runs in the chunk in a single batch, then submit them together. Create a new
+        # request context for each chunk in case the code location server is swapped out in the
+        # middle of the backfill
+        workspace = workspace_process_context.create_request_context()
+        runs_to_create = []
         for run_request in run_requests_chunk:
             yield None
-            submit_run_request(
-                run_request=run_request,
-                asset_graph=asset_graph,
-                # create a new request context for each run in case the code location server
-                # is swapped out in the middle of the backfill
-                workspace=workspace_process_context.create_request_context(),
-                instance=instance,
-                pipeline_and_execution_plan_cache=pipeline_and_execution_plan_cache,
+            runs_to_create.append(
+                get_create_run_args_for_run_request(
+                    run_request=run_request,
+                    asset_graph=asset_graph,
+                    workspace=workspace,
+                    instance=instance,
+                    pipeline_and_execution_plan_cache=pipeline_and_execution_plan_cache,
+                )
             )
 
+        runs = instance.create_runs(runs_to_create)
+        yield None
+        instance.submit_runs([run.run_id for run in runs], workspace)
+
         unsubmitted_run_request_idx = chunk_end_idx
 
         requested_partitions_in_chunk = _get_requested_asset_partitions_from_run_requests(
@@ -849,14 +858,16 @@ def get_canceling_asset_backfill_iteration_data(
     yield updated_backfill_data
 
 
-def submit_run_request(
+def get_create_run_args_for_run_request(
     asset_graph: ExternalAssetGraph,
     run_request: RunRequest,
     instance: DagsterInstance,
     workspace: BaseWorkspaceRequestContext,
     pipeline_and_execution_plan_cache: Dict[int, Tuple[ExternalJob, ExternalExecutionPlan]],
-) -> None:
-    """Creates and submits a run for the given run request."""
+) -> Mapping[str, Any]:
+    """Returns the arguments to `DagsterInstance.create_run` for a run that fulfills the given run
+    request.
+    """
     repo_handle = asset_graph.get_repository_handle(
         cast(Sequence[AssetKey], run_request.asset_selection)[0]
     )
@@ -902,7 +913,7 @@ def submit_run_request(
 
     external_job, external_execution_plan = pipeline_and_execution_plan_cache[selector_id]
 
-    run = instance.create_run(
+    return dict(
         job_snapshot=external_job.job_snapshot,
         execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
         parent_job_snapshot=external_job.parent_job_snapshot,
@@ -922,8 +933,6 @@ def submit_run_request(
         asset_check_selection=None,
     )
 
-    instance.submit_run(run.run_id, workspace)
-
 
 def _get_implicit_job_name_for_assets(
     asset_graph: ExternalAssetGraph, asset_keys: Sequence[AssetKey]
@@ -948,22 +957,19 @@ def get_asset_backfill_iteration_materialized_partitions(
     """
     recently_materialized_asset_partitions = AssetGraphSubset(asset_graph)
     for asset_key in asset_backfill_data.target_subset.asset_keys:
-        records = instance_queryer.instance.get_event_records(
+        records = instance_queryer.instance.iterate_event_records(
             EventRecordsFilter(
                 event_type=DagsterEventType.ASSET_MATERIALIZATION,
                 asset_key=asset_key,
                 after_cursor=asset_backfill_data.latest_storage_id,
             )
         )
-        records_in_backfill = [
-            record
+        recently_materialized_asset_partitions |= {
+            AssetKeyPartitionKey(asset_key, record.partition_key)
             for record in records
             if instance_queryer.run_has_tag(
                 run_id=record.run_id, tag_key=BACKFILL_ID_TAG, tag_value=backfill_id
             )
-        ]
-        recently_materialized_asset_partitions |= {
-            AssetKeyPartitionKey(asset_key, record.partition_key) for record in records_in_backfill
         }
 
         yield None
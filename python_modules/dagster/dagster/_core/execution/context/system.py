@@ -52,6 +52,7 @@
     has_one_dimension_time_window_partitioning,
 )
 from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.event_loop import RunEventLoop
 from dagster._core.execution.plan.handle import ResolvedFromDynamicStepHandle, StepHandle
 from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.step import ExecutionStep
@@ -196,6 +197,7 @@ class ExecutionData(NamedTuple):
     scoped_resources_builder: ScopedResourcesBuilder
     resolved_run_config: ResolvedRunConfig
     job_def: JobDefinition
+    event_loop: Optional[RunEventLoop] = None
 
 
 class IStepContext(IPlanContext):
@@ -352,6 +354,11 @@ def resolved_run_config(self) -> ResolvedRunConfig:
     def scoped_resources_builder(self) -> ScopedResourcesBuilder:
         return self._execution_data.scoped_resources_builder
 
+    @property
+    def event_loop(self) -> Optional[RunEventLoop]:
+        """The event loop that async user code for this run is awaited on, if one was set up."""
+        return self._execution_data.event_loop
+
     @property
     def log(self) -> DagsterLogManager:
         return self._log_manager
@@ -29,6 +29,7 @@
 from dagster._core.definitions.resource_definition import ScopedResourcesBuilder
 from dagster._core.errors import DagsterError, DagsterUserCodeExecutionError
 from dagster._core.events import DagsterEvent
+from dagster._core.execution.event_loop import RunEventLoop, run_event_loop
 from dagster._core.execution.memoization import validate_reexecution_memoization
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.resources_init import (
@@ -134,11 +135,13 @@ def create_plan_data(
 def create_execution_data(
     context_creation_data: "ContextCreationData",
     scoped_resources_builder: ScopedResourcesBuilder,
+    event_loop: Optional[RunEventLoop] = None,
 ) -> ExecutionData:
     return ExecutionData(
         scoped_resources_builder=scoped_resources_builder,
         resolved_run_config=context_creation_data.resolved_run_config,
         job_def=context_creation_data.job_def,
+        event_loop=event_loop,
     )
 
 
@@ -215,30 +218,37 @@ def execution_context_event_generator(
     log_manager = create_log_manager(context_creation_data)
     resource_defs = job_def.get_required_resource_defs()
 
-    resources_manager = scoped_resources_builder_cm(
-        resource_defs=resource_defs,
-        resource_configs=context_creation_data.resolved_run_config.resources,
-        log_manager=log_manager,
-        execution_plan=execution_plan,
-        dagster_run=context_creation_data.dagster_run,
-        resource_keys_to_init=context_creation_data.resource_keys_to_init,
-        instance=instance,
-        emit_persistent_events=True,
-    )
-    yield from resources_manager.generate_setup_events()
-    scoped_resources_builder = check.inst(resources_manager.get_object(), ScopedResourcesBuilder)
-
-    execution_context = PlanExecutionContext(
-        plan_data=create_plan_data(context_creation_data, raise_on_error, retry_mode),
-        execution_data=create_execution_data(context_creation_data, scoped_resources_builder),
-        log_manager=log_manager,
-        output_capture=output_capture,
-    )
+    # async resources, ops and IO managers are all awaited on a single loop for the run, which is
+    # closed once resources have been torn down
+    with run_event_loop(dagster_run.run_id) as event_loop:
+        resources_manager = scoped_resources_builder_cm(
+            resource_defs=resource_defs,
+            resource_configs=context_creation_data.resolved_run_config.resources,
+            log_manager=log_manager,
+            execution_plan=execution_plan,
+            dagster_run=context_creation_data.dagster_run,
+            resource_keys_to_init=context_creation_data.resource_keys_to_init,
+            instance=instance,
+            emit_persistent_events=True,
+        )
+        yield from resources_manager.generate_setup_events()
+        scoped_resources_builder = check.inst(
+            resources_manager.get_object(), ScopedResourcesBuilder
+        )
 
-    _validate_plan_with_context(execution_context, execution_plan)
+        execution_context = PlanExecutionContext(
+            plan_data=create_plan_data(context_creation_data, raise_on_error, retry_mode),
+            execution_data=create_execution_data(
+                context_creation_data, scoped_resources_builder, event_loop
+            ),
+            log_manager=log_manager,
+            output_capture=output_capture,
+        )
 
-    yield execution_context
-    yield from resources_manager.generate_teardown_events()
+        _validate_plan_with_context(execution_context, execution_plan)
+
+        yield execution_context
+        yield from resources_manager.generate_teardown_events()
 
 
 class PlanOrchestrationContextManager(ExecutionContextManager[PlanOrchestrationContext]):
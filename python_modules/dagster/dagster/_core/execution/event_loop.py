@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import AsyncGenerator, Awaitable, Dict, Iterator, Optional, Tuple, TypeVar
+
+import dagster._check as check
+
+T = TypeVar("T")
+
+
+class RunEventLoop:
+    """An asyncio event loop shared by everything executed on behalf of a run in this process.
+
+    The loop is started lazily on a daemon thread the first time it is needed. Async op compute
+    functions, IO manager methods and resources are submitted to it from the threads that execute
+    steps, so coroutines from steps that run concurrently overlap on the same loop and objects
+    bound to the loop, such as async clients held by resources, can be shared between steps.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="dagster_run_event_loop", daemon=True
+                )
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        """Block the calling thread until the awaitable has completed on the loop."""
+        check.invariant(
+            threading.current_thread() is not self._thread,
+            "Can not block on the run event loop from a coroutine running on it",
+        )
+        future = asyncio.run_coroutine_threadsafe(_await(awaitable), self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. an interrupt while waiting, which should not leave the coroutine running
+            future.cancel()
+            raise
+
+    def iterate(self, async_gen: AsyncGenerator[T, None]) -> Iterator[T]:
+        """Iterate an async generator from the calling thread, advancing it on the loop."""
+        exhausted = False
+        try:
+            while True:
+                try:
+                    item = self.run(async_gen.__anext__())
+                except StopAsyncIteration:
+                    exhausted = True
+                    return
+                yield item
+        finally:
+            # if iteration stopped early, e.g. because this generator was closed or the step was
+            # interrupted, close the async generator on the loop so that its cleanup runs there
+            if not exhausted and self._loop is not None:
+                self.run(async_gen.aclose())
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+
+        if loop is None or thread is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(_shutdown(loop), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+async def _shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    # cancel anything user code left running, e.g. tasks abandoned by an interrupted step
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks(loop) if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await loop.shutdown_asyncgens()
+
+
+_run_event_loops_lock = threading.Lock()
+_run_event_loops: Dict[str, Tuple[RunEventLoop, int]] = {}
+
+
+@contextmanager
+def run_event_loop(run_id: str) -> Iterator[RunEventLoop]:
+    """Make a RunEventLoop available for the given run for the duration of the block. Nested
+    blocks for the same run share the loop, which is closed when the outermost block exits.
+    """
+    check.str_param(run_id, "run_id")
+    with _run_event_loops_lock:
+        event_loop, refs = _run_event_loops.get(run_id, (RunEventLoop(), 0))
+        _run_event_loops[run_id] = (event_loop, refs + 1)
+
+    try:
+        yield event_loop
+    finally:
+        with _run_event_loops_lock:
+            event_loop, refs = _run_event_loops[run_id]
+            if refs > 1:
+                _run_event_loops[run_id] = (event_loop, refs - 1)
+            else:
+                del _run_event_loops[run_id]
+        if refs == 1:
+            event_loop.close()
+
+
+def get_run_event_loop(run_id: Optional[str]) -> Optional[RunEventLoop]:
+    if run_id is None:
+        return None
+
+    with _run_event_loops_lock:
+        entry = _run_event_loops.get(run_id)
+    return entry[0] if entry else None
@@ -13,8 +13,9 @@ def validate_reexecution_memoization(
     if parent_run_id is None:
         return
 
-    # exclude full pipeline re-execution
-    if len(execution_plan.step_keys_to_execute) == len(execution_plan.steps):
+    # exclude full pipeline re-execution. The steps of a plan rebuilt from a snapshot are loaded
+    # lazily, so compare against the keys of every step rather than the loaded steps.
+    if len(execution_plan.step_keys_to_execute) == len(execution_plan.get_all_step_keys()):
         return
 
     if execution_plan.artifacts_persisted:
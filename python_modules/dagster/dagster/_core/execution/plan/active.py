@@ -1,4 +1,7 @@
+import heapq
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -35,10 +39,11 @@
 from dagster._utils.interrupts import pop_captured_interrupt
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
+from .handle import ResolvedFromDynamicStepHandle
 from .instance_concurrency_context import InstanceConcurrencyContext
 from .outputs import StepOutputData, StepOutputHandle
 from .plan import ExecutionPlan
-from .step import ExecutionStep
+from .step import ExecutionStep, UnresolvedMappedExecutionStep
 
 
 def _default_sort_key(step: ExecutionStep) -> float:
@@ -87,7 +92,18 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+        # the dependencies of every step that has been pending, kept for retries
+        self._step_deps: Dict[str, Set[str]] = {}
+        # the number of dependencies of each pending step that have not succeeded or skipped yet,
+        # and the pending steps by dependency, so that _update only needs to reconsider steps whose
+        # upstream steps have all completed or one of which has failed
+        self._pending_remaining_deps: Dict[str, int] = {}
+        self._pending_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._pending_to_check: Set[str] = set()
+        # steps are considered in the order they became pending
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -102,7 +118,9 @@ def __init__(
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
         # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # _executable is a heap ordered by sort key, then by the order steps became executable
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_counter = itertools.count()
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -123,6 +141,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -176,7 +197,10 @@ def __exit__(
     def _pending_state_str(self) -> str:
         assert not self.is_complete
         pending_action = (
-            self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+            [step_key for _, _, step_key in sorted(self._executable)]
+            + self._pending_abandon
+            + self._pending_retry
+            + self._pending_skip
         )
         return "{pending_str}{in_flight_str}{action_str}{retry_str}{claim_str}".format(
             in_flight_str=f"\nSteps still in flight: {self._in_flight}" if self._in_flight else "",
@@ -206,23 +230,28 @@ def _update(self) -> None:
         new_steps_to_skip: List[str] = []
         new_steps_to_abandon: List[str] = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        # only steps that are new or have had an upstream step complete can have changed state
+        steps_to_check = sorted(self._pending_to_check, key=self._pending_order.__getitem__)
+        self._pending_to_check = set()
+
+        for step_key in steps_to_check:
+            requirements = self._pending.get(step_key)
+            if requirements is None:
+                continue
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if any(key in self._failed or key in self._abandoned for key in requirements):
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif all(key in self._success or key in self._skipped for key in requirements):
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -253,16 +282,19 @@ def _update(self) -> None:
                     new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._pending[key]
+            del self._pending_remaining_deps[key]
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
             del self._pending[key]
+            del self._pending_remaining_deps[key]
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
             del self._pending[key]
+            del self._pending_remaining_deps[key]
 
         ready_to_retry = []
         tick_time = time.time()
@@ -271,9 +303,29 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._pending_order[step_key] = next(self._pending_counter)
+        self._step_deps[step_key] = deps
+        remaining_deps = {
+            key for key in deps if key not in self._success and key not in self._skipped
+        }
+        self._pending_remaining_deps[step_key] = len(remaining_deps)
+        for dep in remaining_deps:
+            self._pending_dependents[dep].add(step_key)
+
+        if not remaining_deps or any(
+            key in self._failed or key in self._abandoned for key in remaining_deps
+        ):
+            self._pending_to_check.add(step_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        sort_key = self._sort_key_fn(self.get_step_by_key(step_key))
+        heapq.heappush(self._executable, (sort_key, next(self._executable_counter), step_key))
+
     def sleep_interval(self):
         now = time.time()
         intervals = []
@@ -292,6 +344,15 @@ def sleep_interval(self):
 
         return 0
 
+    def has_timed_wait(self) -> bool:
+        """Whether a step is waiting to be retried or to claim a concurrency slot, in which case
+        sleep_interval is the time until the plan should next be checked.
+        """
+        return bool(self._waiting_to_retry) or bool(
+            self._instance_concurrency_context
+            and self._instance_concurrency_context.has_pending_claims()
+        )
+
     def sleep_til_ready(self) -> None:
         sleep_amt = self.sleep_interval()
         if sleep_amt > 0:
@@ -323,11 +384,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -337,8 +393,10 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        # steps that could not be started yet, to be put back on the heap in the same order
+        blocked: List[Tuple[float, int, str]] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -348,8 +406,12 @@ def get_steps_to_execute(
             ):
                 break
 
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
             if run_scoped_concurrency_limits_counter:
@@ -365,13 +427,16 @@ def get_steps_to_execute(
                 if not self._instance_concurrency_context.claim(
                     step_concurrency_key, step.key, priority
                 ):
+                    blocked.append(entry)
                     continue
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -484,7 +549,7 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
@@ -501,6 +566,18 @@ def _mark_complete(self, step_key: str) -> None:
         )
         self._in_flight.remove(step_key)
 
+        succeeded = step_key in self._success or step_key in self._skipped
+        failed = step_key in self._failed or step_key in self._abandoned
+        for dependent_key in self._pending_dependents.get(step_key, ()):
+            if dependent_key not in self._pending_remaining_deps:
+                continue
+            if failed:
+                self._pending_to_check.add(dependent_key)
+            elif succeeded:
+                self._pending_remaining_deps[dependent_key] -= 1
+                if self._pending_remaining_deps[dependent_key] == 0:
+                    self._pending_to_check.add(dependent_key)
+
     def handle_event(self, dagster_event: DagsterEvent) -> None:
         check.inst_param(dagster_event, "dagster_event", DagsterEvent)
 
@@ -597,6 +674,54 @@ def get_known_state(self) -> KnownExecutionState:
             parent_state=self._plan.known_state.parent_state,
         )
 
+    def get_known_state_for_steps(self, steps: Sequence[ExecutionStep]) -> KnownExecutionState:
+        """A subset of get_known_state with only the state needed to execute the given steps, so
+        that delegating many steps does not serialize the state of the whole run for each one.
+        """
+        step_keys = {step.key for step in steps}
+        previous_retry_attempts = {
+            step_key: count
+            for step_key, count in self._retry_state.snapshot_attempts().items()
+            if step_key in step_keys
+        }
+
+        ready_outputs = set()
+        for step in steps:
+            for step_input in step.step_inputs:
+                ready_outputs.update(
+                    handle
+                    for handle in step_input.get_step_output_handle_dependencies()
+                    if handle in self._step_outputs
+                )
+
+        return KnownExecutionState(
+            previous_retry_attempts=previous_retry_attempts,
+            dynamic_mappings=self._get_dynamic_mappings_for_steps(steps),
+            ready_outputs=ready_outputs,
+            step_output_versions=self._plan.known_state.step_output_versions,
+            parent_state=self._plan.known_state.parent_state,
+        )
+
+    def _get_dynamic_mappings_for_steps(
+        self, steps: Sequence[ExecutionStep]
+    ) -> Mapping[str, Mapping[str, Optional[Sequence[str]]]]:
+        # A step mapped over a dynamic output only needs its own mapping key to be resolved, so
+        # avoid sending every mapping key of a large fan-out to each mapped step.
+        if not all(isinstance(step.handle, ResolvedFromDynamicStepHandle) for step in steps):
+            return dict(self._completed_dynamic_outputs)
+
+        dynamic_mappings: Dict[str, Dict[str, List[str]]] = {}
+        for step in steps:
+            handle = cast(ResolvedFromDynamicStepHandle, step.handle)
+            unresolved_step = cast(
+                UnresolvedMappedExecutionStep, self._plan.get_step(handle.unresolved_form)
+            )
+            dynamic_mappings.setdefault(unresolved_step.resolved_by_step_key, {}).setdefault(
+                unresolved_step.resolved_by_output_name, []
+            ).append(handle.mapping_key)
+
+        return dynamic_mappings
+
     def _prep_for_dynamic_outputs(self, step: ExecutionStep):
         dyn_outputs = [step_out for step_out in step.step_outputs if step_out.is_dynamic]
         if dyn_outputs:
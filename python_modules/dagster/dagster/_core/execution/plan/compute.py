@@ -166,7 +166,10 @@ def _yield_compute_results(
         return
 
     if inspect.isasyncgen(user_event_generator):
-        user_event_generator = gen_from_async_gen(user_event_generator)
+        if step_context.event_loop:
+            user_event_generator = step_context.event_loop.iterate(user_event_generator)
+        else:
+            user_event_generator = gen_from_async_gen(user_event_generator)
 
     op_label = step_context.describe_op()
 
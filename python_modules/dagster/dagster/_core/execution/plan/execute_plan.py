@@ -1,6 +1,8 @@
+import queue
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Iterator, Optional, Sequence, cast
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
 from dagster._core.definitions import Failure, HookExecutionResult, RetryRequested
@@ -69,22 +71,11 @@ def inner_plan_execution_iterator(
 
                 step_context = cast(
                     StepExecutionContext,
-                    job_context.for_step(step, active_execution.get_known_state()),
+                    job_context.for_step(step, active_execution.get_known_state_for_steps([step])),
                 )
                 step_event_list = []
 
-                missing_resources = [
-                    resource_key
-                    for resource_key in step_context.required_resource_keys
-                    if not hasattr(step_context.resources, resource_key)
-                ]
-                check.invariant(
-                    len(missing_resources) == 0,
-                    (
-                        "Expected step context for solid {solid_name} to have all required"
-                        " resources, but missing {missing_resources}."
-                    ).format(solid_name=step_context.op.name, missing_resources=missing_resources),
-                )
+                _check_step_resources(step_context)
 
                 with ExitStack() as step_stack:
                     if not isinstance(compute_log_manager, CapturedLogManager):
@@ -143,6 +134,157 @@ def inner_plan_execution_iterator(
                 yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
 
 
+def concurrent_plan_execution_iterator(
+    job_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+    instance_concurrency_context: Optional[InstanceConcurrencyContext] = None,
+) -> Iterator[DagsterEvent]:
+    """Execute the plan in the current process, running up to ``max_concurrent`` ready steps at a
+    time on a pool of threads that share the job's initialized resources.
+
+    This is intended for I/O-bound ops. Step events are produced on the worker threads and handed
+    back to the calling thread, which yields them and drives the ``ActiveExecution``, so plan state
+    is only ever mutated from a single thread.
+    """
+    check.inst_param(job_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    compute_log_manager = job_context.instance.compute_log_manager
+    step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+    with execution_plan.start(
+        retry_mode=job_context.retry_mode,
+        max_concurrent=max_concurrent,
+        tag_concurrency_limits=tag_concurrency_limits,
+        instance_concurrency_context=instance_concurrency_context,
+    ) as active_execution:
+        with ExitStack() as capture_stack:
+            # per-step stdout/stderr capture is not thread-safe, so logs can only be captured at
+            # the process level
+            if isinstance(compute_log_manager, CapturedLogManager):
+                file_key = create_compute_log_file_key()
+                log_key = compute_log_manager.build_log_key_for_run(job_context.run_id, file_key)
+                try:
+                    log_context = capture_stack.enter_context(
+                        compute_log_manager.capture_logs(log_key)
+                    )
+                    yield DagsterEvent.capture_logs(job_context, step_keys, log_key, log_context)
+                except Exception:
+                    yield from _handle_compute_log_setup_error(job_context, sys.exc_info())
+
+            event_queue: "queue.Queue[Tuple[str, object]]" = queue.Queue()
+            running_step_contexts: Dict[str, StepExecutionContext] = {}
+            running_step_events: Dict[str, List[DagsterEvent]] = {}
+            step_futures: Dict[str, Future] = {}
+
+            pool = ThreadPoolExecutor(
+                max_workers=max_concurrent, thread_name_prefix="dagster_in_process_step"
+            )
+            try:
+                # a step can be marked complete before its thread has finished, so keep going until
+                # every thread has handed back control and the plan has been updated
+                while not active_execution.is_complete or running_step_contexts:
+                    yield from active_execution.concurrency_event_iterator(job_context)
+
+                    for step in active_execution.get_steps_to_execute():
+                        step_context = cast(
+                            StepExecutionContext,
+                            job_context.for_step(
+                                step, active_execution.get_known_state_for_steps([step])
+                            ),
+                        )
+                        _check_step_resources(step_context)
+                        running_step_contexts[step.key] = step_context
+                        running_step_events[step.key] = []
+                        step_futures[step.key] = pool.submit(
+                            _execute_step_in_thread, step_context, event_queue
+                        )
+
+                    if not running_step_contexts:
+                        active_execution.sleep_til_ready()
+                        continue
+
+                    try:
+                        if active_execution.has_timed_wait():
+                            # wake up early if a step is waiting to be retried or to claim a slot,
+                            # without blocking at all if one is already due
+                            timeout = max(0.0, active_execution.sleep_interval())
+                            if timeout > 0:
+                                step_key, item = event_queue.get(timeout=timeout)
+                            else:
+                                step_key, item = event_queue.get_nowait()
+                        else:
+                            step_key, item = event_queue.get()
+                    except queue.Empty:
+                        continue
+
+                    if isinstance(item, DagsterEvent):
+                        running_step_events[step_key].append(item)
+                        yield item
+                        active_execution.handle_event(item)
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        # the step's event sequence is exhausted
+                        step_futures.pop(step_key)
+                        step_context = running_step_contexts.pop(step_key)
+                        step_event_list = running_step_events.pop(step_key)
+                        active_execution.verify_complete(job_context, step_key)
+
+                        # process skips from failures or uncovered inputs
+                        for event in active_execution.plan_events_iterator(job_context):
+                            step_event_list.append(event)
+                            yield event
+
+                        # pass a list of step events to hooks
+                        yield from _trigger_hook(step_context, step_event_list)
+            except BaseException:
+                # steps that have not started are dropped, but the steps that are running share the
+                # job's resources, so wait for them before the resources are torn down
+                for future in step_futures.values():
+                    future.cancel()
+                pool.shutdown(wait=True)
+                raise
+            else:
+                pool.shutdown(wait=True)
+
+            try:
+                capture_stack.close()
+            except Exception:
+                yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
+
+
+_STEP_DONE = object()
+
+
+def _execute_step_in_thread(
+    step_context: StepExecutionContext, event_queue: "queue.Queue[Tuple[str, object]]"
+) -> None:
+    step_key = step_context.step.key
+    try:
+        for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+            check.inst(step_event, DagsterEvent)
+            event_queue.put((step_key, step_event))
+    except BaseException as e:
+        event_queue.put((step_key, e))
+    finally:
+        event_queue.put((step_key, _STEP_DONE))
+
+
+def _check_step_resources(step_context: StepExecutionContext) -> None:
+    missing_resources = [
+        resource_key
+        for resource_key in step_context.required_resource_keys
+        if not hasattr(step_context.resources, resource_key)
+    ]
+    check.invariant(
+        len(missing_resources) == 0,
+        f"Expected step context for solid {step_context.op.name} to have all required"
+        f" resources, but missing {missing_resources}.",
+    )
+
+
 def _handle_compute_log_setup_error(
     context: PlanExecutionContext, exc_info
 ) -> Iterator[DagsterEvent]:
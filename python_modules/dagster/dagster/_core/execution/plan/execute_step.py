@@ -75,7 +75,7 @@
 
 from .compute import OpOutputUnion
 from .compute_generator import create_op_compute_wrapper
-from .utils import op_execution_error_boundary
+from .utils import await_user_coroutine, op_execution_error_boundary
 
 
 def _process_asset_results_to_events(
@@ -720,6 +720,8 @@ def _no_op() -> Iterator[DagsterEvent]:
 
         def _gen_fn():
             gen_output = output_manager.handle_output(output_context, output.value)
+            if inspect.iscoroutine(gen_output):
+                gen_output = await_user_coroutine(step_context, gen_output)
             for event in output_context.consume_events():
                 yield event
             if gen_output:
@@ -1,4 +1,5 @@
 import hashlib
+import inspect
 from abc import ABC, abstractmethod, abstractproperty
 from typing import (
     TYPE_CHECKING,
@@ -31,7 +32,11 @@
 
 from .objects import TypeCheckData
 from .outputs import StepOutputHandle, UnresolvedStepOutputHandle
-from .utils import build_resources_for_manager, op_execution_error_boundary
+from .utils import (
+    await_user_coroutine,
+    build_resources_for_manager,
+    op_execution_error_boundary,
+)
 
 if TYPE_CHECKING:
     from dagster._core.execution.context.input import InputContext
@@ -828,6 +833,8 @@ def _load_input_with_input_manager(
         input_name=context.name,
     ):
         value = input_manager.load_input(context)
+        if inspect.iscoroutine(value):
+            value = await_user_coroutine(step_context, value)
     # close user code boundary before returning value
     for event in context.consume_events():
         yield event
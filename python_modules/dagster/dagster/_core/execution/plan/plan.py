@@ -1,6 +1,7 @@
 from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -89,6 +90,7 @@
     from dagster._core.snap.execution_plan_snapshot import (
         ExecutionPlanSnapshot,
         ExecutionStepInputSnap,
+        ExecutionStepSnap,
     )
 
     from .active import ActiveExecution
@@ -712,6 +714,19 @@ def __new__(
     def steps(self) -> Sequence[IExecutionStep]:
         return list(self.step_dict.values())
 
+    @property
+    def loads_steps_lazily(self) -> bool:
+        """Whether steps are rebuilt from a snapshot on first lookup, in which case ``steps`` only
+        includes the steps loaded so far. See ``rebuild_subset_from_snapshot``.
+        """
+        return isinstance(self.step_dict_by_key, _LazyStepDict)
+
+    def get_all_step_keys(self) -> AbstractSet[str]:
+        """The keys of every step in the plan, including steps that have not been loaded."""
+        if isinstance(self.step_dict_by_key, _LazyStepDict):
+            return self.step_dict_by_key.get_all_keys()
+        return set(self.step_dict_by_key.keys())
+
     @property
     def step_output_versions(self) -> Mapping[StepOutputHandle, str]:
         return StepOutputVersionData.get_version_dict_from_list(
@@ -789,21 +804,45 @@ def resolve(
         self,
         mappings: Mapping[str, Mapping[str, Optional[Sequence[str]]]],
     ) -> Mapping[str, Set[str]]:
-        """Resolve any dynamic map or collect steps with the resolved dynamic mappings."""
-        previous = self.get_executable_step_deps()
+        """Resolve any dynamic map or collect steps with the resolved dynamic mappings, returning
+        the dependencies of the steps that became executable as a result.
+        """
+        step_keys_to_execute = set(self.step_keys_to_execute)
 
-        _update_from_resolved_dynamic_outputs(
+        # steps that were already executable but depended on an unresolved collect step are
+        # left out of the executable step deps, and become executable once it resolves
+        blocked_keys = _get_blocked_step_keys(
             self.step_dict,
-            self.step_dict_by_key,
             self.executable_map,
             self.resolvable_map,
             self.step_handles_to_execute,
+            step_keys_to_execute,
             mappings,
         )
 
-        after = self.get_executable_step_deps()
+        resolved_steps = _update_from_resolved_dynamic_outputs(
+            self.step_dict,
+            self.step_dict_by_key,
+            self.executable_map,
+            self.resolvable_map,
+            self.step_handles_to_execute,
+            mappings,
+        )
 
-        return {key: deps for key, deps in after.items() if key not in previous}
+        is_blocked = _blocked_step_key_checker(
+            self.step_dict, self.executable_map, step_keys_to_execute
+        )
+        new_step_deps = {}
+        for step_key in [step.key for step in resolved_steps] + blocked_keys:
+            if not is_blocked(step_key):
+                new_step_deps[step_key] = {
+                    dep
+                    for dep in self.get_executable_step_by_key(
+                        step_key
+                    ).get_execution_dependency_keys()
+                    if dep in self.executable_map
+                }
+        return new_step_deps
 
     def build_subset_plan(
         self,
@@ -1106,59 +1145,7 @@ def rebuild_from_snapshot(
         step_dict_by_key: Dict[str, IExecutionStep] = {}
 
         for step_snap in execution_plan_snapshot.steps:
-            input_snaps = step_snap.inputs
-            output_snaps = step_snap.outputs
-
-            step_inputs = [
-                ExecutionPlan.rebuild_step_input(step_input_snap) for step_input_snap in input_snaps
-            ]
-
-            step_outputs = [
-                StepOutput(
-                    check.not_none(step_output_snap.node_handle),
-                    step_output_snap.name,
-                    step_output_snap.dagster_type_key,
-                    check.not_none(step_output_snap.properties),
-                )
-                for step_output_snap in output_snaps
-            ]
-
-            if step_snap.kind == StepKind.COMPUTE:
-                step: IExecutionStep = ExecutionStep(
-                    check.inst(
-                        cast(
-                            Union[StepHandle, ResolvedFromDynamicStepHandle],
-                            step_snap.step_handle,
-                        ),
-                        ttype=(StepHandle, ResolvedFromDynamicStepHandle),
-                    ),
-                    job_name,
-                    step_inputs,  # type: ignore  # (plain StepInput only)
-                    step_outputs,
-                    step_snap.tags,
-                )
-            elif step_snap.kind == StepKind.UNRESOLVED_MAPPED:
-                step = UnresolvedMappedExecutionStep(
-                    check.inst(
-                        cast(UnresolvedStepHandle, step_snap.step_handle),
-                        ttype=UnresolvedStepHandle,
-                    ),
-                    job_name,
-                    step_inputs,  # type: ignore  # (StepInput or UnresolvedMappedStepInput only)
-                    step_outputs,
-                    step_snap.tags,
-                )
-            elif step_snap.kind == StepKind.UNRESOLVED_COLLECT:
-                step = UnresolvedCollectExecutionStep(
-                    check.inst(cast(StepHandle, step_snap.step_handle), ttype=StepHandle),
-                    job_name,
-                    step_inputs,  # type: ignore  # (StepInput or UnresolvedCollectStepInput only)
-                    step_outputs,
-                    step_snap.tags,
-                )
-            else:
-                raise Exception(f"Unexpected step kind {step_snap.kind}")
-
+            step = _rebuild_step_from_snapshot(job_name, step_snap)
             step_dict[step.handle] = step
             step_dict_by_key[step.key] = step
 
@@ -1185,6 +1172,217 @@ def rebuild_from_snapshot(
             repository_load_data=execution_plan_snapshot.repository_load_data,
         )
 
+    @staticmethod
+    def rebuild_subset_from_snapshot(
+        job_name: str,
+        execution_plan_snapshot: "ExecutionPlanSnapshot",
+        step_keys_to_execute: Sequence[str],
+        known_state: Optional[KnownExecutionState] = None,
+    ) -> "ExecutionPlan":
+        """Rebuild an ExecutionPlan that executes only the given step keys from a persisted
+        ExecutionPlanSnapshot, without walking the job definition.
+
+        Only the steps being executed are rebuilt up front. Any other step (e.g. an upstream step
+        whose output metadata is needed to load an input) is rebuilt from its snapshot the first
+        time it is looked up. This keeps step worker startup roughly constant in the size of the
+        job, at the cost of ``ExecutionPlan.steps`` only reflecting the steps loaded so far.
+        """
+        if not execution_plan_snapshot.can_reconstruct_plan:
+            raise DagsterInvariantViolationError(
+                "Tried to reconstruct an old ExecutionPlanSnapshot that was created before"
+                " snapshots had enough information to fully reconstruct the ExecutionPlan"
+            )
+        check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        known_state = check.opt_inst_param(
+            known_state,
+            "known_state",
+            KnownExecutionState,
+            # default to empty known execution state if initial was not persisted
+            default=execution_plan_snapshot.initial_known_state or KnownExecutionState(),
+        )
+
+        loader = _SnapshotStepLoader(job_name, execution_plan_snapshot, known_state)
+        step_handles_to_execute = [StepHandle.parse_from_key(key) for key in step_keys_to_execute]
+
+        executable_map, resolvable_map = _compute_step_maps(
+            loader.step_dict,
+            loader.step_dict_by_key,
+            step_handles_to_execute,
+            known_state,
+        )
+
+        return ExecutionPlan(
+            loader.step_dict,
+            executable_map,
+            resolvable_map,
+            step_handles_to_execute,
+            known_state,
+            execution_plan_snapshot.artifacts_persisted,
+            step_dict_by_key=loader.step_dict_by_key,
+            executor_name=execution_plan_snapshot.executor_name,
+            repository_load_data=execution_plan_snapshot.repository_load_data,
+        )
+
+
+class _LazyStepDict(dict):
+    """A dict of execution steps that asks a _SnapshotStepLoader for any step it does not yet
+    contain.
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[Any], Optional[IExecutionStep]],
+        snapshot_keys: AbstractSet[Any] = frozenset(),
+    ):
+        super().__init__()
+        self._load_fn = load_fn
+        self._snapshot_keys = snapshot_keys
+
+    def __missing__(self, key: Any) -> IExecutionStep:
+        step = self._load_fn(key)
+        if step is None:
+            raise KeyError(key)
+        return step
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or self._load_fn(key) is not None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def get_all_keys(self) -> AbstractSet[Any]:
+        # steps resolved from a dynamic output are only in the dict once loaded
+        return self._snapshot_keys | set(self.keys())
+
+
+class _SnapshotStepLoader:
+    """Rebuilds execution steps from an ExecutionPlanSnapshot on demand, keeping a step dict keyed
+    by handle and one keyed by step key in sync.
+
+    Steps resolved from a dynamic output (e.g. ``op[mapping_key]``) are not in the snapshot; they
+    are built by resolving the unresolved snapshot step (``op[?]``) for just that mapping key, using
+    the dynamic mappings in the known state.
+    """
+
+    def __init__(
+        self,
+        job_name: str,
+        execution_plan_snapshot: "ExecutionPlanSnapshot",
+        known_state: KnownExecutionState,
+    ):
+        self._job_name = job_name
+        self._step_snaps_by_key = {
+            step_snap.key: step_snap for step_snap in execution_plan_snapshot.steps
+        }
+        self._dynamic_mappings = known_state.dynamic_mappings
+        self.step_dict: Dict[StepHandleUnion, IExecutionStep] = _LazyStepDict(self._load_by_handle)
+        self.step_dict_by_key: Dict[str, IExecutionStep] = _LazyStepDict(
+            self._load_by_key, frozenset(self._step_snaps_by_key)
+        )
+
+    def _load_by_handle(self, handle: object) -> Optional[IExecutionStep]:
+        if not isinstance(handle, StepHandleTypes):
+            return None
+        step = self._load_by_key(handle.to_key())
+        return step if step is not None and step.handle == handle else None
+
+    def _load_by_key(self, key: object) -> Optional[IExecutionStep]:
+        if not isinstance(key, str):
+            return None
+
+        if dict.__contains__(self.step_dict_by_key, key):
+            return dict.__getitem__(self.step_dict_by_key, key)
+
+        if key in self._step_snaps_by_key:
+            step = _rebuild_step_from_snapshot(self._job_name, self._step_snaps_by_key[key])
+        else:
+            step = self._resolve_from_snapshot(key)
+            if step is None:
+                return None
+
+        dict.__setitem__(self.step_dict, step.handle, step)
+        dict.__setitem__(self.step_dict_by_key, step.key, step)
+        return step
+
+    def _resolve_from_snapshot(self, key: str) -> Optional[ExecutionStep]:
+        handle = StepHandle.parse_from_key(key)
+        if not isinstance(handle, ResolvedFromDynamicStepHandle):
+            return None
+
+        unresolved_step = self._load_by_key(handle.unresolved_form.to_key())
+        if not isinstance(unresolved_step, UnresolvedMappedExecutionStep):
+            return None
+
+        mappings = self._dynamic_mappings.get(unresolved_step.resolved_by_step_key, {})
+        mapping_keys = mappings.get(unresolved_step.resolved_by_output_name)
+        if not mapping_keys or handle.mapping_key not in mapping_keys:
+            return None
+
+        # resolve for only the requested mapping key instead of the full fan-out
+        [step] = unresolved_step.resolve(
+            {
+                unresolved_step.resolved_by_step_key: {
+                    unresolved_step.resolved_by_output_name: [handle.mapping_key]
+                }
+            }
+        )
+        return step
+
+
+def _rebuild_step_from_snapshot(job_name: str, step_snap: "ExecutionStepSnap") -> IExecutionStep:
+    input_snaps = step_snap.inputs
+    output_snaps = step_snap.outputs
+
+    step_inputs = [
+        ExecutionPlan.rebuild_step_input(step_input_snap) for step_input_snap in input_snaps
+    ]
+
+    step_outputs = [
+        StepOutput(
+            check.not_none(step_output_snap.node_handle),
+            step_output_snap.name,
+            step_output_snap.dagster_type_key,
+            check.not_none(step_output_snap.properties),
+        )
+        for step_output_snap in output_snaps
+    ]
+
+    if step_snap.kind == StepKind.COMPUTE:
+        return ExecutionStep(
+            check.inst(
+                cast(
+                    Union[StepHandle, ResolvedFromDynamicStepHandle],
+                    step_snap.step_handle,
+                ),
+                ttype=(StepHandle, ResolvedFromDynamicStepHandle),
+            ),
+            job_name,
+            step_inputs,  # type: ignore  # (plain StepInput only)
+            step_outputs,
+            step_snap.tags,
+        )
+    elif step_snap.kind == StepKind.UNRESOLVED_MAPPED:
+        return UnresolvedMappedExecutionStep(
+            check.inst(
+                cast(UnresolvedStepHandle, step_snap.step_handle),
+                ttype=UnresolvedStepHandle,
+            ),
+            job_name,
+            step_inputs,  # type: ignore  # (StepInput or UnresolvedMappedStepInput only)
+            step_outputs,
+            step_snap.tags,
+        )
+    elif step_snap.kind == StepKind.UNRESOLVED_COLLECT:
+        return UnresolvedCollectExecutionStep(
+            check.inst(cast(StepHandle, step_snap.step_handle), ttype=StepHandle),
+            job_name,
+            step_inputs,  # type: ignore  # (StepInput or UnresolvedCollectStepInput only)
+            step_outputs,
+            step_snap.tags,
+        )
+    else:
+        raise Exception(f"Unexpected step kind {step_snap.kind}")
+
 
 def _update_from_resolved_dynamic_outputs(
     step_dict: Dict[StepHandleUnion, IExecutionStep],
@@ -1193,9 +1391,13 @@ def _update_from_resolved_dynamic_outputs(
     resolvable_map: Dict[FrozenSet[str], Sequence[Union[StepHandle, UnresolvedStepHandle]]],
     step_handles_to_execute: Sequence[StepHandleUnion],
     dynamic_mappings: Mapping[str, Mapping[str, Optional[Sequence[str]]]],
-) -> None:
+) -> Sequence[ExecutionStep]:
+    """Resolves the unresolved steps whose dynamic outputs have all completed, updating the plan
+    structures in place, and returns the resolved steps.
+    """
     resolved_steps: List[ExecutionStep] = []
     key_sets_to_clear: List[FrozenSet[str]] = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1206,7 +1408,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1225,6 +1427,68 @@ def _update_from_resolved_dynamic_outputs(
     for key_set in key_sets_to_clear:
         del resolvable_map[key_set]
 
+    return resolved_steps
+
+
+def _blocked_step_key_checker(
+    step_dict: Mapping[StepHandleUnion, IExecutionStep],
+    executable_map: Mapping[str, Union[StepHandle, ResolvedFromDynamicStepHandle]],
+    step_keys_to_execute: AbstractSet[str],
+) -> Callable[[str], bool]:
+    """Returns a function that checks whether an executable step depends, directly or through
+    other executable steps, on a step to execute that has not been resolved yet.
+    """
+    blocked: Dict[str, bool] = {}
+
+    def _is_blocked(step_key: str) -> bool:
+        if step_key not in blocked:
+            step = cast(ExecutionStep, step_dict[executable_map[step_key]])
+            blocked[step_key] = any(
+                _is_blocked(dep) if dep in executable_map else dep in step_keys_to_execute
+                for dep in step.get_execution_dependency_keys()
+            )
+        return blocked[step_key]
+
+    return _is_blocked
+
+
+def _get_blocked_step_keys(
+    step_dict: Mapping[StepHandleUnion, IExecutionStep],
+    executable_map: Mapping[str, Union[StepHandle, ResolvedFromDynamicStepHandle]],
+    resolvable_map: Mapping[FrozenSet[str], Sequence[Union[StepHandle, UnresolvedStepHandle]]],
+    step_handles_to_execute: Sequence[StepHandleUnion],
+    step_keys_to_execute: AbstractSet[str],
+    dynamic_mappings: Mapping[str, Mapping[str, Optional[Sequence[str]]]],
+) -> List[str]:
+    """Returns the keys of the executable steps that are blocked on an unresolved step. Only steps
+    downstream of an unresolved collect step can be blocked, so only the steps to execute and the
+    steps already resolved from them are checked.
+    """
+    is_blocked = _blocked_step_key_checker(step_dict, executable_map, step_keys_to_execute)
+    unresolved_handles = {handle for handles in resolvable_map.values() for handle in handles}
+
+    blocked_keys = []
+    for handle in step_handles_to_execute:
+        if isinstance(handle, UnresolvedStepHandle):
+            if handle in unresolved_handles:
+                continue
+            step = cast(UnresolvedMappedExecutionStep, step_dict[handle])
+            mapping_keys = (
+                dynamic_mappings.get(step.resolved_by_step_key, {}).get(
+                    step.resolved_by_output_name
+                )
+                or []
+            )
+            resolved_keys = [handle.resolve(mapping_key).to_key() for mapping_key in mapping_keys]
+            # the steps resolved from the same step have the same upstream steps, save for the
+            # mapping key, so checking one of them is enough
+            if resolved_keys and is_blocked(resolved_keys[0]):
+                blocked_keys.extend(resolved_keys)
+        elif handle.to_key() in executable_map and is_blocked(handle.to_key()):
+            blocked_keys.append(handle.to_key())
+
+    return blocked_keys
+
 
 def can_isolate_steps(job_def: JobDefinition) -> bool:
     """Returns true if every output definition in the pipeline uses an IO manager that's not
@@ -1385,7 +1649,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
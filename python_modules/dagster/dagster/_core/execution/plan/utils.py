@@ -1,6 +1,7 @@
+import asyncio
 import sys
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Type
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, Type, TypeVar
 
 import dagster._check as check
 from dagster._core.definitions.events import Failure, RetryRequested
@@ -15,6 +16,8 @@
     from dagster._core.definitions.resource_definition import Resources
     from dagster._core.execution.context.system import StepExecutionContext
 
+T = TypeVar("T")
+
 
 def build_resources_for_manager(
     io_manager_key: str, step_context: "StepExecutionContext"
@@ -25,6 +28,20 @@ def build_resources_for_manager(
     return step_context.scoped_resources_builder.build(required_resource_keys)
 
 
+def await_user_coroutine(step_context: "StepExecutionContext", awaitable: Awaitable[T]) -> T:
+    """Wait for a coroutine returned by user code, such as an async IO manager method, on the
+    run's event loop.
+    """
+    if step_context.event_loop:
+        return step_context.event_loop.run(awaitable)
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
 class RetryRequestedFromPolicy(RetryRequested):
     """Subclass to indicate origin of retry request is policy."""
 
@@ -79,6 +79,11 @@ def resolve_step_versions(
         Dict[str, Optional[str]]: A dictionary that maps the key of an execution step to a version.
             If a step has no computed version, then the step key maps to None.
     """
+    # memoized runs build the full plan, since versions depend on every upstream step
+    check.invariant(
+        not execution_plan.loads_steps_lazily,
+        "Can not resolve step versions for an execution plan rebuilt from a snapshot",
+    )
     resource_versions = {}
     resource_defs = pipeline_def.resource_defs
 
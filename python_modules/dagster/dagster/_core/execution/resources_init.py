@@ -4,7 +4,9 @@
 from typing import (
     AbstractSet,
     Any,
+    AsyncGenerator,
     Callable,
+    Coroutine,
     Deque,
     Dict,
     Generator,
@@ -29,6 +31,7 @@
     user_code_error_boundary,
 )
 from dagster._core.events import DagsterEvent
+from dagster._core.execution.event_loop import RunEventLoop, get_run_event_loop
 from dagster._core.execution.plan.inputs import (
     StepInput,
     UnresolvedCollectStepInput,
@@ -324,11 +327,16 @@ def single_resource_event_generator(
 
                     # Flag for whether resource is generator. This is used to ensure that teardown
                     # occurs when resources are initialized out of execution.
-                    is_gen = inspect.isgenerator(resource_or_gen) or isinstance(
-                        resource_or_gen, ContextDecorator
+                    is_gen = (
+                        inspect.isgenerator(resource_or_gen)
+                        or inspect.isasyncgen(resource_or_gen)
+                        or isinstance(resource_or_gen, ContextDecorator)
                     )
 
-                    resource_iter = _wrapped_resource_iterator(resource_or_gen)
+                    if inspect.iscoroutine(resource_or_gen) or inspect.isasyncgen(resource_or_gen):
+                        resource_iter = _async_resource_iterator(resource_or_gen, context.run_id)
+                    else:
+                        resource_iter = _wrapped_resource_iterator(resource_or_gen)
                     resource = next(resource_iter)
                 resource = InitializedResource(
                     resource, format_duration(timer_result.millis), is_gen
@@ -356,10 +364,11 @@ def get_required_resource_keys_to_init(
 ) -> AbstractSet[str]:
     resource_keys: Set[str] = set()
 
-    for step_handle, step in execution_plan.step_dict.items():
-        if step_handle not in execution_plan.step_handles_to_execute:
+    for step_handle in execution_plan.step_handles_to_execute:
+        if not execution_plan.has_step(step_handle):
             continue
 
+        step = execution_plan.get_step(step_handle)
         hook_defs = job_def.get_all_hooks_for_handle(step.node_handle)
         for hook_def in hook_defs:
             resource_keys = resource_keys.union(hook_def.required_resource_keys)
@@ -433,6 +442,33 @@ def get_required_resource_keys_for_step(
     return frozenset(resource_keys)
 
 
+def _async_resource_iterator(
+    resource_or_gen: Union[Coroutine[Any, Any, Any], AsyncGenerator[Any, None]],
+    run_id: Optional[str],
+) -> Generator[Any, None, None]:
+    """Returns an iterator which yields a single item, which is the resource, for a resource
+    function defined with ``async def``.
+
+    The coroutine or async generator is driven on the run's event loop, so that any loop-bound
+    state the resource holds can be used by async ops and IO managers in the same run. When
+    resources are initialized outside of a run, a loop is created for the resource and closed
+    after teardown.
+    """
+    event_loop = get_run_event_loop(run_id)
+    owned_event_loop = None
+    if event_loop is None:
+        event_loop = owned_event_loop = RunEventLoop()
+
+    try:
+        if inspect.isasyncgen(resource_or_gen):
+            yield from event_loop.iterate(resource_or_gen)
+        else:
+            yield event_loop.run(resource_or_gen)
+    finally:
+        if owned_event_loop:
+            owned_event_loop.close()
+
+
 def _wrapped_resource_iterator(
     resource_or_gen: Union[Any, Generator[Any, None, None]]
 ) -> Generator[Any, None, None]:
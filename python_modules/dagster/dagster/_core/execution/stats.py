@@ -1,6 +1,17 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -10,6 +21,22 @@
 from dagster._serdes import whitelist_for_serdes
 from dagster._utils import datetime_as_float
 
+if TYPE_CHECKING:
+    from dagster._core.event_api import EventLogRecordView
+
+# the event types the step stats of a run are built from
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    *MARKER_EVENTS,
+]
+
 
 def build_run_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
@@ -23,6 +50,42 @@ def build_run_stats_from_events(
     for i, record in enumerate(records):
         check.inst_param(record, f"records[{i}]", EventLogEntry)
 
+    return _build_run_stats(
+        run_id,
+        (
+            (
+                event.get_dagster_event().event_type,
+                (
+                    event.timestamp
+                    if isinstance(event.timestamp, float)
+                    else datetime_as_float(event.timestamp)
+                ),
+            )
+            for event in records
+            if event.is_dagster_event
+        ),
+    )
+
+
+def build_run_stats_from_record_views(
+    run_id: str, record_views: Iterable["EventLogRecordView"]
+) -> DagsterRunStatsSnapshot:
+    """Builds the run stats from views of the run's event log records, without deserializing the
+    events.
+    """
+    return _build_run_stats(
+        run_id,
+        (
+            (view.dagster_event_type, view.timestamp)
+            for view in record_views
+            if view.dagster_event_type is not None
+        ),
+    )
+
+
+def _build_run_stats(
+    run_id: str, events: Iterable[Tuple[DagsterEventType, float]]
+) -> DagsterRunStatsSnapshot:
     steps_succeeded = 0
     steps_failed = 0
     materializations = 0
@@ -32,40 +95,27 @@ def build_run_stats_from_events(
     start_time = None
     end_time = None
 
-    for event in records:
-        if not event.is_dagster_event:
-            continue
-        dagster_event = event.get_dagster_event()
-
-        event_timestamp_float = (
-            event.timestamp
-            if isinstance(event.timestamp, float)
-            else datetime_as_float(event.timestamp)
-        )
-        if dagster_event.event_type == DagsterEventType.PIPELINE_START:
+    for event_type, event_timestamp_float in events:
+        if event_type == DagsterEventType.PIPELINE_START:
             start_time = event_timestamp_float
-        if dagster_event.event_type == DagsterEventType.PIPELINE_STARTING:
+        if event_type == DagsterEventType.PIPELINE_STARTING:
             launch_time = event_timestamp_float
-        if dagster_event.event_type == DagsterEventType.PIPELINE_ENQUEUED:
+        if event_type == DagsterEventType.PIPELINE_ENQUEUED:
             enqueued_time = event_timestamp_float
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
+        if event_type == DagsterEventType.STEP_FAILURE:
             steps_failed += 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
+        if event_type == DagsterEventType.STEP_SUCCESS:
             steps_succeeded += 1
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        if event_type == DagsterEventType.ASSET_MATERIALIZATION:
             materializations += 1
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
             expectations += 1
         if (
-            dagster_event.event_type == DagsterEventType.PIPELINE_SUCCESS
-            or dagster_event.event_type == DagsterEventType.PIPELINE_FAILURE
-            or dagster_event.event_type == DagsterEventType.PIPELINE_CANCELED
+            event_type == DagsterEventType.PIPELINE_SUCCESS
+            or event_type == DagsterEventType.PIPELINE_FAILURE
+            or event_type == DagsterEventType.PIPELINE_CANCELED
         ):
-            end_time = (
-                event.timestamp
-                if isinstance(event.timestamp, float)
-                else datetime_as_float(event.timestamp)
-            )
+            end_time = event_timestamp_float
 
     return DagsterRunStatsSnapshot(
         run_id,
@@ -80,6 +130,7 @@ def build_run_stats_from_events(
     )
 
 
+@whitelist_for_serdes
 class StepEventStatus(Enum):
     SKIPPED = "SKIPPED"
     SUCCESS = "SUCCESS"
@@ -90,10 +141,11 @@ class StepEventStatus(Enum):
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    rollups: Dict[str, RunStepStatsRollup] = {}
+    # steps are reported in the order in which their first stats-bearing event was seen
+    step_keys: List[str] = []
+    materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+    expectation_results: Dict[str, List[ExpectationResult]] = defaultdict(list)
     for event in records:
         if not event.is_dagster_event:
             continue
@@ -103,84 +155,24 @@ def build_run_step_stats_from_events(
         if not step_key:
             continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+        rollup = rollups.get(step_key) or RunStepStatsRollup(run_id, step_key)
+        updated = rollup.with_event(event)
+        if updated.has_stats and not rollup.has_stats:
+            step_keys.append(step_key)
+        rollups[step_key] = updated
+
         if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
+            materialization_events[step_key].append(event)
         if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
             expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
-            )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
+            expectation_results[step_key].append(expectation_data.expectation_result)
 
     return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
+        rollups[step_key].to_snapshot(
+            materialization_events=materialization_events[step_key],
+            expectation_results=expectation_results[step_key],
         )
-        for step_key, value in by_step_key.items()
+        for step_key in step_keys
     ]
 
 
@@ -253,3 +245,141 @@ def __new__(
             attempts_list=check.opt_sequence_param(attempts_list, "attempts_list", RunStepMarker),
             markers=check.opt_sequence_param(markers, "markers", RunStepMarker),
         )
+
+
+@whitelist_for_serdes
+class RunStepStatsRollup(
+    NamedTuple(
+        "_RunStepStatsRollup",
+        [
+            ("run_id", str),
+            ("step_key", str),
+            ("has_stats", bool),
+            ("status", Optional[StepEventStatus]),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+            ("attempts", Optional[int]),
+            ("attempts_list", Sequence[RunStepMarker]),
+            ("attempt_start_time", Optional[float]),
+            ("markers", Mapping[str, RunStepMarker]),
+        ],
+    )
+):
+    """The stats for a step accumulated from its events so far, folded one event at a time.
+
+    Materialization events and expectation results are not accumulated, so that the rollup stays
+    small enough to be rewritten on every event; they are supplied when building the snapshot.
+    """
+
+    def __new__(
+        cls,
+        run_id: str,
+        step_key: str,
+        has_stats: bool = False,
+        status: Optional[StepEventStatus] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        attempts: Optional[int] = None,
+        attempts_list: Optional[Sequence[RunStepMarker]] = None,
+        attempt_start_time: Optional[float] = None,
+        markers: Optional[Mapping[str, RunStepMarker]] = None,
+    ):
+        return super(RunStepStatsRollup, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, "run_id"),
+            step_key=check.str_param(step_key, "step_key"),
+            has_stats=check.bool_param(has_stats, "has_stats"),
+            status=check.opt_inst_param(status, "status", StepEventStatus),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+            attempts=check.opt_int_param(attempts, "attempts"),
+            attempts_list=check.opt_sequence_param(attempts_list, "attempts_list", RunStepMarker),
+            attempt_start_time=check.opt_float_param(attempt_start_time, "attempt_start_time"),
+            markers=check.opt_mapping_param(
+                markers, "markers", key_type=str, value_type=RunStepMarker
+            ),
+        )
+
+    def with_event(self, event: EventLogEntry) -> "RunStepStatsRollup":
+        """Returns the rollup updated with the given event, which must be for this step. Events
+        must be applied in the order they were stored.
+        """
+        dagster_event = event.get_dagster_event()
+        event_type = dagster_event.event_type
+        timestamp = event.timestamp
+
+        if event_type == DagsterEventType.STEP_START:
+            return self._replace(has_stats=True, start_time=timestamp, attempts=1)
+        if event_type == DagsterEventType.STEP_RESTARTED:
+            return self._replace(
+                has_stats=True, attempts=(self.attempts or 0) + 1, attempt_start_time=timestamp
+            )
+        if event_type in _STEP_END_EVENT_STATUS:
+            return self._replace(
+                has_stats=True, end_time=timestamp, status=_STEP_END_EVENT_STATUS[event_type]
+            )
+        if event_type in (
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.STEP_EXPECTATION_RESULT,
+        ):
+            return self if self.has_stats else self._replace(has_stats=True)
+        if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            return self._replace(
+                attempts_list=[
+                    *self.attempts_list,
+                    RunStepMarker(start_time=self._current_attempt_start, end_time=timestamp),
+                ]
+            )
+        if event_type in MARKER_EVENTS:
+            markers = dict(self.markers)
+            marker_start = dagster_event.engine_event_data.marker_start
+            marker_end = dagster_event.engine_event_data.marker_end
+            if marker_start:
+                markers[marker_start] = markers.get(marker_start, RunStepMarker())._replace(
+                    start_time=timestamp
+                )
+            if marker_end:
+                markers[marker_end] = markers.get(marker_end, RunStepMarker())._replace(
+                    end_time=timestamp
+                )
+            return self._replace(markers=markers) if markers != self.markers else self
+
+        return self
+
+    @property
+    def _current_attempt_start(self) -> Optional[float]:
+        return self.attempt_start_time if self.attempt_start_time is not None else self.start_time
+
+    def to_snapshot(
+        self,
+        materialization_events: Optional[Sequence[EventLogEntry]] = None,
+        expectation_results: Optional[Sequence[ExpectationResult]] = None,
+    ) -> RunStepKeyStatsSnapshot:
+        attempts_list = list(self.attempts_list)
+        if self.end_time:
+            attempts_list.append(
+                RunStepMarker(start_time=self._current_attempt_start, end_time=self.end_time)
+            )
+            status = self.status
+        else:
+            status = StepEventStatus.IN_PROGRESS
+
+        return RunStepKeyStatsSnapshot(
+            run_id=self.run_id,
+            step_key=self.step_key,
+            status=status,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            materialization_events=materialization_events,
+            expectation_results=expectation_results,
+            attempts=self.attempts,
+            attempts_list=attempts_list,
+            markers=list(self.markers.values()),
+        )
+
+
+_STEP_END_EVENT_STATUS = {
+    DagsterEventType.STEP_SUCCESS: StepEventStatus.SUCCESS,
+    DagsterEventType.STEP_FAILURE: StepEventStatus.FAILURE,
+    DagsterEventType.STEP_SKIPPED: StepEventStatus.SKIPPED,
+}
@@ -1,12 +1,16 @@
 import os
-from typing import Iterator, Optional
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.api import ExecuteRunWithPlanIterable
 from dagster._core.execution.context.system import PlanExecutionContext, PlanOrchestrationContext
 from dagster._core.execution.context_creation_job import PlanExecutionContextManager
-from dagster._core.execution.plan.execute_plan import inner_plan_execution_iterator
+from dagster._core.execution.plan.execute_plan import (
+    concurrent_plan_execution_iterator,
+    inner_plan_execution_iterator,
+)
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
@@ -19,19 +23,45 @@ def inprocess_execution_iterator(
     job_context: PlanExecutionContext,
     execution_plan: ExecutionPlan,
     instance_concurrency_context: Optional[InstanceConcurrencyContext] = None,
+    max_concurrent: Optional[int] = None,
+    tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
 ) -> Iterator[DagsterEvent]:
     with InstanceConcurrencyContext(
         job_context.instance, job_context.run_id
     ) as instance_concurrency_context:
-        yield from inner_plan_execution_iterator(
-            job_context, execution_plan, instance_concurrency_context
-        )
+        if max_concurrent is not None and max_concurrent > 1:
+            yield from concurrent_plan_execution_iterator(
+                job_context,
+                execution_plan,
+                max_concurrent,
+                tag_concurrency_limits,
+                instance_concurrency_context,
+            )
+        else:
+            yield from inner_plan_execution_iterator(
+                job_context, execution_plan, instance_concurrency_context
+            )
 
 
 class InProcessExecutor(Executor):
-    def __init__(self, retries: RetryMode, marker_to_close: Optional[str] = None):
+    def __init__(
+        self,
+        retries: RetryMode,
+        marker_to_close: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+        tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
+    ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         self.marker_to_close = check.opt_str_param(marker_to_close, "marker_to_close")
+        self._max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
+        check.param_invariant(
+            self._max_concurrent is None or self._max_concurrent >= 0,
+            "max_concurrent",
+            "max_concurrent must be >= 0",
+        )
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -55,7 +85,11 @@ def execute(
             yield from iter(
                 ExecuteRunWithPlanIterable(
                     execution_plan=plan_context.execution_plan,
-                    iterator=inprocess_execution_iterator,
+                    iterator=partial(
+                        inprocess_execution_iterator,
+                        max_concurrent=self._max_concurrent,
+                        tag_concurrency_limits=self._tag_concurrency_limits,
+                    ),
                     execution_context_manager=PlanExecutionContextManager(
                         job=plan_context.job,
                         retry_mode=plan_context.retry_mode,
@@ -238,7 +238,7 @@ def execute(
                             errors,
                             term_events,
                             self.retries,
-                            active_execution.get_known_state(),
+                            active_execution.get_known_state_for_steps([step]),
                             execution_plan.repository_load_data,
                         )
 
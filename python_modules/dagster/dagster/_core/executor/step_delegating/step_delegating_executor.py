@@ -1,6 +1,7 @@
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
 
 import pendulum
@@ -45,6 +46,7 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        max_concurrent_launches: Optional[int] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -68,6 +70,13 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._max_concurrent_launches = check.opt_int_param(
+            max_concurrent_launches, "max_concurrent_launches"
+        )
+        if self._max_concurrent_launches is not None:
+            check.invariant(
+                self._max_concurrent_launches > 0, "max_concurrent_launches must be > 0"
+            )
         self._event_cursor: Optional[str] = None
 
     @property
@@ -101,13 +110,41 @@ def _get_step_handler_context(
                 step_keys_to_execute=[step.key for step in steps],
                 instance_ref=plan_context.plan_data.instance.get_ref(),
                 retry_mode=self.retries.for_inner_plan(),
-                known_state=active_execution.get_known_state(),
+                known_state=active_execution.get_known_state_for_steps(steps),
                 should_verify_step=self._should_verify_step,
                 print_serialized_events=False,
             ),
             dagster_run=plan_context.dagster_run,
         )
 
+    def _launch_steps(
+        self,
+        plan_context: PlanOrchestrationContext,
+        steps: Sequence["ExecutionStep"],
+        active_execution: ActiveExecution,
+    ) -> None:
+        step_handler_contexts = [
+            self._get_step_handler_context(plan_context, [step], active_execution) for step in steps
+        ]
+
+        num_workers = min(self._max_concurrent_launches or 1, len(step_handler_contexts))
+        if num_workers <= 1:
+            list(self._step_handler.launch_steps(step_handler_contexts))
+            return
+
+        # launch each step on its own so that slow launches (e.g. API calls to create a pod or
+        # container) only hold up a worker, with at most max_concurrent_launches in flight
+        with ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="step_delegating_launch"
+        ) as pool:
+            for _ in pool.map(
+                lambda step_handler_context: list(
+                    self._step_handler.launch_steps([step_handler_context])
+                ),
+                step_handler_contexts,
+            ):
+                pass
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
@@ -314,14 +351,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     # process events from concurrency blocked steps
                     list(active_execution.concurrency_event_iterator(plan_context))
 
-                    for step in active_execution.get_steps_to_execute(max_steps_to_run):
+                    steps_to_execute = active_execution.get_steps_to_execute(max_steps_to_run)
+                    for step in steps_to_execute:
                         running_steps[step.key] = step
-                        list(
-                            self._step_handler.launch_step(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
-                            )
-                        )
+                    if steps_to_execute:
+                        self._launch_steps(plan_context, steps_to_execute, active_execution)
 
                     time.sleep(self._sleep_seconds)
@@ -86,6 +86,15 @@ def name(self) -> str:
     def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
 
+    def launch_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Iterator[DagsterEvent]:
+        """Launch a batch of steps, one StepHandlerContext per step. Step handlers that can submit
+        many steps in one request may override this; by default each step is launched in turn.
+        """
+        for step_handler_context in step_handler_contexts:
+            yield from self.launch_step(step_handler_context)
+
     @abstractmethod
     def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
         pass
@@ -17,6 +17,7 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -57,6 +58,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummary,
     TagBucket,
 )
 from dagster._core.storage.tags import (
@@ -151,8 +153,10 @@
         AssetRecord,
         EventLogConnection,
         EventLogRecord,
+        EventLogRecordView,
         EventRecordsFilter,
     )
+    from dagster._core.storage.event_log.retention import EventLogRetentionSettings
     from dagster._core.storage.partition_status_cache import (
         AssetPartitionStatus,
         AssetStatusCacheValue,
@@ -1165,6 +1169,7 @@ def _construct_run_with_snapshots(
         op_selection: Optional[Sequence[str]] = None,
         external_job_origin: Optional["ExternalJobOrigin"] = None,
         job_code_origin: Optional[JobPythonOrigin] = None,
+        persisted_snapshot_ids: Optional[Set[str]] = None,
     ) -> DagsterRun:
         # https://github.com/dagster-io/dagster/issues/2403
         if tags and IS_AIRFLOW_INGEST_PIPELINE_STR in tags:
@@ -1182,14 +1187,19 @@ def _construct_run_with_snapshots(
         )
 
         job_snapshot_id = (
-            self._ensure_persisted_job_snapshot(job_snapshot, parent_job_snapshot)
+            self._ensure_persisted_job_snapshot(
+                job_snapshot, parent_job_snapshot, persisted_snapshot_ids
+            )
             if job_snapshot
             else None
         )
 
         execution_plan_snapshot_id = (
             self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, job_snapshot_id, step_keys_to_execute
+                execution_plan_snapshot,
+                job_snapshot_id,
+                step_keys_to_execute,
+                persisted_snapshot_ids,
             )
             if execution_plan_snapshot and job_snapshot_id
             else None
@@ -1220,15 +1230,20 @@ def _ensure_persisted_job_snapshot(
         self,
         job_snapshot: "JobSnapshot",
         parent_job_snapshot: "Optional[JobSnapshot]",
+        persisted_snapshot_ids: Optional[Set[str]] = None,
     ) -> str:
         from dagster._core.snap import JobSnapshot, create_job_snapshot_id
 
         check.inst_param(job_snapshot, "job_snapshot", JobSnapshot)
         check.opt_inst_param(parent_job_snapshot, "parent_job_snapshot", JobSnapshot)
 
+        # snapshot ids already known to be persisted, shared across the runs of a batch
+        persisted_snapshot_ids = set() if persisted_snapshot_ids is None else persisted_snapshot_ids
+
         if job_snapshot.lineage_snapshot:
-            if not self._run_storage.has_job_snapshot(
-                job_snapshot.lineage_snapshot.parent_snapshot_id
+            parent_snapshot_id = job_snapshot.lineage_snapshot.parent_snapshot_id
+            if parent_snapshot_id not in persisted_snapshot_ids and not (
+                self._run_storage.has_job_snapshot(parent_snapshot_id)
             ):
                 check.invariant(
                     create_job_snapshot_id(parent_job_snapshot)  # type: ignore  # (possible none)
@@ -1242,11 +1257,15 @@ def _ensure_persisted_job_snapshot(
                 check.invariant(
                     job_snapshot.lineage_snapshot.parent_snapshot_id == returned_job_snapshot_id
                 )
+            persisted_snapshot_ids.add(parent_snapshot_id)
 
         job_snapshot_id = create_job_snapshot_id(job_snapshot)
-        if not self._run_storage.has_job_snapshot(job_snapshot_id):
+        if job_snapshot_id not in persisted_snapshot_ids and not (
+            self._run_storage.has_job_snapshot(job_snapshot_id)
+        ):
             returned_job_snapshot_id = self._run_storage.add_job_snapshot(job_snapshot)
             check.invariant(job_snapshot_id == returned_job_snapshot_id)
+        persisted_snapshot_ids.add(job_snapshot_id)
 
         return job_snapshot_id
 
@@ -1255,6 +1274,7 @@ def _ensure_persisted_execution_plan_snapshot(
         execution_plan_snapshot: "ExecutionPlanSnapshot",
         job_snapshot_id: str,
         step_keys_to_execute: Optional[Sequence[str]],
+        persisted_snapshot_ids: Optional[Set[str]] = None,
     ) -> str:
         from dagster._core.snap.execution_plan_snapshot import (
             ExecutionPlanSnapshot,
@@ -1272,14 +1292,19 @@ def _ensure_persisted_execution_plan_snapshot(
             f'"{job_snapshot_id}"',
         )
 
+        persisted_snapshot_ids = set() if persisted_snapshot_ids is None else persisted_snapshot_ids
+
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-        if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
+        if execution_plan_snapshot_id not in persisted_snapshot_ids and not (
+            self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id)
+        ):
             returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
                 execution_plan_snapshot
             )
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
+        persisted_snapshot_ids.add(execution_plan_snapshot_id)
 
         return execution_plan_snapshot_id
 
@@ -1382,6 +1407,77 @@ def create_run(
         op_selection: Optional[Sequence[str]],
         external_job_origin: Optional["ExternalJobOrigin"],
         job_code_origin: Optional[JobPythonOrigin],
+    ) -> DagsterRun:
+        dagster_run = self._construct_run(
+            job_name=job_name,
+            run_id=run_id,
+            run_config=run_config,
+            status=status,
+            tags=tags,
+            root_run_id=root_run_id,
+            parent_run_id=parent_run_id,
+            step_keys_to_execute=step_keys_to_execute,
+            execution_plan_snapshot=execution_plan_snapshot,
+            job_snapshot=job_snapshot,
+            parent_job_snapshot=parent_job_snapshot,
+            asset_selection=asset_selection,
+            asset_check_selection=asset_check_selection,
+            resolved_op_selection=resolved_op_selection,
+            op_selection=op_selection,
+            external_job_origin=external_job_origin,
+            job_code_origin=job_code_origin,
+        )
+
+        dagster_run = self._run_storage.add_run(dagster_run)
+
+        if execution_plan_snapshot:
+            self._log_asset_planned_events(dagster_run, execution_plan_snapshot)
+
+        return dagster_run
+
+    def create_runs(self, runs_to_create: Sequence[Mapping[str, Any]]) -> Sequence[DagsterRun]:
+        """Create a batch of runs, each described by a mapping of the keyword arguments accepted
+        by `create_run`. Job and execution plan snapshots shared between runs are only persisted
+        once, and the runs are added to run storage in a single batch.
+        """
+        check.sequence_param(runs_to_create, "runs_to_create", of_type=Mapping)
+
+        persisted_snapshot_ids: Set[str] = set()
+        dagster_runs = [
+            self._construct_run(**run_args, persisted_snapshot_ids=persisted_snapshot_ids)
+            for run_args in runs_to_create
+        ]
+
+        dagster_runs = self._run_storage.add_runs(dagster_runs)
+
+        for dagster_run, run_args in zip(dagster_runs, runs_to_create):
+            execution_plan_snapshot = run_args.get("execution_plan_snapshot")
+            if execution_plan_snapshot:
+                self._log_asset_planned_events(dagster_run, execution_plan_snapshot)
+
+        return dagster_runs
+
+    def _construct_run(
+        self,
+        *,
+        job_name: str,
+        run_id: Optional[str],
+        run_config: Optional[Mapping[str, object]],
+        status: Optional[DagsterRunStatus],
+        tags: Optional[Mapping[str, Any]],
+        root_run_id: Optional[str],
+        parent_run_id: Optional[str],
+        step_keys_to_execute: Optional[Sequence[str]],
+        execution_plan_snapshot: Optional["ExecutionPlanSnapshot"],
+        job_snapshot: Optional["JobSnapshot"],
+        parent_job_snapshot: Optional["JobSnapshot"],
+        asset_selection: Optional[AbstractSet[AssetKey]],
+        asset_check_selection: Optional[AbstractSet["AssetCheckKey"]],
+        resolved_op_selection: Optional[AbstractSet[str]],
+        op_selection: Optional[Sequence[str]],
+        external_job_origin: Optional["ExternalJobOrigin"],
+        job_code_origin: Optional[JobPythonOrigin],
+        persisted_snapshot_ids: Optional[Set[str]] = None,
     ) -> DagsterRun:
         from dagster._core.definitions.asset_check_spec import AssetCheckKey
         from dagster._core.definitions.utils import validate_tags
@@ -1489,7 +1585,7 @@ def create_run(
         check.opt_inst_param(external_job_origin, "external_job_origin", ExternalJobOrigin)
         check.opt_inst_param(job_code_origin, "job_code_origin", JobPythonOrigin)
 
-        dagster_run = self._construct_run_with_snapshots(
+        return self._construct_run_with_snapshots(
             job_name=job_name,
             run_id=run_id,  # type: ignore  # (possible none)
             run_config=run_config,
@@ -1507,15 +1603,9 @@ def create_run(
             parent_job_snapshot=parent_job_snapshot,
             external_job_origin=external_job_origin,
             job_code_origin=job_code_origin,
+            persisted_snapshot_ids=persisted_snapshot_ids,
         )
 
-        dagster_run = self._run_storage.add_run(dagster_run)
-
-        if execution_plan_snapshot:
-            self._log_asset_planned_events(dagster_run, execution_plan_snapshot)
-
-        return dagster_run
-
     def create_reexecuted_run(
         self,
         *,
@@ -1751,6 +1841,32 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    def get_run_summaries(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunSummary]:
+        """Return a list of run summaries stored in the run storage, sorted by the given column in
+        given order. Unlike run records, run summaries are read from the columns of the run storage
+        without loading each full run, for views that list many runs.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+            cursor (Optional[str]): The run id of the run after which to start returning runs.
+
+        Returns:
+            List[RunSummary]: List of run summaries stored in the run storage.
+        """
+        return self._run_storage.get_run_summaries(filters, limit, order_by, ascending, cursor)
+
     @traced
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
@@ -1806,6 +1922,28 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator["EventLogRecord"]:
+        """Stream the event log records of a run in pages of ``page_size`` records. See
+        ``EventLogStorage.iterate_records_for_run``.
+        """
+        if page_size is None:
+            return self._event_storage.iterate_records_for_run(run_id, of_type)
+        return self._event_storage.iterate_records_for_run(run_id, of_type, page_size)
+
+    @traced
+    def get_record_views_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        step_keys: Optional[Sequence[str]] = None,
+    ) -> Sequence["EventLogRecordView"]:
+        return self._event_storage.get_record_views_for_run(run_id, of_type, step_keys)
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -1906,6 +2044,29 @@ def get_event_records(
         """
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
+    def iterate_event_records(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        ascending: bool = True,
+        page_size: Optional[int] = None,
+    ) -> Iterator["EventLogRecord"]:
+        """Stream the event records matching the filter in pages of ``page_size`` records, so that
+        scanning many records does not load them all into memory. See
+        ``EventLogStorage.iterate_event_records``.
+        """
+        if page_size is None:
+            return self._event_storage.iterate_event_records(event_records_filter, ascending)
+        return self._event_storage.iterate_event_records(event_records_filter, ascending, page_size)
+
+    @traced
+    def get_event_record_views(
+        self,
+        event_records_filter: "EventRecordsFilter",
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence["EventLogRecordView"]:
+        return self._event_storage.get_event_record_views(event_records_filter, limit, ascending)
+
     @public
     @traced
     def get_status_by_partition(
@@ -2346,6 +2507,62 @@ def submit_run(self, run_id: str, workspace: "IWorkspace") -> DagsterRun:
 
         return submitted_run
 
+    def submit_runs(self, run_ids: Sequence[str], workspace: "IWorkspace") -> Sequence[DagsterRun]:
+        """Submit a batch of runs to the coordinator, loading them with a single query.
+
+        This method delegates to ``RunCoordinator.submit_runs()``. If submission fails, the runs in
+        the batch that were not yet submitted are marked as failed.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs.
+        """
+        from dagster._core.events import EngineEventData
+        from dagster._core.host_representation import ExternalJobOrigin
+        from dagster._core.run_coordinator import SubmitRunContext
+
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return []
+
+        runs_by_id = {run.run_id: run for run in self.get_runs(RunsFilter(run_ids=list(run_ids)))}
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in runs_by_id]
+        if missing_run_ids:
+            raise DagsterInvariantViolationError(
+                f"Could not load runs {', '.join(missing_run_ids)} that were passed to submit_runs"
+            )
+
+        runs = [runs_by_id[run_id] for run_id in run_ids]
+        for run in runs:
+            check.inst(
+                run.external_job_origin,
+                ExternalJobOrigin,
+                "External pipeline origin must be set for submitted runs",
+            )
+            check.inst(
+                run.job_code_origin,
+                JobPythonOrigin,
+                "Python origin must be set for submitted runs",
+            )
+
+        try:
+            submitted_runs = self.run_coordinator.submit_runs(
+                [SubmitRunContext(run, workspace=workspace) for run in runs]
+            )
+        except:
+            error = serializable_error_info_from_exc_info(sys.exc_info())
+            for run in self.get_runs(
+                RunsFilter(run_ids=list(run_ids), statuses=[DagsterRunStatus.NOT_STARTED])
+            ):
+                self.report_engine_event(
+                    error.message,
+                    run,
+                    EngineEventData.engine_error(error),
+                )
+                self.report_run_failed(run)
+            raise
+
+        return submitted_runs
+
     # Run launcher
 
     def launch_run(self, run_id: str, workspace: "IWorkspace") -> DagsterRun:
@@ -2684,6 +2901,7 @@ def get_required_daemon_types(self) -> Sequence[str]:
         from dagster._daemon.auto_run_reexecution.event_log_consumer import EventLogConsumerDaemon
         from dagster._daemon.daemon import (
             BackfillDaemon,
+            EventLogRetentionDaemon,
             MonitoringDaemon,
             SchedulerDaemon,
             SensorDaemon,
@@ -2706,6 +2924,8 @@ def get_required_daemon_types(self) -> Sequence[str]:
             daemons.append(EventLogConsumerDaemon.daemon_type())
         if self.auto_materialize_enabled:
             daemons.append(AssetDaemon.daemon_type())
+        if self.event_log_retention_enabled:
+            daemons.append(EventLogRetentionDaemon.daemon_type())
         return daemons
 
     def get_daemon_statuses(
@@ -2770,6 +2990,20 @@ def get_tick_retention_settings(
         default_tick_settings = get_default_tick_retention_settings(instigator_type)
         return get_tick_retention_settings(tick_settings, default_tick_settings)
 
+    @property
+    def event_log_retention_settings(self) -> Optional["EventLogRetentionSettings"]:
+        from dagster._core.storage.event_log.retention import EventLogRetentionSettings
+
+        event_log_settings = self.get_settings("retention").get("event_log")
+        if not event_log_settings:
+            return None
+        return EventLogRetentionSettings.from_config(event_log_settings)
+
+    @property
+    def event_log_retention_enabled(self) -> bool:
+        settings = self.event_log_retention_settings
+        return bool(settings and settings.purge_after_days)
+
     def inject_env_vars(self, location_name: Optional[str]) -> None:
         if not self._secrets_loader:
             return
@@ -7,7 +7,16 @@
     Bool,
     _check as check,
 )
-from dagster._config import Field, Permissive, ScalarUnion, Selector, StringSource, validate_config
+from dagster._config import (
+    Enum,
+    EnumValue,
+    Field,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    StringSource,
+    validate_config,
+)
 from dagster._core.errors import DagsterInvalidConfigError
 from dagster._core.storage.config import mysql_config, pg_config
 from dagster._serdes import class_from_code_pointer
@@ -208,12 +217,57 @@ def _tick_retention_config_schema() -> Field:
     )
 
 
+def _event_log_retention_config_schema() -> Field:
+    return Field(
+        {
+            "purge_after_days": ScalarUnion(
+                scalar_type=int,
+                non_scalar_schema={
+                    "success": Field(int, is_required=False),
+                    "failure": Field(int, is_required=False),
+                    "canceled": Field(int, is_required=False),
+                },
+            ),
+            "event_types": Field(
+                [str],
+                is_required=False,
+                description=(
+                    "The dagster event types to purge. Asset events, asset check events, run"
+                    " lifecycle events and the step events used for re-execution are never purged."
+                ),
+            ),
+            "purge_log_messages": Field(bool, is_required=False, default_value=True),
+            "batch_size": Field(int, is_required=False, default_value=1000),
+            "archive": Field(
+                {
+                    "base_dir": StringSource,
+                    "format": Field(
+                        Enum(
+                            "EventLogArchiveFormat",
+                            [EnumValue("jsonl"), EnumValue("parquet")],
+                        ),
+                        is_required=False,
+                        default_value="jsonl",
+                    ),
+                },
+                is_required=False,
+                description=(
+                    "Archive purged events before deleting them, to a local directory or any path"
+                    " supported by universal_pathlib (e.g. s3://bucket/prefix)."
+                ),
+            ),
+        },
+        is_required=False,
+    )
+
+
 def retention_config_schema() -> Field:
     return Field(
         {
             "schedule": _tick_retention_config_schema(),
             "sensor": _tick_retention_config_schema(),
             "auto_materialize": _tick_retention_config_schema(),
+            "event_log": _event_log_retention_config_schema(),
         },
         is_required=False,
     )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, NamedTuple, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence
 
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRun
@@ -43,6 +43,19 @@ def submit_run(self, context: SubmitRunContext) -> DagsterRun:
             PipelineRun: The queued run
         """
 
+    def submit_runs(self, contexts: Sequence[SubmitRunContext]) -> Sequence[DagsterRun]:
+        """Submit a batch of runs to the run coordinator for execution. Run coordinators that can
+        submit runs more efficiently in bulk can override this, by default each run is submitted
+        in turn.
+
+        Args:
+            contexts (Sequence[SubmitRunContext]): information about the submission of each run.
+
+        Returns:
+            Sequence[DagsterRun]: The queued runs, in the order they were passed in
+        """
+        return [self.submit_run(context) for context in contexts]
+
     @abstractmethod
     def cancel_run(self, run_id: str) -> bool:
         """Cancels a run. The run may be queued in the coordinator, or it may have been launched.
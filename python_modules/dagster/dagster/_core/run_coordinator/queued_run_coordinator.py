@@ -14,7 +14,7 @@
 from dagster._config import Array, Field, Noneable, ScalarUnion, Shape
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.instance import T_DagsterInstance
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 
 from .base import RunCoordinator, SubmitRunContext
@@ -223,7 +223,28 @@ def from_config_value(
 
     def submit_run(self, context: SubmitRunContext) -> DagsterRun:
         dagster_run = context.dagster_run
+        self._enqueue_run(dagster_run)
 
+        run = self._instance.get_run_by_id(dagster_run.run_id)
+        if run is None:
+            check.failed(f"Failed to reload run {dagster_run.run_id}")
+        return run
+
+    def submit_runs(self, contexts: Sequence[SubmitRunContext]) -> Sequence[DagsterRun]:
+        for context in contexts:
+            self._enqueue_run(context.dagster_run)
+
+        # reload the whole batch in a single query rather than once per run
+        run_ids = [context.dagster_run.run_id for context in contexts]
+        runs_by_id = {
+            run.run_id: run for run in self._instance.get_runs(RunsFilter(run_ids=run_ids))
+        }
+        for run_id in run_ids:
+            if run_id not in runs_by_id:
+                check.failed(f"Failed to reload run {run_id}")
+        return [runs_by_id[run_id] for run_id in run_ids]
+
+    def _enqueue_run(self, dagster_run: DagsterRun) -> None:
         if dagster_run.status == DagsterRunStatus.NOT_STARTED:
             enqueued_event = DagsterEvent(
                 event_type_value=DagsterEventType.PIPELINE_ENQUEUED.value,
@@ -237,11 +258,6 @@ def submit_run(self, context: SubmitRunContext) -> DagsterRun:
                 f"{dagster_run.status.value}, skipping enqueue."
             )
 
-        run = self._instance.get_run_by_id(dagster_run.run_id)
-        if run is None:
-            check.failed(f"Failed to reload run {dagster_run.run_id}")
-        return run
-
     def cancel_run(self, run_id: str) -> bool:
         run = self._instance.get_run_by_id(run_id)
         if not run:
@@ -0,0 +1,87 @@
+"""add run_stats and run_step_stats rollup tables
+
+Revision ID: 3d6e2f0b8c41
+Revises: ec80dd91891a
+Create Date: 2026-10-19 10:12:31.402115
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "3d6e2f0b8c41"
+down_revision = "ec80dd91891a"
+branch_labels = None
+depends_on = None
+
+RUN_STATS_TABLE_NAME = "run_stats"
+RUN_STEP_STATS_TABLE_NAME = "run_step_stats"
+RUN_STEP_STATS_INDEX_NAME = "idx_run_step_stats"
+
+
+def upgrade():
+    if not has_table(RUN_STATS_TABLE_NAME):
+        op.create_table(
+            RUN_STATS_TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), unique=True, nullable=False),
+            db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+            db.Column("steps_failed", db.Integer, nullable=False, default=0),
+            db.Column("materializations", db.Integer, nullable=False, default=0),
+            db.Column("expectations", db.Integer, nullable=False, default=0),
+            db.Column("enqueued_time", db.types.TIMESTAMP),
+            db.Column("launch_time", db.types.TIMESTAMP),
+            db.Column("start_time", db.types.TIMESTAMP),
+            db.Column("end_time", db.types.TIMESTAMP),
+            db.Column("needs_rebuild", db.Boolean, nullable=False, default=False),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_table(RUN_STEP_STATS_TABLE_NAME):
+        op.create_table(
+            RUN_STEP_STATS_TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("status", db.String(63)),
+            db.Column(
+                "first_event_id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+            ),
+            db.Column("stats_body", db.Text, nullable=False),
+            db.Column("version", db.Integer, nullable=False, default=0),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index(RUN_STEP_STATS_TABLE_NAME, RUN_STEP_STATS_INDEX_NAME):
+        op.create_index(
+            RUN_STEP_STATS_INDEX_NAME,
+            RUN_STEP_STATS_TABLE_NAME,
+            ["run_id", "step_key"],
+            unique=True,
+            mysql_length={"run_id": 255, "step_key": 255},
+        )
+
+
+def downgrade():
+    if has_table(RUN_STEP_STATS_TABLE_NAME):
+        if has_index(RUN_STEP_STATS_TABLE_NAME, RUN_STEP_STATS_INDEX_NAME):
+            op.drop_index(RUN_STEP_STATS_INDEX_NAME, RUN_STEP_STATS_TABLE_NAME)
+
+        op.drop_table(RUN_STEP_STATS_TABLE_NAME)
+
+    if has_table(RUN_STATS_TABLE_NAME):
+        op.drop_table(RUN_STATS_TABLE_NAME)
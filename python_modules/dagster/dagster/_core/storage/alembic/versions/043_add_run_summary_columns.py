@@ -0,0 +1,83 @@
+"""add run summary columns and indexes to runs
+
+Revision ID: 8c1f4e9b2a7d
+Revises: 3d6e2f0b8c41
+Create Date: 2026-10-19 12:31:07.513220
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_column, has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "8c1f4e9b2a7d"
+down_revision = "3d6e2f0b8c41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_column("runs", "backfill_id"):
+        op.add_column("runs", db.Column("backfill_id", db.String(255), nullable=True))
+
+    if not has_column("runs", "repository_label"):
+        op.add_column("runs", db.Column("repository_label", db.Text, nullable=True))
+
+    if not has_column("runs", "root_run_id"):
+        op.add_column("runs", db.Column("root_run_id", db.String(255), nullable=True))
+
+    if not has_index("runs", "idx_runs_by_job_status"):
+        op.create_index(
+            "idx_runs_by_job_status",
+            "runs",
+            ["pipeline_name", "status", "id"],
+            unique=False,
+            mysql_length={"pipeline_name": 255, "status": 32},
+        )
+
+    if not has_index("runs", "idx_runs_by_backfill_id"):
+        op.create_index(
+            "idx_runs_by_backfill_id",
+            "runs",
+            ["backfill_id", "id"],
+            unique=False,
+        )
+
+    if not has_index("runs", "idx_runs_by_repository_label"):
+        op.create_index(
+            "idx_runs_by_repository_label",
+            "runs",
+            ["repository_label", "id"],
+            unique=False,
+            mysql_length={"repository_label": 255},
+        )
+
+    if not has_index("runs", "idx_runs_by_root_run_id"):
+        op.create_index(
+            "idx_runs_by_root_run_id",
+            "runs",
+            ["root_run_id", "id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    if not has_table("runs"):
+        return
+
+    with op.batch_alter_table("runs") as batch_op:
+        for index_name in [
+            "idx_runs_by_job_status",
+            "idx_runs_by_backfill_id",
+            "idx_runs_by_repository_label",
+            "idx_runs_by_root_run_id",
+        ]:
+            if has_index("runs", index_name):
+                batch_op.drop_index(index_name)
+
+        for column_name in ["backfill_id", "repository_label", "root_run_id"]:
+            if has_column("runs", column_name):
+                batch_op.drop_column(column_name)
@@ -0,0 +1,41 @@
+"""add snapshot_chunks table
+
+Revision ID: 5a9d3c7e1f20
+Revises: 8c1f4e9b2a7d
+Create Date: 2026-10-19 13:05:42.118306
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "5a9d3c7e1f20"
+down_revision = "8c1f4e9b2a7d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # only the run storage holds snapshots
+    if not has_table("snapshots"):
+        return
+
+    if not has_table("snapshot_chunks"):
+        op.create_table(
+            "snapshot_chunks",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("chunk_id", db.String(255), unique=True, nullable=False),
+            db.Column("chunk_body", db.LargeBinary, nullable=False),
+        )
+
+
+def downgrade():
+    if has_table("snapshot_chunks"):
+        op.drop_table("snapshot_chunks")
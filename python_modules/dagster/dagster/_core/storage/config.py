@@ -2,7 +2,7 @@
 
 from typing_extensions import TypedDict
 
-from dagster._config import Field, IntSource, Permissive, Selector, StringSource
+from dagster._config import Enum, EnumValue, Field, IntSource, Permissive, Selector, StringSource
 from dagster._config.config_schema import UserConfigSchema
 
 
@@ -65,4 +65,24 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "event_log_partitioning": Field(
+            {
+                "interval": Field(
+                    Enum(
+                        "EventLogPartitionInterval",
+                        [EnumValue("day"), EnumValue("week"), EnumValue("month")],
+                    ),
+                    is_required=False,
+                    default_value="month",
+                ),
+                "premake": Field(IntSource, is_required=False, default_value=3),
+            },
+            is_required=False,
+            description=(
+                "Create the event_logs table range-partitioned by event timestamp, with a"
+                " partition per interval. Partitions are created `premake` intervals ahead of the"
+                " events being stored. Only applies when the event log tables are created, see"
+                " PostgresEventLogStorage.migrate_to_partitioned_event_logs for existing tables."
+            ),
+        ),
     }
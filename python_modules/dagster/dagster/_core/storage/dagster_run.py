@@ -29,6 +29,8 @@
 
 from .tags import (
     BACKFILL_ID_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
     REPOSITORY_LABEL_TAG,
     RESUME_RETRY_TAG,
     SCHEDULE_NAME_TAG,
@@ -581,6 +583,86 @@ def __new__(
         )
 
 
+class RunSummary(
+    NamedTuple(
+        "_RunSummary",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("job_name", str),
+            ("status", DagsterRunStatus),
+            ("partition", Optional[str]),
+            ("partition_set", Optional[str]),
+            ("backfill_id", Optional[str]),
+            ("repository_label", Optional[str]),
+            ("root_run_id", Optional[str]),
+            ("create_timestamp", datetime),
+            ("update_timestamp", datetime),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+        ],
+    )
+):
+    """Internal representation of the summary of a run used by run list views, read from the
+    columns of a :py:class:`~dagster._core.storage.runs.RunStorage` without loading the full run.
+
+    Users should not invoke this class directly.
+    """
+
+    def __new__(
+        cls,
+        storage_id: int,
+        run_id: str,
+        job_name: str,
+        status: DagsterRunStatus,
+        create_timestamp: datetime,
+        update_timestamp: datetime,
+        partition: Optional[str] = None,
+        partition_set: Optional[str] = None,
+        backfill_id: Optional[str] = None,
+        repository_label: Optional[str] = None,
+        root_run_id: Optional[str] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ):
+        return super(RunSummary, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            job_name=check.str_param(job_name, "job_name"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+            partition=check.opt_str_param(partition, "partition"),
+            partition_set=check.opt_str_param(partition_set, "partition_set"),
+            backfill_id=check.opt_str_param(backfill_id, "backfill_id"),
+            repository_label=check.opt_str_param(repository_label, "repository_label"),
+            root_run_id=check.opt_str_param(root_run_id, "root_run_id"),
+            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+        )
+
+    @staticmethod
+    def from_run_record(run_record: RunRecord) -> "RunSummary":
+        run = run_record.dagster_run
+        tags = run.tags_for_storage()
+        return RunSummary(
+            storage_id=run_record.storage_id,
+            run_id=run.run_id,
+            job_name=run.job_name,
+            status=run.status,
+            partition=tags.get(PARTITION_NAME_TAG),
+            partition_set=tags.get(PARTITION_SET_TAG),
+            backfill_id=tags.get(BACKFILL_ID_TAG),
+            repository_label=tags.get(REPOSITORY_LABEL_TAG),
+            root_run_id=tags.get(ROOT_RUN_ID_TAG),
+            create_timestamp=run_record.create_timestamp,
+            update_timestamp=run_record.update_timestamp,
+            start_time=run_record.start_time,
+            end_time=run_record.end_time,
+        )
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
@@ -1,9 +1,12 @@
 import base64
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
+    Callable,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -17,11 +20,17 @@
 from dagster._core.assets import AssetDetails
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.events import AssetKey
-from dagster._core.event_api import EventHandlerFn, EventLogRecord, EventRecordsFilter
+from dagster._core.event_api import (
+    EventHandlerFn,
+    EventLogRecord,
+    EventLogRecordView,
+    EventRecordsFilter,
+)
 from dagster._core.events import DagsterEventType
 from dagster._core.execution.stats import (
+    STEP_STATS_EVENT_TYPES,
     RunStepKeyStatsSnapshot,
-    build_run_stats_from_events,
+    build_run_stats_from_record_views,
     build_run_step_stats_from_events,
 )
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
@@ -37,6 +46,9 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
+DEFAULT_EVENT_RECORDS_PAGE_SIZE = 1000
+
+
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
     cursor: str
@@ -201,23 +213,71 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        page_size: int = DEFAULT_EVENT_RECORDS_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[EventLogRecord]:
+        """Stream all of the event log records corresponding to a run, in storage order. Records
+        are fetched in pages of ``page_size`` records using storage id cursors, so only a page at a
+        time is held in memory.
+
+        Args:
+            run_id (str): The id of the run for which to fetch records.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the records.
+            page_size (int): The number of records to fetch per query.
+            prefetch (bool): Whether to fetch the next page on a background thread while the
+                current page is consumed.
+        """
+        check.str_param(run_id, "run_id")
+
+        def _fetch_page(storage_id: Optional[int]) -> Sequence[EventLogRecord]:
+            cursor = (
+                EventLogCursor.from_storage_id(storage_id).to_string()
+                if storage_id is not None
+                else None
+            )
+            return self.get_records_for_run(run_id, cursor, of_type, page_size).records
+
+        return _iterate_record_pages(_fetch_page, page_size, prefetch)
+
+    def get_record_views_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        step_keys: Optional[Sequence[str]] = None,
+    ) -> Sequence[EventLogRecordView]:
+        """Get views of all of the event log records corresponding to a run, in storage order. Views
+        expose the event type, step key, timestamp, asset key, and partition of each record, and
+        only deserialize the event when it is accessed.
+
+        Args:
+            run_id (str): The id of the run for which to fetch records.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the records.
+            step_keys (Optional[Sequence[str]]): the step keys to filter the records.
+        """
+        records = self.get_records_for_run(run_id, of_type=of_type).records
+        views = [EventLogRecordView.from_record(record) for record in records]
+        if step_keys:
+            views = [view for view in views if view.step_key in step_keys]
+        return views
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
-        return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
+        return build_run_stats_from_record_views(run_id, self.get_record_views_for_run(run_id))
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
     ) -> Sequence[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
-        logs = self.get_logs_for_run(run_id)
-        if step_keys:
-            logs = [
-                event
-                for event in logs
-                if event.is_dagster_event and event.get_dagster_event().step_key in step_keys
-            ]
-
-        return build_run_step_stats_from_events(run_id, logs)
+        views = self.get_record_views_for_run(
+            run_id, of_type=set(STEP_STATS_EVENT_TYPES), step_keys=step_keys
+        )
+        return build_run_step_stats_from_events(
+            run_id, [view.event_log_entry for view in views if view.step_key]
+        )
 
     @abstractmethod
     def store_event(self, event: "EventLogEntry") -> None:
@@ -231,6 +291,36 @@ def store_event(self, event: "EventLogEntry") -> None:
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
 
+    @property
+    def supports_event_log_retention(self) -> bool:
+        return False
+
+    def get_purgeable_records_for_run(
+        self,
+        run_id: str,
+        event_types: Set[DagsterEventType],
+        include_log_messages: bool,
+        limit: int,
+    ) -> Sequence[EventLogRecord]:
+        """Get the oldest records of a run that may be purged by event log retention, in storage
+        order. Storages may withhold records that they still need to serve run and step stats.
+
+        Args:
+            run_id (str): The id of the run for which to fetch records.
+            event_types (Set[DagsterEventType]): the dagster event types that may be purged.
+            include_log_messages (bool): whether log messages, which have no dagster event type,
+                may be purged.
+            limit (int): the maximum number of records to fetch.
+        """
+        raise NotImplementedError()
+
+    def delete_event_records(self, run_id: str, storage_ids: Sequence[int]) -> None:
+        """Remove the records with the given storage ids from the event log of a run. Only used
+        by event log retention, which never purges the asset events tracked by the asset index
+        tables.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -277,6 +367,60 @@ def get_event_records(
     ) -> Sequence[EventLogRecord]:
         pass
 
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        ascending: bool = True,
+        page_size: int = DEFAULT_EVENT_RECORDS_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[EventLogRecord]:
+        """Stream the event log records matching the filter. Records are fetched in pages of
+        ``page_size`` records, each page starting after the storage id of the last record of the
+        previous one, so only a page at a time is held in memory however many records match.
+
+        Args:
+            event_records_filter (EventRecordsFilter): the filter by which to filter event records.
+            ascending (bool): Stream the records in ascending order of storage id if True,
+                descending otherwise. Defaults to ascending.
+            page_size (int): The number of records to fetch per query.
+            prefetch (bool): Whether to fetch the next page on a background thread while the
+                current page is consumed.
+        """
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.bool_param(ascending, "ascending")
+
+        def _fetch_page(storage_id: Optional[int]) -> Sequence[EventLogRecord]:
+            page_filter = event_records_filter
+            if storage_id is not None:
+                page_filter = EventRecordsFilter(
+                    event_type=event_records_filter.event_type,
+                    asset_key=event_records_filter.asset_key,
+                    asset_partitions=event_records_filter.asset_partitions,
+                    after_cursor=storage_id if ascending else event_records_filter.after_cursor,
+                    before_cursor=(event_records_filter.before_cursor if ascending else storage_id),
+                    after_timestamp=event_records_filter.after_timestamp,
+                    before_timestamp=event_records_filter.before_timestamp,
+                    storage_ids=event_records_filter.storage_ids,
+                    tags=event_records_filter.tags,
+                )
+            return self.get_event_records(page_filter, limit=page_size, ascending=ascending)
+
+        return _iterate_record_pages(_fetch_page, page_size, prefetch)
+
+    def get_event_record_views(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[EventLogRecordView]:
+        """Get views of the event log records matching the filter, for callers that only need the
+        indexed fields of each record. See ``get_record_views_for_run``.
+        """
+        return [
+            EventLogRecordView.from_record(record)
+            for record in self.get_event_records(event_records_filter, limit, ascending)
+        ]
+
     def supports_event_consumer_queries(self) -> bool:
         return False
 
@@ -512,3 +656,41 @@ def get_latest_asset_check_execution_by_key(
     ) -> Mapping[AssetCheckKey, AssetCheckExecutionRecord]:
         """Get the latest executions for a list of asset checks."""
         pass
+
+
+def _iterate_record_pages(
+    fetch_page: Callable[[Optional[int]], Sequence[EventLogRecord]],
+    page_size: int,
+    prefetch: bool,
+) -> Iterator[EventLogRecord]:
+    """Yields the records of successive pages, fetching each page after the storage id of the last
+    record of the previous one. A page with fewer than ``page_size`` records is the last one. If
+    ``prefetch`` is set, the next page is fetched on a background thread while the current page is
+    consumed.
+    """
+    check.int_param(page_size, "page_size")
+    check.invariant(page_size > 0, "page_size must be positive")
+
+    executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="event_log_prefetch")
+        if prefetch
+        else None
+    )
+    try:
+        page = fetch_page(None)
+        while page:
+            last_storage_id = page[-1].storage_id
+            is_last_page = len(page) < page_size
+            next_page: Optional[Future] = (
+                executor.submit(fetch_page, last_storage_id)
+                if executor and not is_last_page
+                else None
+            )
+            yield from page
+            if is_last_page:
+                return
+            page = next_page.result() if next_page else fetch_page(last_storage_id)
+    finally:
+        if executor:
+            # waits for an in-flight prefetch if the consumer stopped early
+            executor.shutdown(wait=True)
@@ -11,9 +11,11 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+RUN_STATS_ROLLUPS = "run_stats_rollups"  # builds the run and step stats rollups from the event log
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    RUN_STATS_ROLLUPS: lambda: migrate_run_stats_rollups,
 }
 ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
@@ -73,6 +75,41 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_run_stats_rollups(event_log_storage, print_fn=None):
+    """Utility method to backfill the run stats and step stats rollup tables from the data in
+    existing event log records. Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
+
+    from .schema import SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying event logs for runs.")
+
+    if isinstance(event_log_storage, SqliteEventLogStorage):
+        run_ids = event_log_storage.get_all_run_ids()
+    else:
+        query = (
+            db_select([SqlEventLogStorageTable.c.run_id])
+            .where(SqlEventLogStorageTable.c.run_id != None)  # noqa: E711
+            .where(SqlEventLogStorageTable.c.run_id != "")
+            .distinct()
+        )
+        with event_log_storage.index_connection() as conn:
+            run_ids = [run_id for (run_id,) in conn.execute(query).fetchall()]
+
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to build stats for")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        event_log_storage.rebuild_stats_rollups_for_run(run_id)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster._core.definitions.events import AssetKey
     from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
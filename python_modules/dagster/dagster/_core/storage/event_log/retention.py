@@ -0,0 +1,254 @@
+import gzip
+import json
+from abc import ABC, abstractmethod
+from typing import AbstractSet, Any, Iterator, Mapping, NamedTuple, Optional, Sequence
+
+from upath import UPath
+
+import dagster._check as check
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.event_api import EventLogRecord
+from dagster._core.events import (
+    ASSET_CHECK_EVENTS,
+    ASSET_EVENTS,
+    EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
+    DagsterEventType,
+)
+from dagster._core.storage.dagster_run import DagsterRunStatus
+from dagster._serdes import serialize_value
+
+from .base import EventLogStorage
+
+# events that other parts of the system read back long after a run has finished: the asset and
+# asset check events behind the asset index tables, the run lifecycle events, the step events
+# used to compute re-execution state, and the pointers to captured compute logs
+PROTECTED_EVENT_TYPES: AbstractSet[DagsterEventType] = frozenset(
+    {
+        *ASSET_EVENTS,
+        *ASSET_CHECK_EVENTS,
+        *EVENT_TYPE_TO_PIPELINE_RUN_STATUS.keys(),
+        DagsterEventType.STEP_START,
+        DagsterEventType.STEP_SUCCESS,
+        DagsterEventType.STEP_FAILURE,
+        DagsterEventType.STEP_SKIPPED,
+        DagsterEventType.STEP_UP_FOR_RETRY,
+        DagsterEventType.STEP_RESTARTED,
+        DagsterEventType.STEP_OUTPUT,
+        DagsterEventType.HANDLED_OUTPUT,
+        DagsterEventType.STEP_EXPECTATION_RESULT,
+        DagsterEventType.LOGS_CAPTURED,
+    }
+)
+
+DEFAULT_PURGEABLE_EVENT_TYPES: AbstractSet[DagsterEventType] = frozenset(
+    {
+        DagsterEventType.ENGINE_EVENT,
+        DagsterEventType.STEP_INPUT,
+        DagsterEventType.LOADED_INPUT,
+        DagsterEventType.OBJECT_STORE_OPERATION,
+        DagsterEventType.ASSET_STORE_OPERATION,
+        DagsterEventType.STEP_WORKER_STARTING,
+        DagsterEventType.STEP_WORKER_STARTED,
+        DagsterEventType.RESOURCE_INIT_STARTED,
+        DagsterEventType.RESOURCE_INIT_SUCCESS,
+        DagsterEventType.RESOURCE_INIT_FAILURE,
+        DagsterEventType.HOOK_COMPLETED,
+        DagsterEventType.HOOK_ERRORED,
+        DagsterEventType.HOOK_SKIPPED,
+    }
+)
+
+EVENT_LOG_RETENTION_RUN_STATUSES = [
+    DagsterRunStatus.SUCCESS,
+    DagsterRunStatus.FAILURE,
+    DagsterRunStatus.CANCELED,
+]
+
+
+class EventLogArchiveSettings(NamedTuple):
+    base_dir: str
+    format: str
+
+
+class EventLogRetentionSettings(NamedTuple):
+    """Parsed `retention.event_log` instance settings. Runs in a status without a positive
+    `purge_after_days` value are never purged.
+    """
+
+    purge_after_days: Mapping[DagsterRunStatus, int]
+    event_types: AbstractSet[DagsterEventType]
+    purge_log_messages: bool
+    batch_size: int
+    archive: Optional[EventLogArchiveSettings]
+
+    @staticmethod
+    def from_config(config: Mapping[str, Any]) -> "EventLogRetentionSettings":
+        purge_value = config["purge_after_days"]
+        if isinstance(purge_value, int):
+            purge_after_days = {status: purge_value for status in EVENT_LOG_RETENTION_RUN_STATUSES}
+        else:
+            purge_after_days = {
+                status: purge_value.get(status.value.lower(), -1)
+                for status in EVENT_LOG_RETENTION_RUN_STATUSES
+            }
+
+        if config.get("event_types") is None:
+            event_types = DEFAULT_PURGEABLE_EVENT_TYPES
+        else:
+            event_types = set()
+            for event_type_name in config["event_types"]:
+                if event_type_name not in DagsterEventType.__members__:
+                    raise DagsterInvariantViolationError(
+                        f"Unknown event type {event_type_name} in event log retention settings."
+                    )
+                event_type = DagsterEventType[event_type_name]
+                if event_type in PROTECTED_EVENT_TYPES:
+                    raise DagsterInvariantViolationError(
+                        f"Event type {event_type_name} cannot be purged by event log retention."
+                    )
+                event_types.add(event_type)
+
+        archive_config = config.get("archive")
+        return EventLogRetentionSettings(
+            purge_after_days={
+                status: days for status, days in purge_after_days.items() if days > 0
+            },
+            event_types=frozenset(event_types),
+            purge_log_messages=config.get("purge_log_messages", True),
+            batch_size=check.int_param(config.get("batch_size", 1000), "batch_size"),
+            archive=(
+                EventLogArchiveSettings(
+                    base_dir=archive_config["base_dir"],
+                    format=archive_config.get("format", "jsonl"),
+                )
+                if archive_config
+                else None
+            ),
+        )
+
+
+class EventLogArchiver(ABC):
+    """Writes batches of purged event log records to files under a base directory, which may be
+    any path supported by universal_pathlib, one file per batch of records of a run.
+    """
+
+    extension: str
+
+    def __init__(self, base_dir: str):
+        self._base_dir = UPath(check.str_param(base_dir, "base_dir"))
+
+    def archive_records(self, run_id: str, records: Sequence[EventLogRecord]) -> Optional[UPath]:
+        if not records:
+            return None
+        path = (
+            self._base_dir
+            / f"run_id={run_id}"
+            / f"{records[0].storage_id}-{records[-1].storage_id}.{self.extension}"
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.write_records(path, run_id, records)
+        return path
+
+    @abstractmethod
+    def write_records(
+        self, path: UPath, run_id: str, records: Sequence[EventLogRecord]
+    ) -> None: ...
+
+
+class JsonLinesEventLogArchiver(EventLogArchiver):
+    """Archives records as gzipped JSON lines, each holding the storage id and serialized event."""
+
+    extension = "jsonl.gz"
+
+    def write_records(self, path: UPath, run_id: str, records: Sequence[EventLogRecord]) -> None:
+        with path.open("wb") as f, gzip.GzipFile(fileobj=f, mode="wb") as gz:
+            for record in records:
+                line = json.dumps(
+                    {
+                        "storage_id": record.storage_id,
+                        "event": serialize_value(record.event_log_entry),
+                    }
+                )
+                gz.write(line.encode("utf-8") + b"\n")
+
+
+class ParquetEventLogArchiver(EventLogArchiver):
+    """Archives records as Parquet files with the indexed columns of the event log table alongside
+    the serialized event. Requires pyarrow.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, base_dir: str):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise DagsterInvariantViolationError(
+                "Archiving event logs in the parquet format requires pyarrow, which can be"
+                " installed with `pip install pyarrow`."
+            )
+        super().__init__(base_dir)
+
+    def write_records(self, path: UPath, run_id: str, records: Sequence[EventLogRecord]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table(
+            {
+                "storage_id": [record.storage_id for record in records],
+                "run_id": [run_id] * len(records),
+                "timestamp": [record.timestamp for record in records],
+                "dagster_event_type": [
+                    (
+                        record.event_log_entry.dagster_event_type.value
+                        if record.event_log_entry.dagster_event_type
+                        else None
+                    )
+                    for record in records
+                ],
+                "step_key": [record.event_log_entry.step_key for record in records],
+                "event": [serialize_value(record.event_log_entry) for record in records],
+            }
+        )
+        with path.open("wb") as f:
+            pq.write_table(table, f)
+
+
+def get_event_log_archiver(settings: EventLogArchiveSettings) -> EventLogArchiver:
+    if settings.format == "parquet":
+        return ParquetEventLogArchiver(settings.base_dir)
+    return JsonLinesEventLogArchiver(settings.base_dir)
+
+
+def purge_run_event_batches(
+    storage: EventLogStorage,
+    run_id: str,
+    settings: EventLogRetentionSettings,
+    archiver: Optional[EventLogArchiver] = None,
+) -> Iterator[int]:
+    """Purges the purgeable events of a finished run in batches of at most `settings.batch_size`
+    records, archiving each batch first when an archiver is given. Yields the number of records
+    purged after each batch, so that callers can interleave other work.
+    """
+    check.inst_param(storage, "storage", EventLogStorage)
+    check.str_param(run_id, "run_id")
+    check.inst_param(settings, "settings", EventLogRetentionSettings)
+    check.opt_inst_param(archiver, "archiver", EventLogArchiver)
+
+    while True:
+        records = storage.get_purgeable_records_for_run(
+            run_id,
+            event_types=set(settings.event_types),
+            include_log_messages=settings.purge_log_messages,
+            limit=settings.batch_size,
+        )
+        if not records:
+            return
+
+        if archiver:
+            archiver.archive_records(run_id, records)
+        storage.delete_event_records(run_id, [record.storage_id for record in records])
+        yield len(records)
+
+        if len(records) < settings.batch_size:
+            return
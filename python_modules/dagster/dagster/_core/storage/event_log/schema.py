@@ -166,6 +166,63 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Rollups of the stats derived from a run's events, maintained as events are stored so that run and
+# step stats can be read without scanning the run's events
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_time", db.types.TIMESTAMP),
+    db.Column("launch_time", db.types.TIMESTAMP),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+    # set when an update could not be applied, so that the rollups are rebuilt from the events
+    db.Column("needs_rebuild", db.Boolean, nullable=False, default=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("status", db.String(63)),
+    # the storage id of the first event that contributed stats for the step, used for ordering
+    db.Column(
+        "first_event_id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+    ),
+    # serialized RunStepStatsRollup
+    db.Column("stats_body", db.Text, nullable=False),
+    # incremented on every update, to detect concurrent updates to the same step
+    db.Column("version", db.Integer, nullable=False, default=0),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
+db.Index(
+    "idx_run_step_stats",
+    RunStepStatsTable.c.run_id,
+    RunStepStatsTable.c.step_key,
+    mysql_length={"run_id": 255, "step_key": 255},
+    unique=True,
+)
+
 db.Index(
     "idx_asset_check_executions",
     AssetCheckExecutionsTable.c.asset_key,
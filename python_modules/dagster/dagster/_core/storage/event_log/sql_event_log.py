@@ -39,10 +39,15 @@
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
-from dagster._core.event_api import RunShardedEventsCursor
+from dagster._core.event_api import EventLogRecordView, RunShardedEventsCursor
 from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    STEP_STATS_EVENT_TYPES,
+    RunStepKeyStatsSnapshot,
+    RunStepStatsRollup,
+    build_run_step_stats_from_events,
+)
 from dagster._core.storage.asset_check_execution_record import (
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
@@ -81,7 +86,12 @@
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_ROLLUPS,
+)
 from .schema import (
     AssetCheckExecutionsTable,
     AssetEventTagsTable,
@@ -89,6 +99,8 @@
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunStatsTable,
+    RunStepStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -98,6 +110,37 @@
 
 MAX_CONCURRENCY_SLOTS = 1000
 MIN_ASSET_ROWS = 25
+MAX_STEP_STATS_UPDATE_ATTEMPTS = 10
+
+# the columns record views are built from; the event body is deserialized only when accessed
+RECORD_VIEW_COLUMNS = [
+    SqlEventLogStorageTable.c.id,
+    SqlEventLogStorageTable.c.run_id,
+    SqlEventLogStorageTable.c.dagster_event_type,
+    SqlEventLogStorageTable.c.step_key,
+    SqlEventLogStorageTable.c.timestamp,
+    SqlEventLogStorageTable.c.asset_key,
+    SqlEventLogStorageTable.c.partition,
+    SqlEventLogStorageTable.c.event,
+]
+
+# run stats columns incremented for each event of the given type
+RUN_STATS_COUNT_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+
+# run stats columns holding the latest timestamp of events of the given type
+RUN_STATS_TIME_COLUMNS = {
+    DagsterEventType.PIPELINE_ENQUEUED: "enqueued_time",
+    DagsterEventType.PIPELINE_STARTING: "launch_time",
+    DagsterEventType.PIPELINE_START: "start_time",
+    DagsterEventType.PIPELINE_SUCCESS: "end_time",
+    DagsterEventType.PIPELINE_FAILURE: "end_time",
+    DagsterEventType.PIPELINE_CANCELED: "end_time",
+}
 
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
@@ -397,6 +440,8 @@ def store_event(self, event: EventLogEntry) -> None:
             result = conn.execute(insert_event_statement)
             event_id = result.inserted_primary_key[0]
 
+        self.update_stats_rollups(event, event_id)
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -507,9 +552,117 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_record_views_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        step_keys: Optional[Sequence[str]] = None,
+    ) -> Sequence[EventLogRecordView]:
+        check.str_param(run_id, "run_id")
+        check.invariant(not of_type or isinstance(of_type, (DagsterEventType, frozenset, set)))
+        check.opt_sequence_param(step_keys, "step_keys", of_type=str)
+
+        dagster_event_types = (
+            {of_type}
+            if isinstance(of_type, DagsterEventType)
+            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
+        )
+
+        query = (
+            db_select(RECORD_VIEW_COLUMNS)
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+        if step_keys:
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        return [_record_view_from_row(row) for row in results]
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        if self.has_stats_rollups(run_id):
+            self._rebuild_stats_rollups_if_needed(run_id)
+            with self.run_connection(run_id) as conn:
+                row = conn.execute(
+                    db_select(
+                        [
+                            RunStatsTable.c.steps_succeeded,
+                            RunStatsTable.c.steps_failed,
+                            RunStatsTable.c.materializations,
+                            RunStatsTable.c.expectations,
+                            RunStatsTable.c.enqueued_time,
+                            RunStatsTable.c.launch_time,
+                            RunStatsTable.c.start_time,
+                            RunStatsTable.c.end_time,
+                        ]
+                    ).where(RunStatsTable.c.run_id == run_id)
+                ).fetchone()
+
+            if not row:
+                return DagsterRunStatsSnapshot(run_id, 0, 0, 0, 0, None, None, None, None)
+
+            (
+                steps_succeeded,
+                steps_failed,
+                materializations,
+                expectations,
+                enqueued_time,
+                launch_time,
+                start_time,
+                end_time,
+            ) = row
+            return DagsterRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=steps_succeeded,
+                steps_failed=steps_failed,
+                materializations=materializations,
+                expectations=expectations,
+                enqueued_time=datetime_as_float(enqueued_time) if enqueued_time else None,
+                launch_time=datetime_as_float(launch_time) if launch_time else None,
+                start_time=datetime_as_float(start_time) if start_time else None,
+                end_time=datetime_as_float(end_time) if end_time else None,
+            )
+
+        counts, times = self._get_run_stats_by_event_type(run_id)
+        enqueued_time = times.get(DagsterEventType.PIPELINE_ENQUEUED.value, None)
+        launch_time = times.get(DagsterEventType.PIPELINE_STARTING.value, None)
+        start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
+        end_time = times.get(
+            DagsterEventType.PIPELINE_SUCCESS.value,
+            times.get(
+                DagsterEventType.PIPELINE_FAILURE.value,
+                times.get(DagsterEventType.PIPELINE_CANCELED.value, None),
+            ),
+        )
+
+        return DagsterRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
+            steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
+            materializations=counts.get(DagsterEventType.ASSET_MATERIALIZATION.value, 0),
+            expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
+            enqueued_time=datetime_as_float(enqueued_time) if enqueued_time else None,
+            launch_time=datetime_as_float(launch_time) if launch_time else None,
+            start_time=datetime_as_float(start_time) if start_time else None,
+            end_time=datetime_as_float(end_time) if end_time else None,
+        )
+
+    def _get_run_stats_by_event_type(
+        self, run_id: str
+    ) -> Tuple[Mapping[str, int], Mapping[str, datetime]]:
+        """Returns the number of events and the timestamp of the latest event of each event type
+        stored for the run.
+        """
         query = (
             db_select(
                 [
@@ -530,39 +683,15 @@ def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        try:
-            counts = {}
-            times = {}
-            for result in results:
-                (dagster_event_type, n_events_of_type, last_event_timestamp) = result
-                check.invariant(dagster_event_type is not None)
-                counts[dagster_event_type] = n_events_of_type
-                times[dagster_event_type] = last_event_timestamp
-
-            enqueued_time = times.get(DagsterEventType.PIPELINE_ENQUEUED.value, None)
-            launch_time = times.get(DagsterEventType.PIPELINE_STARTING.value, None)
-            start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
-            end_time = times.get(
-                DagsterEventType.PIPELINE_SUCCESS.value,
-                times.get(
-                    DagsterEventType.PIPELINE_FAILURE.value,
-                    times.get(DagsterEventType.PIPELINE_CANCELED.value, None),
-                ),
-            )
+        counts = {}
+        times = {}
+        for result in results:
+            (dagster_event_type, n_events_of_type, last_event_timestamp) = result
+            check.invariant(dagster_event_type is not None)
+            counts[dagster_event_type] = n_events_of_type
+            times[dagster_event_type] = last_event_timestamp
 
-            return DagsterRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.ASSET_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                enqueued_time=datetime_as_float(enqueued_time) if enqueued_time else None,
-                launch_time=datetime_as_float(launch_time) if launch_time else None,
-                start_time=datetime_as_float(start_time) if start_time else None,
-                end_time=datetime_as_float(end_time) if end_time else None,
-            )
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+        return counts, times
 
     def get_step_stats_for_run(
         self, run_id: str, step_keys: Optional[Sequence[str]] = None
@@ -570,6 +699,10 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_stats_rollups(run_id):
+            self._rebuild_stats_rollups_if_needed(run_id)
+            return self._get_step_stats_for_run_from_rollups(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -582,42 +715,403 @@ def get_step_stats_for_run(
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
+        #
+        # Storages with the stats rollup tables maintain the same stats as events are stored, see
+        # update_stats_rollups.
+        raw_event_query = self._step_stats_event_query(
+            run_id, step_keys, [SqlEventLogStorageTable.c.event]
+        )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        try:
+            records = [deserialize_value(json_str, EventLogEntry) for (json_str,) in results]
+            return build_run_step_stats_from_events(run_id, records)
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def _step_stats_event_query(
+        self,
+        run_id: str,
+        step_keys: Optional[Sequence[str]],
+        columns: Sequence[Any],
+        event_types: Sequence[DagsterEventType] = STEP_STATS_EVENT_TYPES,
+    ) -> SqlAlchemyQuery:
+        query = (
+            db_select(columns)
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
+                    [event_type.value for event_type in event_types]
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
         if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+        return query
+
+    def _get_step_stats_for_run_from_rollups(
+        self, run_id: str, step_keys: Optional[Sequence[str]]
+    ) -> Sequence[RunStepKeyStatsSnapshot]:
+        rollup_query = (
+            db_select([RunStepStatsTable.c.stats_body])
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .where(RunStepStatsTable.c.first_event_id != None)  # noqa: E711
+            .order_by(RunStepStatsTable.c.first_event_id.asc(), RunStepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            rollup_query = rollup_query.where(RunStepStatsTable.c.step_key.in_(step_keys))
+
+        # materializations and expectation results are returned in full, so they are still read
+        # from the event log, but only when the run stats show the run has any. Reads for runs with
+        # many materializations are therefore still proportional to the number of materializations.
+        payload_query = self._step_stats_event_query(
+            run_id,
+            step_keys,
+            [SqlEventLogStorageTable.c.event],
+            event_types=[
+                DagsterEventType.ASSET_MATERIALIZATION,
+                DagsterEventType.STEP_EXPECTATION_RESULT,
+            ],
+        )
+        run_stats_query = db_select(
+            [RunStatsTable.c.materializations, RunStatsTable.c.expectations]
+        ).where(RunStatsTable.c.run_id == run_id)
+
+        with self.run_connection(run_id) as conn:
+            rollup_rows = conn.execute(rollup_query).fetchall()
+            run_stats_row = conn.execute(run_stats_query).fetchone()
+            payload_rows = (
+                conn.execute(payload_query).fetchall()
+                if rollup_rows and run_stats_row and any(run_stats_row)
+                else []
+            )
+
+        materialization_events = defaultdict(list)
+        expectation_results = defaultdict(list)
+        try:
+            rollups = [deserialize_value(body, RunStepStatsRollup) for (body,) in rollup_rows]
+            for (json_str,) in payload_rows:
+                event = deserialize_value(json_str, EventLogEntry)
+                dagster_event = event.get_dagster_event()
+                if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                    materialization_events[dagster_event.step_key].append(event)
+                else:
+                    expectation_results[dagster_event.step_key].append(
+                        dagster_event.step_expectation_result_data.expectation_result
+                    )
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return [
+            rollup.to_snapshot(
+                materialization_events=materialization_events[rollup.step_key],
+                expectation_results=expectation_results[rollup.step_key],
+            )
+            for rollup in rollups
+        ]
+
+    def _has_stats_rollup_tables(self, run_id: Optional[str]) -> bool:
+        """Whether the connection for the given run has the stats rollup tables. Overridden by
+        storages that shard by run, whose shards are migrated independently.
+        """
+        # checked for every stored event, so cached until the next reindex
+        if getattr(self, "_stats_rollup_tables_exist", None) is None:
+            self._stats_rollup_tables_exist = self.has_table(RunStatsTable.name) and self.has_table(
+                RunStepStatsTable.name
+            )
+        return self._stats_rollup_tables_exist
+
+    def _can_build_stats_rollups(self) -> bool:
+        return self._has_stats_rollup_tables(None)
+
+    def has_stats_rollups(self, run_id: Optional[str] = None) -> bool:
+        """Whether run and step stats are read from the rollup tables, which requires both the
+        schema migration that adds the tables and the data migration that backfills them.
+        """
+        return self._has_stats_rollup_tables(run_id) and self.has_secondary_index(RUN_STATS_ROLLUPS)
+
+    def update_stats_rollups(self, event: EventLogEntry, event_id: Optional[int]) -> None:
+        """Folds a newly stored event into the run stats and step stats rollup tables."""
+        if not event.is_dagster_event or not event.run_id:
+            return
+
+        dagster_event = event.get_dagster_event()
+        event_type = dagster_event.event_type
+        updates_run_stats = (
+            event_type in RUN_STATS_COUNT_COLUMNS or event_type in RUN_STATS_TIME_COLUMNS
+        )
+        updates_step_stats = (
+            dagster_event.step_key is not None
+            and event_type in STEP_STATS_EVENT_TYPES
+            and (
+                event_type not in MARKER_EVENTS
+                or bool(
+                    dagster_event.engine_event_data.marker_start
+                    or dagster_event.engine_event_data.marker_end
+                )
+            )
+        )
+        if not (updates_run_stats or updates_step_stats) or not self._has_stats_rollup_tables(
+            event.run_id
+        ):
+            return
+
+        if updates_run_stats:
+            self._update_run_stats_rollup(event)
+        if updates_step_stats:
+            if event_type in (
+                DagsterEventType.ASSET_MATERIALIZATION,
+                DagsterEventType.STEP_EXPECTATION_RESULT,
+            ):
+                # these only mark the step as having stats, which needs no read of the rollup
+                self._mark_run_step_stats_rollup(event, event_id)
+            else:
+                self._update_run_step_stats_rollup(event, event_id)
+
+    def _upsert_run_stats(
+        self, run_id: str, updates: Mapping[str, Any], inserts: Mapping[str, Any]
+    ) -> None:
+        update_statement = (
+            RunStatsTable.update().where(RunStatsTable.c.run_id == run_id).values(updates)
+        )
+        with self.run_connection(run_id) as conn:
+            if conn.execute(update_statement).rowcount:
+                return
+
+        try:
+            with self.run_connection(run_id) as conn:
+                conn.execute(RunStatsTable.insert().values(run_id=run_id, **inserts))
+        except db_exc.IntegrityError:
+            # the row was inserted concurrently
+            with self.run_connection(run_id) as conn:
+                conn.execute(update_statement)
+
+    def _update_run_stats_rollup(self, event: EventLogEntry) -> None:
+        event_type = event.get_dagster_event().event_type
+        timestamp = datetime.utcfromtimestamp(event.timestamp)
+
+        updates = {}
+        inserts = {}
+        count_column_name = RUN_STATS_COUNT_COLUMNS.get(event_type)
+        if count_column_name:
+            updates[count_column_name] = RunStatsTable.c[count_column_name] + 1
+            inserts[count_column_name] = 1
+        time_column_name = RUN_STATS_TIME_COLUMNS.get(event_type)
+        if time_column_name:
+            # keep the latest timestamp, as when computing the stats from the events
+            time_column = RunStatsTable.c[time_column_name]
+            updates[time_column_name] = db_case(
+                [
+                    (time_column == None, timestamp),  # noqa: E711
+                    (time_column < timestamp, timestamp),
+                ],
+                else_=time_column,
             )
+            inserts[time_column_name] = timestamp
+
+        self._upsert_run_stats(event.run_id, updates, inserts)
 
+    def _flag_stats_rollups_for_rebuild(self, run_id: str) -> None:
+        self._upsert_run_stats(run_id, {"needs_rebuild": True}, {"needs_rebuild": True})
+
+    def _rebuild_stats_rollups_if_needed(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            needs_rebuild = conn.execute(
+                db_select([RunStatsTable.c.needs_rebuild]).where(RunStatsTable.c.run_id == run_id)
+            ).scalar()
+        if needs_rebuild:
+            self.rebuild_stats_rollups_for_run(run_id)
+
+    def _first_event_id_value(self, event_id: Optional[int]) -> Any:
+        # keep the smallest storage id of the events that contributed stats for the step, which
+        # orders the steps the same way as the events do
+        if event_id is None:
+            return RunStepStatsTable.c.first_event_id
+        first_event_id = RunStepStatsTable.c.first_event_id
+        return db_case(
+            [
+                (first_event_id == None, event_id),  # noqa: E711
+                (first_event_id > event_id, event_id),
+            ],
+            else_=first_event_id,
+        )
+
+    def _mark_run_step_stats_rollup(self, event: EventLogEntry, event_id: Optional[int]) -> None:
+        run_id = event.run_id
+        step_key = check.not_none(event.get_dagster_event().step_key)
+        update_statement = (
+            RunStepStatsTable.update()
+            .where(
+                db.and_(
+                    RunStepStatsTable.c.run_id == run_id,
+                    RunStepStatsTable.c.step_key == step_key,
+                )
+            )
+            .values(first_event_id=self._first_event_id_value(event_id))
+        )
+        with self.run_connection(run_id) as conn:
+            if conn.execute(update_statement).rowcount:
+                return
 
         try:
-            records = [deserialize_value(json_str, EventLogEntry) for (json_str,) in results]
-            return build_run_step_stats_from_events(run_id, records)
+            with self.run_connection(run_id) as conn:
+                conn.execute(
+                    RunStepStatsTable.insert().values(
+                        run_id=run_id,
+                        step_key=step_key,
+                        first_event_id=event_id,
+                        stats_body=serialize_value(RunStepStatsRollup(run_id, step_key)),
+                        version=0,
+                    )
+                )
+        except db_exc.IntegrityError:
+            # the row was inserted concurrently
+            with self.run_connection(run_id) as conn:
+                conn.execute(update_statement)
+
+    def _update_run_step_stats_rollup(self, event: EventLogEntry, event_id: Optional[int]) -> None:
+        run_id = event.run_id
+        step_key = check.not_none(event.get_dagster_event().step_key)
+
+        # each update is a read-modify-write of the step's row, which is retried if the row was
+        # changed or inserted concurrently, e.g. by the orchestrator and the step worker. These are
+        # the handful of lifecycle, retry and marker events of each step.
+        for _ in range(MAX_STEP_STATS_UPDATE_ATTEMPTS):
+            with self.run_connection(run_id) as conn:
+                row = conn.execute(
+                    db_select(
+                        [
+                            RunStepStatsTable.c.id,
+                            RunStepStatsTable.c.stats_body,
+                            RunStepStatsTable.c.version,
+                        ]
+                    ).where(
+                        db.and_(
+                            RunStepStatsTable.c.run_id == run_id,
+                            RunStepStatsTable.c.step_key == step_key,
+                        )
+                    )
+                ).fetchone()
+
+            if row:
+                row_id, stats_body, version = row
+                rollup = deserialize_value(stats_body, RunStepStatsRollup)
+            else:
+                row_id, version = None, 0
+                rollup = RunStepStatsRollup(run_id, step_key)
+
+            updated = rollup.with_event(event)
+            if updated == rollup:
+                return
+
+            values: Dict[str, Any] = dict(
+                status=updated.status.value if updated.status else None,
+                stats_body=serialize_value(updated),
+                version=version + 1,
+            )
+
+            if row_id is None:
+                if updated.has_stats:
+                    values["first_event_id"] = event_id
+                try:
+                    with self.run_connection(run_id) as conn:
+                        conn.execute(
+                            RunStepStatsTable.insert().values(
+                                run_id=run_id, step_key=step_key, **values
+                            )
+                        )
+                    return
+                except db_exc.IntegrityError:
+                    continue
+
+            if updated.has_stats:
+                values["first_event_id"] = self._first_event_id_value(event_id)
+            with self.run_connection(run_id) as conn:
+                if conn.execute(
+                    RunStepStatsTable.update()
+                    .where(
+                        db.and_(
+                            RunStepStatsTable.c.id == row_id,
+                            RunStepStatsTable.c.version == version,
+                        )
+                    )
+                    .values(**values)
+                ).rowcount:
+                    return
+
+        # rather than lose the update, have the next read rebuild the run's rollups from its events
+        logging.warning(
+            f"Could not update the stats for step {step_key} of run {run_id} after"
+            f" {MAX_STEP_STATS_UPDATE_ATTEMPTS} attempts due to concurrent updates. The stats for"
+            " the run will be rebuilt from its events."
+        )
+        self._flag_stats_rollups_for_rebuild(run_id)
+
+    def rebuild_stats_rollups_for_run(self, run_id: str) -> None:
+        """Rebuilds the run stats and step stats rollups for a run from its stored events."""
+        check.str_param(run_id, "run_id")
+
+        counts, times = self._get_run_stats_by_event_type(run_id)
+        run_stats_values: Dict[str, Any] = {}
+        for event_type, column_name in RUN_STATS_COUNT_COLUMNS.items():
+            run_stats_values[column_name] = counts.get(event_type.value, 0)
+        for event_type, column_name in RUN_STATS_TIME_COLUMNS.items():
+            timestamp = times.get(event_type.value)
+            if timestamp and (
+                run_stats_values.get(column_name) is None
+                or run_stats_values[column_name] < timestamp
+            ):
+                run_stats_values[column_name] = timestamp
+
+        rollups: Dict[str, RunStepStatsRollup] = {}
+        first_event_ids: Dict[str, int] = {}
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(
+                self._step_stats_event_query(
+                    run_id,
+                    None,
+                    [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+                )
+            ).fetchall()
+
+        try:
+            for record_id, json_str in results:
+                event = deserialize_value(json_str, EventLogEntry)
+                step_key = check.not_none(event.get_dagster_event().step_key)
+                rollup = rollups.get(step_key) or RunStepStatsRollup(run_id, step_key)
+                rollups[step_key] = rollup.with_event(event)
+                if rollups[step_key].has_stats and step_key not in first_event_ids:
+                    first_event_ids[step_key] = record_id
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+        with self.run_connection(run_id) as conn:
+            self._delete_stats_rollups_for_run(conn, run_id)
+            conn.execute(RunStatsTable.insert().values(run_id=run_id, **run_stats_values))
+            if rollups:
+                conn.execute(
+                    RunStepStatsTable.insert(),
+                    [
+                        dict(
+                            run_id=run_id,
+                            step_key=step_key,
+                            status=rollup.status.value if rollup.status else None,
+                            first_event_id=first_event_ids.get(step_key),
+                            stats_body=serialize_value(rollup),
+                            version=0,
+                        )
+                        for step_key, rollup in rollups.items()
+                    ],
+                )
+
+    def _delete_stats_rollups_for_run(self, conn: Connection, run_id: str) -> None:
+        conn.execute(RunStatsTable.delete().where(RunStatsTable.c.run_id == run_id))
+        conn.execute(RunStepStatsTable.delete().where(RunStepStatsTable.c.run_id == run_id))
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -633,8 +1127,29 @@ def _apply_migration(self, migration_name, migration_fn, print_fn, force):
 
     def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the event_log table."""
-        for migration_name, migration_fn in EVENT_LOG_DATA_MIGRATIONS.items():
-            self._apply_migration(migration_name, migration_fn, print_fn, force)
+        self._apply_event_log_data_migrations(EVENT_LOG_DATA_MIGRATIONS.keys(), print_fn, force)
+
+    def _apply_event_log_data_migrations(
+        self,
+        migration_names: Iterable[str],
+        print_fn: Optional[PrintFn] = None,
+        force: bool = False,
+    ) -> None:
+        self._reset_stats_rollup_tables_cache()
+        for migration_name in migration_names:
+            if migration_name == RUN_STATS_ROLLUPS and not self._can_build_stats_rollups():
+                if print_fn:
+                    print_fn(
+                        f"Skipping data migration: {migration_name}, which requires a schema"
+                        " migration. Run `dagster instance migrate` first."
+                    )
+                continue
+            self._apply_migration(
+                migration_name, EVENT_LOG_DATA_MIGRATIONS[migration_name], print_fn, force
+            )
+
+    def _reset_stats_rollup_tables_cache(self) -> None:
+        self._stats_rollup_tables_exist = None
 
     def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the asset_keys table."""
@@ -666,6 +1181,12 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
+            if self.has_table("run_step_stats"):
+                conn.execute(RunStepStatsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -688,9 +1209,18 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_stats"):
+                conn.execute(RunStatsTable.delete())
+
+            if self.has_table("run_step_stats"):
+                conn.execute(RunStepStatsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
+        has_stats_rollup_tables = self._has_stats_rollup_tables(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+            if has_stats_rollup_tables:
+                self._delete_stats_rollups_for_run(conn, run_id)
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
         self.free_concurrency_slots_for_run(run_id)
@@ -701,6 +1231,77 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
             SqlEventLogStorageTable.delete().where(SqlEventLogStorageTable.c.run_id == run_id)
         )
 
+    @property
+    def supports_event_log_retention(self) -> bool:
+        return True
+
+    def get_purgeable_records_for_run(
+        self,
+        run_id: str,
+        event_types: Set[DagsterEventType],
+        include_log_messages: bool,
+        limit: int,
+    ) -> Sequence[EventLogRecord]:
+        check.str_param(run_id, "run_id")
+        check.set_param(event_types, "event_types", of_type=DagsterEventType)
+        check.bool_param(include_log_messages, "include_log_messages")
+        check.int_param(limit, "limit")
+
+        if self.has_stats_rollups(run_id):
+            # once purged, the events can no longer be used to rebuild the rollups
+            self._rebuild_stats_rollups_if_needed(run_id)
+        else:
+            # run and step stats are computed from the events themselves
+            event_types = event_types - set(STEP_STATS_EVENT_TYPES)
+
+        type_conditions = []
+        if event_types:
+            type_conditions.append(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in event_types]
+                )
+            )
+        if include_log_messages:
+            type_conditions.append(SqlEventLogStorageTable.c.dagster_event_type.is_(None))
+        if not type_conditions:
+            return []
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(db.or_(*type_conditions))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(limit)
+        )
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            return [
+                EventLogRecord(
+                    storage_id=record_id,
+                    event_log_entry=deserialize_value(json_str, EventLogEntry),
+                )
+                for record_id, json_str in results
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def delete_event_records(self, run_id: str, storage_ids: Sequence[int]) -> None:
+        check.str_param(run_id, "run_id")
+        check.sequence_param(storage_ids, "storage_ids", of_type=int)
+        if not storage_ids:
+            return
+
+        # purged events are never mirrored to the asset index tables, so only the run's own
+        # event log needs to be updated
+        with self.run_connection(run_id) as conn:
+            conn.execute(
+                SqlEventLogStorageTable.delete()
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.id.in_(storage_ids))
+            )
+
     @property
     def is_persistent(self) -> bool:
         return True
@@ -893,17 +1494,13 @@ def _apply_tags_table_joins(
             )
         return table
 
-    def get_event_records(
+    def _get_event_records_query(
         self,
+        columns: Sequence[Any],
         event_records_filter: EventRecordsFilter,
-        limit: Optional[int] = None,
-        ascending: bool = False,
-    ) -> Sequence[EventLogRecord]:
-        """Returns a list of (record_id, record)."""
-        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
-        check.opt_int_param(limit, "limit")
-        check.bool_param(ascending, "ascending")
-
+        limit: Optional[int],
+        ascending: bool,
+    ) -> SqlAlchemyQuery:
         if event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
         else:
@@ -920,9 +1517,7 @@ def get_event_records(
         else:
             table = SqlEventLogStorageTable
 
-        query = db_select(
-            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
-        ).select_from(table)
+        query = db_select(columns).select_from(table)
 
         query = self._apply_filter_to_query(
             query=query,
@@ -937,6 +1532,26 @@ def get_event_records(
         else:
             query = query.order_by(SqlEventLogStorageTable.c.id.desc())
 
+        return query
+
+    def get_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[EventLogRecord]:
+        """Returns a list of (record_id, record)."""
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+
+        query = self._get_event_records_query(
+            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event],
+            event_records_filter,
+            limit,
+            ascending,
+        )
+
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
@@ -972,6 +1587,28 @@ def get_event_records(
 
         return event_records
 
+    def get_event_record_views(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[EventLogRecordView]:
+        check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+        check.bool_param(ascending, "ascending")
+
+        if event_records_filter.tags and not self.has_table(AssetEventTagsTable.name):
+            # tags can only be filtered on the deserialized events without the tags table
+            return super().get_event_record_views(event_records_filter, limit, ascending)
+
+        query = self._get_event_records_query(
+            RECORD_VIEW_COLUMNS, event_records_filter, limit, ascending
+        )
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        return [_record_view_from_row(row) for row in results]
+
     def supports_event_consumer_queries(self) -> bool:
         return True
 
@@ -1762,17 +2399,19 @@ def _latest_event_ids_by_partition_subquery(
         if after_cursor is not None:
             query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
 
+        # with a single asset key, the wipe filter is a plain bound on the event timestamp, which
+        # lets storages that partition events by timestamp skip the partitions before the wipe
+        [asset_details] = self._get_assets_details([asset_key])
+        if asset_details and asset_details.last_wipe_timestamp:
+            query = query.where(
+                SqlEventLogStorageTable.c.timestamp
+                > datetime.utcfromtimestamp(asset_details.last_wipe_timestamp)
+            )
+
         latest_event_ids_subquery = query.group_by(
             SqlEventLogStorageTable.c.dagster_event_type, SqlEventLogStorageTable.c.partition
         )
-
-        assets_details = self._get_assets_details([asset_key])
-        return db_subquery(
-            self._add_assets_wipe_filter_to_query(
-                latest_event_ids_subquery, assets_details, [asset_key]
-            ),
-            "latest_event_ids_by_partition_subquery",
-        )
+        return db_subquery(latest_event_ids_subquery, "latest_event_ids_by_partition_subquery")
 
     def get_latest_storage_id_by_partition(
         self, asset_key: AssetKey, event_type: DagsterEventType
@@ -2704,6 +3343,29 @@ def supports_asset_checks(self):
         return self.has_table(AssetCheckExecutionsTable.name)
 
 
+def _record_view_from_row(row: SqlAlchemyRow) -> EventLogRecordView:
+    (
+        storage_id,
+        run_id,
+        dagster_event_type,
+        step_key,
+        timestamp,
+        asset_key,
+        partition,
+        json_str,
+    ) = row
+    return EventLogRecordView(
+        storage_id=storage_id,
+        run_id=run_id,
+        timestamp=datetime_as_float(timestamp),
+        dagster_event_type=DagsterEventType(dagster_event_type) if dagster_event_type else None,
+        step_key=step_key,
+        asset_key=AssetKey.from_db_string(asset_key),
+        partition_key=partition,
+        load_event_log_entry=lambda: deserialize_value(json_str, EventLogEntry),
+    )
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -122,6 +122,7 @@ def upgrade(self):
         alembic_config = get_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._reset_stats_rollup_tables_cache()
 
     def has_secondary_index(self, name):
         if name not in self._secondary_index_cache:
@@ -8,7 +8,16 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -24,11 +33,17 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvariantViolationError
-from dagster._core.event_api import EventHandlerFn
+from dagster._core.event_api import EventHandlerFn, EventLogRecordView
 from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, EVENT_TYPE_TO_PIPELINE_RUN_STATUS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster._core.storage.event_log.base import (
+    DEFAULT_EVENT_RECORDS_PAGE_SIZE,
+    EventLogCursor,
+    EventLogRecord,
+    EventLogStorage,
+    EventRecordsFilter,
+)
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -47,7 +62,13 @@
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..migration import EVENT_LOG_DATA_MIGRATIONS, RUN_STATS_ROLLUPS
+from ..schema import (
+    RunStatsTable,
+    RunStepStatsTable,
+    SqlEventLogStorageMetadata,
+    SqlEventLogStorageTable,
+)
 from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
 
 if TYPE_CHECKING:
@@ -99,11 +120,21 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        # Whether each run shard has the stats rollup tables, since shards are migrated separately
+        self._stats_rollup_shards: Dict[str, bool] = {}
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
             self._initdb(engine)
-            self.reindex_events()
+            if self.get_all_run_ids():
+                # backfilling the stats rollups reads every event of every run, and requires the
+                # run shards to be migrated, so it is left to `dagster instance reindex`
+                self._apply_event_log_data_migrations(
+                    [name for name in EVENT_LOG_DATA_MIGRATIONS if name != RUN_STATS_ROLLUPS]
+                )
+            else:
+                self.reindex_events()
             self.reindex_assets()
 
         super().__init__()
@@ -122,6 +153,7 @@ def upgrade(self) -> None:
             run_alembic_upgrade(alembic_config, conn, "index")
 
         self._initialized_dbs = set()
+        self._reset_stats_rollup_tables_cache()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -151,6 +183,27 @@ def has_table(self, table_name: str) -> bool:
         with engine.connect() as conn:
             return bool(engine.dialect.has_table(conn, table_name))
 
+    def _has_stats_rollup_tables(self, run_id: Optional[str]) -> bool:
+        if run_id is None:
+            return super()._has_stats_rollup_tables(run_id)
+
+        if run_id not in self._stats_rollup_shards:
+            with self.run_connection(run_id) as conn:
+                self._stats_rollup_shards[run_id] = bool(
+                    conn.dialect.has_table(conn, RunStatsTable.name)
+                    and conn.dialect.has_table(conn, RunStepStatsTable.name)
+                )
+        return self._stats_rollup_shards[run_id]
+
+    def _can_build_stats_rollups(self) -> bool:
+        return self._has_stats_rollup_tables(None) and all(
+            self._has_stats_rollup_tables(run_id) for run_id in self.get_all_run_ids()
+        )
+
+    def _reset_stats_rollup_tables_cache(self) -> None:
+        super()._reset_stats_rollup_tables_cache()
+        self._stats_rollup_shards = {}
+
     def path_for_shard(self, run_id: str) -> str:
         return os.path.join(self._base_dir, f"{run_id}.db")
 
@@ -235,7 +288,10 @@ def store_event(self, event: EventLogEntry) -> None:
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            result = conn.execute(insert_event_statement)
+            run_event_id = result.inserted_primary_key[0]
+
+        self.update_stats_rollups(event, run_event_id)
 
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
@@ -359,12 +415,43 @@ def get_event_records(
 
         return event_records[:limit]
 
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        ascending: bool = True,
+        page_size: int = DEFAULT_EVENT_RECORDS_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[EventLogRecord]:
+        if event_records_filter.event_type in ASSET_EVENTS:
+            return super().iterate_event_records(
+                event_records_filter, ascending, page_size, prefetch
+            )
+
+        # storage ids are not unique across run shards, so cross-run queries of other events
+        # cannot be paginated by storage id and are fetched shard by shard instead
+        return iter(self.get_event_records(event_records_filter, ascending=ascending))
+
+    def get_event_record_views(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[EventLogRecordView]:
+        if event_records_filter.event_type in ASSET_EVENTS:
+            return super().get_event_record_views(event_records_filter, limit, ascending)
+
+        # cross-run queries of other events go through the run shards, see get_event_records
+        return EventLogStorage.get_event_record_views(self, event_records_filter, limit, ascending)
+
     def supports_event_consumer_queries(self) -> bool:
         return False
 
     def delete_events(self, run_id: str) -> None:
+        has_stats_rollup_tables = self._has_stats_rollup_tables(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+            if has_stats_rollup_tables:
+                self._delete_stats_rollups_for_run(conn, run_id)
 
         # delete the mirrored event in the cross-run index database
         with self.index_connection() as conn:
@@ -386,6 +473,7 @@ def wipe(self) -> None:
                     os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._reset_stats_rollup_tables_cache()
         self._wipe_index()
 
     def _delete_mirrored_events_for_asset_key(self, asset_key: AssetKey) -> None:
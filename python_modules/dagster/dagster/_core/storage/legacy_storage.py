@@ -1,6 +1,7 @@
 from typing import (
     TYPE_CHECKING,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -15,7 +16,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.definitions.auto_materialize_rule import AutoMaterializeAssetEvaluation
 from dagster._core.definitions.events import AssetKey
-from dagster._core.event_api import EventHandlerFn
+from dagster._core.event_api import EventHandlerFn, EventLogRecordView
 from dagster._core.storage.asset_check_execution_record import (
     AssetCheckExecutionRecord,
 )
@@ -25,6 +26,7 @@
 
 from .base_storage import DagsterStorage
 from .event_log.base import (
+    DEFAULT_EVENT_RECORDS_PAGE_SIZE,
     AssetRecord,
     EventLogConnection,
     EventLogRecord,
@@ -60,6 +62,7 @@
         RunPartitionData,
         RunRecord,
         RunsFilter,
+        RunSummary,
         TagBucket,
     )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -193,6 +196,9 @@ def from_config_value(
     def add_run(self, dagster_run: "DagsterRun") -> "DagsterRun":
         return self._storage.run_storage.add_run(dagster_run)
 
+    def add_runs(self, dagster_runs: Sequence["DagsterRun"]) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.add_runs(dagster_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -232,6 +238,18 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_summaries(
+        self,
+        filters: Optional["RunsFilter"] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence["RunSummary"]:
+        return self._storage.run_storage.get_run_summaries(
+            filters, limit, order_by, ascending, cursor
+        )
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -396,6 +414,25 @@ def get_logs_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def iterate_records_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        page_size: int = DEFAULT_EVENT_RECORDS_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[EventLogRecord]:
+        return self._storage.event_log_storage.iterate_records_for_run(
+            run_id, of_type, page_size, prefetch
+        )
+
+    def get_record_views_for_run(
+        self,
+        run_id: str,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        step_keys: Optional[Sequence[str]] = None,
+    ) -> Sequence[EventLogRecordView]:
+        return self._storage.event_log_storage.get_record_views_for_run(run_id, of_type, step_keys)
+
     def get_stats_for_run(self, run_id: str) -> "DagsterRunStatsSnapshot":
         return self._storage.event_log_storage.get_stats_for_run(run_id)
 
@@ -410,6 +447,24 @@ def store_event(self, event: "EventLogEntry") -> None:
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
+    @property
+    def supports_event_log_retention(self) -> bool:
+        return self._storage.event_log_storage.supports_event_log_retention
+
+    def get_purgeable_records_for_run(
+        self,
+        run_id: str,
+        event_types: Set["DagsterEventType"],
+        include_log_messages: bool,
+        limit: int,
+    ) -> Sequence[EventLogRecord]:
+        return self._storage.event_log_storage.get_purgeable_records_for_run(
+            run_id, event_types, include_log_messages, limit
+        )
+
+    def delete_event_records(self, run_id: str, storage_ids: Sequence[int]) -> None:
+        return self._storage.event_log_storage.delete_event_records(run_id, storage_ids)
+
     def upgrade(self) -> None:
         return self._storage.event_log_storage.upgrade()
 
@@ -452,6 +507,27 @@ def get_event_records(
             event_records_filter, limit, ascending  # type: ignore
         )
 
+    def iterate_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        ascending: bool = True,
+        page_size: int = DEFAULT_EVENT_RECORDS_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[EventLogRecord]:
+        return self._storage.event_log_storage.iterate_event_records(
+            event_records_filter, ascending, page_size, prefetch
+        )
+
+    def get_event_record_views(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[EventLogRecordView]:
+        return self._storage.event_log_storage.get_event_record_views(
+            event_records_filter, limit, ascending
+        )
+
     def get_asset_records(
         self, asset_keys: Optional[Sequence["AssetKey"]] = None
     ) -> Iterable[AssetRecord]:
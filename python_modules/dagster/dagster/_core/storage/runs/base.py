@@ -13,6 +13,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummary,
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
@@ -53,6 +54,17 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             dagster_run (DagsterRun): The run to add.
         """
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        """Add a batch of runs to storage.
+
+        Storages that can write several runs at once should override this, by default each run is
+        added in turn.
+
+        Args:
+            dagster_runs (Sequence[DagsterRun]): The runs to add.
+        """
+        return [self.add_run(dagster_run) for dagster_run in dagster_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         """Update run storage in accordance to a pipeline run related DagsterEvent.
@@ -155,6 +167,40 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_summaries(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunSummary]:
+        """Return a list of run summaries stored in the run storage, sorted by the given column in
+        given order. Run summaries hold the columns shown in run list views, and can be read
+        without loading each full run.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+            cursor (Optional[str]): The run id of the run after which to start returning runs.
+
+        Returns:
+            List[RunSummary]: List of run summaries stored in the run storage.
+        """
+        return [
+            RunSummary.from_run_record(run_record)
+            for run_record in self.get_run_records(
+                filters=filters,
+                limit=limit,
+                order_by=order_by,
+                ascending=ascending,
+                cursor=cursor,
+            )
+        ]
+
     @abstractmethod
     def get_run_tags(
         self,
@@ -15,7 +15,13 @@
 from ..dagster_run import DagsterRun, DagsterRunStatus, RunRecord
 from ..runs.base import RunStorage
 from ..runs.schema import BulkActionsTable, RunsTable, RunTagsTable
-from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
+from ..tags import (
+    BACKFILL_ID_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    REPOSITORY_LABEL_TAG,
+    ROOT_RUN_ID_TAG,
+)
 
 RUN_PARTITIONS = "run_partitions"
 RUN_START_END = (  # was run_start_end, but renamed to overwrite bad timestamps written
@@ -23,6 +29,7 @@
 )
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+RUN_SUMMARY_COLUMNS = "run_summary_columns"
 
 PrintFn: TypeAlias = Callable[[Any], None]
 MigrationFn: TypeAlias = Callable[[RunStorage, Optional[PrintFn]], None]
@@ -36,6 +43,14 @@
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
     RUN_START_END: lambda: migrate_run_start_end,
+    RUN_SUMMARY_COLUMNS: lambda: migrate_run_summary_columns,
+}
+
+# run tags that are denormalized into columns of the runs table
+RUN_SUMMARY_TAG_COLUMNS: Final[Mapping[str, str]] = {
+    BACKFILL_ID_TAG: "backfill_id",
+    REPOSITORY_LABEL_TAG: "repository_label",
+    ROOT_RUN_ID_TAG: "root_run_id",
 }
 
 CHUNK_SIZE = 100
@@ -155,6 +170,55 @@ def add_run_stats(run_storage: RunStorage, run_id: str) -> None:
         )
 
 
+def get_run_summary_column_values(tags: Mapping[str, str]) -> Mapping[str, Optional[str]]:
+    return {column: tags.get(tag) for tag, column in RUN_SUMMARY_TAG_COLUMNS.items()}
+
+
+def migrate_run_summary_columns(
+    run_storage: RunStorage, print_fn: Optional[PrintFn] = None
+) -> None:
+    """Utility method to populate the denormalized run summary columns of existing runs from their
+    tags.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    base_query = (
+        db_select([RunsTable.c.run_body, RunsTable.c.id])
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for row in rows:
+                run = deserialize_value(cast(str, row[0]), DagsterRun)
+                storage_id = row[1]
+                conn.execute(
+                    RunsTable.update()
+                    .values(**get_run_summary_column_values(run.tags_for_storage()))
+                    .where(RunsTable.c.id == storage_id)
+                )
+                cursor = storage_id
+
+
 def migrate_run_repo_tags(run_storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
     from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 
@@ -44,6 +44,11 @@
     # columns in favor of DateTime / Timestamp columns.
     db.Column("start_time", db.Float),
     db.Column("end_time", db.Float),
+    # Denormalized from the run tags, so that run list views can filter on the most commonly
+    # queried tags without joining against run_tags once per tag.
+    db.Column("backfill_id", db.String(255)),
+    db.Column("repository_label", db.Text),
+    db.Column("root_run_id", db.String(255)),
 )
 
 # Secondary Index migration table, used to track data migrations, both for event_logs and runs.
@@ -90,6 +95,19 @@
     db.Column("snapshot_type", db.String(63), nullable=False),
 )
 
+SnapshotChunksTable = db.Table(
+    "snapshot_chunks",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("chunk_id", db.String(255), unique=True, nullable=False),
+    db.Column("chunk_body", db.LargeBinary, nullable=False),
+)
+
 DaemonHeartbeatsTable = db.Table(
     "daemon_heartbeats",
     RunStorageSqlMetadata,
@@ -157,6 +175,26 @@
         "pipeline_name": 255,
     },
 )
+db.Index(
+    "idx_runs_by_job_status",
+    RunsTable.c.pipeline_name,
+    RunsTable.c.status,
+    RunsTable.c.id,
+    mysql_length={
+        "pipeline_name": 255,
+        "status": 32,
+    },
+)
+db.Index("idx_runs_by_backfill_id", RunsTable.c.backfill_id, RunsTable.c.id)
+db.Index(
+    "idx_runs_by_repository_label",
+    RunsTable.c.repository_label,
+    RunsTable.c.id,
+    mysql_length={
+        "repository_label": 255,
+    },
+)
+db.Index("idx_runs_by_root_run_id", RunsTable.c.root_run_id, RunsTable.c.id)
 db.Index("idx_bulk_actions", BulkActionsTable.c.key, mysql_length=32)
 db.Index("idx_bulk_actions_status", BulkActionsTable.c.status, mysql_length=32)
 db.Index("idx_bulk_actions_action_type", BulkActionsTable.c.action_type, mysql_length=32)
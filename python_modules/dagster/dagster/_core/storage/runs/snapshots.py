@@ -0,0 +1,117 @@
+"""Content-addressed storage of job and execution plan snapshots.
+
+Snapshots of different jobs in the same code location, and execution plans of different runs of
+the same job, share large substructures (the config schema, the type namespace, the op
+definitions, and the plan steps). When stored chunked, these substructures are split out
+of the serialized snapshot into chunks that are keyed by the hash of their contents, so each
+distinct chunk is stored once, and the snapshot body only holds a manifest that references them.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Mapping, Optional, Set, Tuple, TypeVar
+
+from dagster._serdes.utils import hash_str
+
+SNAPSHOT_MANIFEST_KEY = "__snapshot_manifest__"
+SNAPSHOT_CHUNK_KEY = "__snapshot_chunk__"
+
+_MANIFEST_PREFIX = f'{{"{SNAPSHOT_MANIFEST_KEY}": '
+_CHUNK_REF_PATTERN = re.compile(r'\{"' + SNAPSHOT_CHUNK_KEY + r'": "([0-9a-f]+)"\}')
+
+# top-level fields of the serialized snapshots that are each stored as a chunk. Chunking at a
+# finer grain, e.g. per plan step, makes the manifests of references grow with the snapshot, and
+# chunk ids do not compress
+CHUNKED_SNAPSHOT_FIELDS = {
+    # JobSnapshot
+    "config_schema_snapshot",
+    "dagster_type_namespace_snapshot",
+    "solid_definitions_snapshot",
+    "dep_structure_snapshot",
+    "mode_def_snaps",
+    # ExecutionPlanSnapshot
+    "steps",
+    "repository_load_data",
+}
+
+DEFAULT_SNAPSHOT_CACHE_SIZE = 32
+
+
+def _chunk_ref(value: Any, chunks: Dict[str, str]) -> Mapping[str, str]:
+    chunk_body = json.dumps(value)
+    chunk_id = hash_str(chunk_body)
+    chunks[chunk_id] = chunk_body
+    return {SNAPSHOT_CHUNK_KEY: chunk_id}
+
+
+def split_serialized_snapshot(serialized_snapshot: str) -> Tuple[str, Mapping[str, str]]:
+    """Splits a serialized snapshot into a manifest and the chunks it references, keyed by chunk
+    id.
+    """
+    fields = json.loads(serialized_snapshot)
+    chunks: Dict[str, str] = {}
+    manifest = {}
+    for name, value in fields.items():
+        if name in CHUNKED_SNAPSHOT_FIELDS and value is not None:
+            manifest[name] = _chunk_ref(value, chunks)
+        else:
+            manifest[name] = value
+
+    return json.dumps({SNAPSHOT_MANIFEST_KEY: manifest}), chunks
+
+
+def is_snapshot_manifest(snapshot_body: str) -> bool:
+    return snapshot_body.startswith(_MANIFEST_PREFIX)
+
+
+def get_snapshot_manifest_chunk_ids(manifest_body: str) -> Set[str]:
+    return set(_CHUNK_REF_PATTERN.findall(manifest_body))
+
+
+def join_serialized_snapshot(manifest_body: str, chunks: Mapping[str, str]) -> str:
+    """Reassembles the serialized snapshot from its manifest and the chunks it references."""
+    # splice the chunks into the manifest text rather than parsing and re-serializing the whole
+    # snapshot. Quotes within json strings are escaped, so a chunk reference can only match as a
+    # json object
+    return _CHUNK_REF_PATTERN.sub(
+        lambda match: chunks[match.group(1)], manifest_body[len(_MANIFEST_PREFIX) : -1]
+    )
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class SnapshotCache(Generic[K, V]):
+    """A thread-safe, bounded, least-recently-used cache. Snapshots are immutable once stored, so
+    they can be cached by id for the lifetime of the storage.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SNAPSHOT_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
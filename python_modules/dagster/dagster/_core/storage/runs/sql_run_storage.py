@@ -71,6 +71,7 @@
     RunPartitionData,
     RunRecord,
     RunsFilter,
+    RunSummary,
     TagBucket,
 )
 from .base import RunStorage
@@ -78,7 +79,10 @@
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
     RUN_PARTITIONS,
+    RUN_SUMMARY_COLUMNS,
+    RUN_SUMMARY_TAG_COLUMNS,
     MigrationFn,
+    get_run_summary_column_values,
 )
 from .schema import (
     BulkActionsTable,
@@ -88,8 +92,16 @@
     RunsTable,
     RunTagsTable,
     SecondaryIndexMigrationTable,
+    SnapshotChunksTable,
     SnapshotsTable,
 )
+from .snapshots import (
+    SnapshotCache,
+    get_snapshot_manifest_chunk_ids,
+    is_snapshot_manifest,
+    join_serialized_snapshot,
+    split_serialized_snapshot,
+)
 
 
 class SnapshotType(Enum):
@@ -129,18 +141,11 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
                 f"Snapshot {dagster_run.job_snapshot_id} does not exist in run storage"
             )
 
-        has_tags = dagster_run.tags and len(dagster_run.tags) > 0
-        partition = dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
-        partition_set = dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None
-
+        tags_to_insert = dagster_run.tags_for_storage()
         runs_insert = RunsTable.insert().values(
-            run_id=dagster_run.run_id,
-            pipeline_name=dagster_run.job_name,
-            status=dagster_run.status.value,
-            run_body=serialize_value(dagster_run),
-            snapshot_id=dagster_run.job_snapshot_id,
-            partition=partition,
-            partition_set=partition_set,
+            **self._get_run_insert_values(
+                dagster_run, tags_to_insert, has_run_summary_cols=self.has_run_summary_cols()
+            )
         )
         with self.connect() as conn:
             try:
@@ -148,7 +153,6 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             except db_exc.IntegrityError as exc:
                 raise DagsterRunAlreadyExists from exc
 
-            tags_to_insert = dagster_run.tags_for_storage()
             if tags_to_insert:
                 conn.execute(
                     RunTagsTable.insert(),
@@ -160,6 +164,73 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
 
         return dagster_run
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        check.sequence_param(dagster_runs, "dagster_runs", of_type=DagsterRun)
+        if not dagster_runs:
+            return []
+
+        # check that every referenced snapshot exists with a single query
+        snapshot_ids = {run.job_snapshot_id for run in dagster_runs if run.job_snapshot_id}
+        if snapshot_ids:
+            rows = self.fetchall(
+                db_select([SnapshotsTable.c.snapshot_id]).where(
+                    SnapshotsTable.c.snapshot_id.in_(snapshot_ids)
+                )
+            )
+            missing_snapshot_ids = snapshot_ids - {row["snapshot_id"] for row in rows}
+            if missing_snapshot_ids:
+                raise DagsterSnapshotDoesNotExist(
+                    f"Snapshot {sorted(missing_snapshot_ids)[0]} does not exist in run storage"
+                )
+
+        has_run_summary_cols = self.has_run_summary_cols()
+        runs_values = []
+        tags_values = []
+        for dagster_run in dagster_runs:
+            tags_to_insert = dagster_run.tags_for_storage()
+            runs_values.append(
+                self._get_run_insert_values(
+                    dagster_run, tags_to_insert, has_run_summary_cols=has_run_summary_cols
+                )
+            )
+            tags_values.extend(
+                dict(run_id=dagster_run.run_id, key=k, value=v) for k, v in tags_to_insert.items()
+            )
+
+        with self.connect() as conn:
+            try:
+                conn.execute(RunsTable.insert(), runs_values)
+            except db_exc.IntegrityError as exc:
+                raise DagsterRunAlreadyExists from exc
+
+            if tags_values:
+                conn.execute(RunTagsTable.insert(), tags_values)
+
+        return dagster_runs
+
+    def _get_run_insert_values(
+        self,
+        dagster_run: DagsterRun,
+        tags_to_insert: Mapping[str, str],
+        has_run_summary_cols: bool,
+    ) -> Dict[str, Any]:
+        has_tags = dagster_run.tags and len(dagster_run.tags) > 0
+        partition = dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
+        partition_set = dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None
+
+        values: Dict[str, Any] = dict(
+            run_id=dagster_run.run_id,
+            pipeline_name=dagster_run.job_name,
+            status=dagster_run.status.value,
+            run_body=serialize_value(dagster_run),
+            snapshot_id=dagster_run.job_snapshot_id,
+            partition=partition,
+            partition_set=partition_set,
+        )
+        if has_run_summary_cols:
+            values.update(get_run_summary_column_values(tags_to_insert))
+        return values
+
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
@@ -292,8 +363,22 @@ def _runs_query(
         if columns is None:
             columns = ["run_body", "status"]
 
-        if filters.tags:
-            table = self._apply_tags_table_joins(RunsTable, filters.tags)
+        # tags that are denormalized into columns of the runs table are filtered on directly,
+        # instead of joining against run_tags once per tag
+        column_tags = {}
+        join_tags = filters.tags
+        if filters.tags and self._has_run_summary_tag_columns():
+            column_tags = {
+                key: value for key, value in filters.tags.items() if key in RUN_SUMMARY_TAG_COLUMNS
+            }
+            join_tags = {
+                key: value
+                for key, value in filters.tags.items()
+                if key not in RUN_SUMMARY_TAG_COLUMNS
+            }
+
+        if join_tags:
+            table = self._apply_tags_table_joins(RunsTable, join_tags)
         else:
             table = RunsTable
 
@@ -301,8 +386,17 @@ def _runs_query(
             table
         )
         base_query = self._add_filters_to_query(base_query, filters)
+        for key, value in column_tags.items():
+            column = RunsTable.c[RUN_SUMMARY_TAG_COLUMNS[key]]
+            base_query = base_query.where(
+                column == value if isinstance(value, str) else column.in_(value)
+            )
         return self._add_cursor_limit_to_query(base_query, cursor, limit, order_by, ascending)
 
+    def _has_run_summary_tag_columns(self) -> bool:
+        # the columns can only be filtered on once they have been populated for existing runs
+        return self.has_built_index(RUN_SUMMARY_COLUMNS) and self.has_run_summary_cols()
+
     def _apply_tags_table_joins(
         self,
         table: db.Table,
@@ -353,7 +447,7 @@ def get_run_ids(
         return [row["run_id"] for row in rows]
 
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
-        subquery = db_subquery(self._runs_query(filters=filters))
+        subquery = db_subquery(self._runs_query(filters=filters, columns=["id"]))
         query = db_select([db.func.count().label("count")]).select_from(subquery)
         row = self.fetchone(query)
         count = row["count"] if row else 0
@@ -410,6 +504,60 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_summaries(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunSummary]:
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+        check.opt_int_param(limit, "limit")
+
+        if not (self.has_run_stats_index_cols() and self._has_run_summary_tag_columns()):
+            return super().get_run_summaries(filters, limit, order_by, ascending, cursor)
+
+        query = self._runs_query(
+            filters=filters,
+            limit=limit,
+            columns=[
+                "id",
+                "run_id",
+                "pipeline_name",
+                "status",
+                "partition",
+                "partition_set",
+                *RUN_SUMMARY_TAG_COLUMNS.values(),
+                "create_timestamp",
+                "update_timestamp",
+                "start_time",
+                "end_time",
+            ],
+            order_by=order_by,
+            ascending=ascending,
+            cursor=cursor,
+        )
+        rows = self.fetchall(query)
+        return [
+            RunSummary(
+                storage_id=check.int_param(row["id"], "id"),
+                run_id=row["run_id"],
+                job_name=row["pipeline_name"],
+                status=DagsterRunStatus(row["status"]),
+                partition=row["partition"],
+                partition_set=row["partition_set"],
+                backfill_id=row["backfill_id"],
+                repository_label=row["repository_label"],
+                root_run_id=row["root_run_id"],
+                create_timestamp=check.inst(row["create_timestamp"], datetime),
+                update_timestamp=check.inst(row["update_timestamp"], datetime),
+                start_time=check.opt_inst(row["start_time"], float),
+                end_time=check.opt_inst(row["end_time"], float),
+            )
+            for row in rows
+        ]
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -453,17 +601,17 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         partition = all_tags.get(PARTITION_NAME_TAG)
         partition_set = all_tags.get(PARTITION_SET_TAG)
 
+        values: Dict[str, Any] = dict(
+            run_body=serialize_value(run.with_tags(all_tags)),
+            partition=partition,
+            partition_set=partition_set,
+            update_timestamp=pendulum.now("UTC"),
+        )
+        if self.has_run_summary_cols():
+            values.update(get_run_summary_column_values(run.with_tags(all_tags).tags_for_storage()))
+
         with self.connect() as conn:
-            conn.execute(
-                RunsTable.update()
-                .where(RunsTable.c.run_id == run_id)
-                .values(
-                    run_body=serialize_value(run.with_tags(merge_dicts(current_tags, new_tags))),
-                    partition=partition,
-                    partition_set=partition_set,
-                    update_timestamp=pendulum.now("UTC"),
-                )
-            )
+            conn.execute(RunsTable.update().where(RunsTable.c.run_id == run_id).values(**values))
 
             current_tags_set = set(current_tags.keys())
             new_tags_set = set(new_tags.keys())
@@ -537,6 +685,13 @@ def delete_run(self, run_id: str) -> None:
         with self.connect() as conn:
             conn.execute(query)
 
+    @property
+    def _snapshot_cache(self) -> SnapshotCache[str, Union[JobSnapshot, ExecutionPlanSnapshot]]:
+        # created lazily, since not every subclass calls super().__init__()
+        if not hasattr(self, "_snapshot_lru_cache"):
+            self._snapshot_lru_cache = SnapshotCache()
+        return self._snapshot_lru_cache
+
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
         check.str_param(job_snapshot_id, "job_snapshot_id")
         return self._has_snapshot_id(job_snapshot_id)
@@ -560,7 +715,7 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnapshot:
 
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(
         self, execution_plan_snapshot: ExecutionPlanSnapshot, snapshot_id: Optional[str] = None
@@ -589,7 +744,7 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=self._serialize_snapshot_body(conn, snapshot_obj),
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -600,6 +755,62 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
 
             return snapshot_id
 
+    def _serialize_snapshot_body(self, conn: Connection, snapshot_obj) -> bytes:
+        """Serializes a snapshot into the compressed body stored in the snapshots table. Once the
+        snapshot chunks table exists, the shared substructures of the snapshot are stored as
+        content-addressed chunks first, and the body only holds the manifest referencing them.
+        """
+        serialized_snapshot = serialize_value(snapshot_obj)
+        if not self._has_snapshot_chunks_table(conn):
+            return zlib.compress(serialized_snapshot.encode("utf-8"))
+
+        manifest_body, chunks = split_serialized_snapshot(serialized_snapshot)
+        self._add_snapshot_chunks(conn, chunks)
+        return zlib.compress(manifest_body.encode("utf-8"))
+
+    def _add_snapshot_chunks(self, conn: Connection, chunks: Mapping[str, str]) -> None:
+        if not chunks:
+            return
+
+        existing_chunk_ids = {
+            row[0]
+            for row in conn.execute(
+                db_select([SnapshotChunksTable.c.chunk_id]).where(
+                    SnapshotChunksTable.c.chunk_id.in_(chunks.keys())
+                )
+            ).fetchall()
+        }
+        chunks_to_insert = [
+            dict(chunk_id=chunk_id, chunk_body=zlib.compress(chunk_body.encode("utf-8")))
+            for chunk_id, chunk_body in chunks.items()
+            if chunk_id not in existing_chunk_ids
+        ]
+        if not chunks_to_insert:
+            return
+
+        try:
+            conn.execute(SnapshotChunksTable.insert(), chunks_to_insert)
+        except db_exc.IntegrityError:
+            # another process stored some of the same chunks in the meantime, fall back to
+            # inserting the chunks one at a time
+            for chunk_values in chunks_to_insert:
+                try:
+                    conn.execute(SnapshotChunksTable.insert().values(**chunk_values))
+                except db_exc.IntegrityError:
+                    # on_conflict_do_nothing equivalent
+                    pass
+
+    def _get_snapshot_chunks(self, chunk_ids: Set[str]) -> Mapping[str, str]:
+        rows = self.fetchall(
+            db_select([SnapshotChunksTable.c.chunk_id, SnapshotChunksTable.c.chunk_body]).where(
+                SnapshotChunksTable.c.chunk_id.in_(chunk_ids)
+            )
+        )
+        return {row["chunk_id"]: zlib.decompress(row["chunk_body"]).decode("utf-8") for row in rows}
+
+    def _has_snapshot_chunks_table(self, conn: Connection) -> bool:
+        return SnapshotChunksTable.name in db.inspect(conn).get_table_names()
+
     def get_run_storage_id(self) -> str:
         query = db_select([InstanceInfo.c.run_storage_id])
         row = self.fetchone(query)
@@ -612,6 +823,9 @@ def get_run_storage_id(self) -> str:
             return row["run_storage_id"]
 
     def _has_snapshot_id(self, snapshot_id: str) -> bool:
+        if snapshot_id in self._snapshot_cache:
+            return True
+
         query = db_select([SnapshotsTable.c.snapshot_id]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
@@ -621,13 +835,25 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnapshot]:
+        # snapshots are immutable once stored, so they can be cached by id
+        cached_snapshot = self._snapshot_cache.get(snapshot_id)
+        if cached_snapshot is not None:
+            return cached_snapshot  # type: ignore
+
         query = db_select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
 
-        return defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]]) if row else None  # type: ignore
+        snapshot = defensively_unpack_execution_plan_snapshot_query(
+            logging, [row["snapshot_body"]], load_chunks=self._get_snapshot_chunks
+        )
+        if snapshot is not None:
+            self._snapshot_cache.set(snapshot_id, snapshot)
+        return snapshot  # type: ignore
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -704,6 +930,13 @@ def _execute_data_migrations(
         force_rebuild_all: bool = False,
     ) -> None:
         for migration_name, migration_fn in migrations.items():
+            if migration_name == RUN_SUMMARY_COLUMNS and not self.has_run_summary_cols():
+                if print_fn:
+                    print_fn(
+                        f"Skipping data migration: {migration_name}, which requires a schema"
+                        " migration. Run `dagster instance migrate` first."
+                    )
+                continue
             if self.has_built_index(migration_name):
                 if not force_rebuild_all:
                     if print_fn:
@@ -755,6 +988,11 @@ def has_run_stats_index_cols(self) -> bool:
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
             return "start_time" in column_names and "end_time" in column_names
 
+    def has_run_summary_cols(self) -> bool:
+        with self.connect() as conn:
+            column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
+            return all(column in column_names for column in RUN_SUMMARY_TAG_COLUMNS.values())
+
     def has_bulk_actions_selector_cols(self) -> bool:
         with self.connect() as conn:
             column_names = [
@@ -801,8 +1039,11 @@ def wipe(self) -> None:
             conn.execute(RunsTable.delete())
             conn.execute(RunTagsTable.delete())
             conn.execute(SnapshotsTable.delete())
+            if self._has_snapshot_chunks_table(conn):
+                conn.execute(SnapshotChunksTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
+        self._snapshot_cache.clear()
 
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
@@ -896,13 +1137,13 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
     # Migrating run history
     def replace_job_origin(self, run: DagsterRun, job_origin: ExternalJobOrigin) -> None:
         new_label = job_origin.external_repository_origin.get_label()
+        values: Dict[str, Any] = dict(run_body=serialize_value(run.with_job_origin(job_origin)))
+        if self.has_run_summary_cols():
+            values["repository_label"] = new_label
+
         with self.connect() as conn:
             conn.execute(
-                RunsTable.update()
-                .where(RunsTable.c.run_id == run.run_id)
-                .values(
-                    run_body=serialize_value(run.with_job_origin(job_origin)),
-                )
+                RunsTable.update().where(RunsTable.c.run_id == run.run_id).values(**values)
             )
             conn.execute(
                 RunTagsTable.update()
@@ -916,7 +1157,9 @@ def replace_job_origin(self, run: DagsterRun, job_origin: ExternalJobOrigin) ->
 
 
 def defensively_unpack_execution_plan_snapshot_query(
-    logger: logging.Logger, row: Sequence[Any]
+    logger: logging.Logger,
+    row: Sequence[Any],
+    load_chunks: Optional[Callable[[Set[str]], Mapping[str, str]]] = None,
 ) -> Optional[Union[ExecutionPlanSnapshot, JobSnapshot]]:
     # minimal checking here because sqlalchemy returns a different type based on what version of
     # SqlAlchemy you are using
@@ -940,6 +1183,24 @@ def _warn(msg: str) -> None:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
         return None
 
+    if is_snapshot_manifest(decoded_str):
+        if load_chunks is None:
+            _warn("Could not load the chunks of a chunked snapshot.")
+            return None
+
+        try:
+            chunk_ids = get_snapshot_manifest_chunk_ids(decoded_str)
+            chunks = load_chunks(chunk_ids)
+        except JSONDecodeError:
+            _warn("Could not parse json in snapshot table.")
+            return None
+
+        if not chunk_ids.issubset(chunks.keys()):
+            _warn("Could not find all chunks referenced by snapshot in snapshot chunks table.")
+            return None
+
+        decoded_str = join_serialized_snapshot(decoded_str, chunks)
+
     try:
         return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnapshot))
     except JSONDecodeError:
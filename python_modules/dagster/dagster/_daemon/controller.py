@@ -21,6 +21,7 @@
 from dagster._daemon.daemon import (
     BackfillDaemon,
     DagsterDaemon,
+    EventLogRetentionDaemon,
     MonitoringDaemon,
     SchedulerDaemon,
     SensorDaemon,
@@ -356,6 +357,8 @@ def create_daemon_of_type(daemon_type: str, instance: DagsterInstance) -> Dagste
                 else DEFAULT_DAEMON_INTERVAL_SECONDS
             )
         )
+    elif daemon_type == EventLogRetentionDaemon.daemon_type():
+        return EventLogRetentionDaemon(interval_seconds=DEFAULT_DAEMON_INTERVAL_SECONDS)
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
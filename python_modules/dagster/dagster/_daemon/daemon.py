@@ -19,6 +19,7 @@
 from dagster._core.telemetry import DAEMON_ALIVE, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.backfill import execute_backfill_iteration
+from dagster._daemon.event_log_retention import execute_event_log_retention_iteration
 from dagster._daemon.monitoring import (
     execute_concurrency_slots_iteration,
     execute_run_monitoring_iteration,
@@ -298,3 +299,15 @@ def run_iteration(
     ) -> DaemonIterator:
         yield from execute_run_monitoring_iteration(workspace_process_context, self._logger)
         yield from execute_concurrency_slots_iteration(workspace_process_context, self._logger)
+
+
+class EventLogRetentionDaemon(IntervalDaemon):
+    @classmethod
+    def daemon_type(cls) -> str:
+        return "EVENT_LOG_RETENTION"
+
+    def run_iteration(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+    ) -> DaemonIterator:
+        yield from execute_event_log_retention_iteration(workspace_process_context, self._logger)
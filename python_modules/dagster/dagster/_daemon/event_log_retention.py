@@ -0,0 +1,127 @@
+import logging
+import sys
+from datetime import datetime
+from typing import Iterator, Mapping, Optional, Sequence
+
+import pendulum
+
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord, RunsFilter
+from dagster._core.storage.event_log.retention import (
+    EVENT_LOG_RETENTION_RUN_STATUSES,
+    get_event_log_archiver,
+    purge_run_event_batches,
+)
+from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+
+EVENT_LOG_RETENTION_CURSOR_KEY_PREFIX = "EVENT_LOG_RETENTION_CURSOR"
+
+RUN_BATCH_SIZE = 25
+
+
+def _cursor_key(status: DagsterRunStatus) -> str:
+    return f"{EVENT_LOG_RETENTION_CURSOR_KEY_PREFIX}_{status.value}"
+
+
+def _fetch_cursors(instance: DagsterInstance) -> Mapping[DagsterRunStatus, Optional[datetime]]:
+    persisted_cursors = instance.daemon_cursor_storage.get_cursor_values(
+        {_cursor_key(status) for status in EVENT_LOG_RETENTION_RUN_STATUSES}
+    )
+    return {
+        status: (
+            datetime.fromisoformat(persisted_cursors[_cursor_key(status)])
+            if _cursor_key(status) in persisted_cursors
+            else None
+        )
+        for status in EVENT_LOG_RETENTION_RUN_STATUSES
+    }
+
+
+def _get_new_cursor(
+    run_records: Sequence[RunRecord], num_processed: int, batch_size: int
+) -> Optional[datetime]:
+    """The update timestamp up to which every run has been processed. Runs that share an update
+    timestamp with an unprocessed run are scanned again on the next iteration, since the run
+    filter can only select runs updated strictly after the cursor.
+    """
+    processed = [record.update_timestamp for record in run_records[:num_processed]]
+    if not processed:
+        return None
+
+    if num_processed < len(run_records):
+        boundary = run_records[num_processed].update_timestamp
+    elif len(run_records) == batch_size:
+        boundary = run_records[-1].update_timestamp
+    else:
+        return processed[-1]
+
+    before_boundary = [timestamp for timestamp in processed if timestamp < boundary]
+    if before_boundary:
+        return before_boundary[-1]
+    # a full batch of runs all updated at the same time, which can only be moved past
+    return processed[-1] if num_processed == len(run_records) else None
+
+
+def execute_event_log_retention_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+) -> Iterator[Optional[SerializableErrorInfo]]:
+    """Purges the events of finished runs that are older than the configured retention period of
+    their run status, oldest runs first. Progress is kept in a cursor per run status, holding the
+    update timestamp up to which the events of every run have been purged.
+    """
+    instance = workspace_process_context.instance
+    settings = instance.event_log_retention_settings
+    if not settings or not settings.purge_after_days:
+        yield None
+        return
+
+    if not instance.event_log_storage.supports_event_log_retention:
+        logger.warning("The configured event log storage does not support event log retention.")
+        yield None
+        return
+
+    archiver = get_event_log_archiver(settings.archive) if settings.archive else None
+    cursors = _fetch_cursors(instance)
+    now = pendulum.now("UTC")
+
+    for status, purge_after_days in settings.purge_after_days.items():
+        run_records = instance.get_run_records(
+            filters=RunsFilter(
+                statuses=[status],
+                updated_after=cursors[status],
+                updated_before=now.subtract(days=purge_after_days),
+            ),
+            limit=RUN_BATCH_SIZE,
+            order_by="update_timestamp",
+            ascending=True,
+        )
+
+        num_processed = 0
+        for run_record in run_records:
+            run_id = run_record.dagster_run.run_id
+            try:
+                num_purged = 0
+                for num_records in purge_run_event_batches(
+                    instance.event_log_storage, run_id, settings, archiver
+                ):
+                    num_purged += num_records
+                    yield None
+            except Exception:
+                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                logger.error(f"Failed to purge events for run {run_id}: {error_info.to_string()}")
+                yield error_info
+                # retry the run on the next iteration, rather than moving the cursor past it
+                break
+
+            if num_purged:
+                logger.info(f"Purged {num_purged} events for run {run_id}.")
+            num_processed += 1
+
+        new_cursor = _get_new_cursor(run_records, num_processed, RUN_BATCH_SIZE)
+        if new_cursor:
+            instance.daemon_cursor_storage.set_cursor_values(
+                {_cursor_key(status): new_cursor.isoformat()}
+            )
+        yield None
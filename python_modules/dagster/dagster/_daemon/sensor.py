@@ -7,6 +7,7 @@
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Iterator,
     List,
@@ -566,14 +567,14 @@ class SubmitRunRequestResult(NamedTuple):
     run: Union[SkippedSensorRun, DagsterRun]
 
 
-def _submit_run_request(
+def _resolve_run_request(
     run_request: RunRequest,
     workspace_process_context: IWorkspaceProcessContext,
     external_sensor: ExternalSensor,
     existing_runs_by_key,
     logger,
-    sensor_debug_crash_flags,
-) -> SubmitRunRequestResult:
+) -> Union[DagsterRun, SkippedSensorRun, Mapping[str, Any]]:
+    """Returns the existing run for the run request, or the arguments to create a new one with."""
     instance = workspace_process_context.instance
     sensor_origin = external_sensor.get_external_origin()
 
@@ -593,7 +594,7 @@ def _submit_run_request(
         asset_selection=run_request.asset_selection,
     )
     external_job = code_location.get_external_job(job_subset_selector)
-    run = _get_or_create_sensor_run(
+    return _get_or_create_sensor_run_args(
         logger,
         instance,
         code_location,
@@ -604,6 +605,17 @@ def _submit_run_request(
         existing_runs_by_key,
     )
 
+
+def _submit_run_request(
+    run_request: RunRequest,
+    run: Union[DagsterRun, SkippedSensorRun],
+    workspace_process_context: IWorkspaceProcessContext,
+    external_sensor: ExternalSensor,
+    logger,
+    sensor_debug_crash_flags,
+) -> SubmitRunRequestResult:
+    instance = workspace_process_context.instance
+
     if isinstance(run, SkippedSensorRun):
         return SubmitRunRequestResult(run_key=run_request.run_key, error_info=None, run=run)
 
@@ -809,19 +821,43 @@ def _evaluate_sensor(
 
         run_requests.append(run_request)
 
-    submit_run_request = lambda run_request: _submit_run_request(
+    resolve_run_request = lambda run_request: _resolve_run_request(
         run_request,
         workspace_process_context,
         external_sensor,
         existing_runs_by_key,
         context.logger,
+    )
+
+    if submit_threadpool_executor:
+        resolved_runs = list(submit_threadpool_executor.map(resolve_run_request, run_requests))
+    else:
+        resolved_runs = list(map(resolve_run_request, run_requests))
+
+    yield
+
+    # create all of the new runs in a single batch, so that snapshots shared between them are only
+    # persisted once, before submitting each of them
+    created_runs = iter(
+        instance.create_runs([run for run in resolved_runs if isinstance(run, Mapping)])
+    )
+    runs = [next(created_runs) if isinstance(run, Mapping) else run for run in resolved_runs]
+
+    submit_run_request = lambda run_request_and_run: _submit_run_request(
+        run_request_and_run[0],
+        run_request_and_run[1],
+        workspace_process_context,
+        external_sensor,
+        context.logger,
         sensor_debug_crash_flags,
     )
 
     if submit_threadpool_executor:
-        gen_run_request_results = submit_threadpool_executor.map(submit_run_request, run_requests)
+        gen_run_request_results = submit_threadpool_executor.map(
+            submit_run_request, zip(run_requests, runs)
+        )
     else:
-        gen_run_request_results = map(submit_run_request, run_requests)
+        gen_run_request_results = map(submit_run_request, zip(run_requests, runs))
 
     for run_request_result in gen_run_request_results:
         yield run_request_result.error_info
@@ -916,7 +952,7 @@ def _fetch_existing_runs(
     return existing_runs
 
 
-def _get_or_create_sensor_run(
+def _get_or_create_sensor_run_args(
     logger: logging.Logger,
     instance: DagsterInstance,
     code_location: CodeLocation,
@@ -925,9 +961,9 @@ def _get_or_create_sensor_run(
     run_request: RunRequest,
     target_data: ExternalTargetData,
     existing_runs_by_key: Mapping[str, DagsterRun],
-) -> Union[DagsterRun, SkippedSensorRun]:
+) -> Union[DagsterRun, SkippedSensorRun, Mapping[str, Any]]:
     if not run_request.run_key:
-        return _create_sensor_run(
+        return _get_create_sensor_run_args(
             instance, code_location, external_sensor, external_job, run_request, target_data
         )
 
@@ -947,19 +983,19 @@ def _get_or_create_sensor_run(
 
     logger.info(f"Creating new run for {external_sensor.name}")
 
-    return _create_sensor_run(
+    return _get_create_sensor_run_args(
         instance, code_location, external_sensor, external_job, run_request, target_data
     )
 
 
-def _create_sensor_run(
+def _get_create_sensor_run_args(
     instance: DagsterInstance,
     code_location: CodeLocation,
     external_sensor: ExternalSensor,
     external_job: ExternalJob,
     run_request: RunRequest,
     target_data: ExternalTargetData,
-) -> DagsterRun:
+) -> Mapping[str, Any]:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     external_execution_plan = code_location.get_external_execution_plan(
@@ -990,7 +1026,7 @@ def _create_sensor_run(
         },
     )
 
-    return instance.create_run(
+    return dict(
         job_name=target_data.job_name,
         run_id=None,
         run_config=run_request.run_config,
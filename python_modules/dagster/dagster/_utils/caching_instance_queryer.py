@@ -212,7 +212,7 @@ def get_latest_storage_id_for_event_type(
 
         latest_record = next(
             iter(
-                self.instance.get_event_records(
+                self.instance.get_event_record_views(
                     event_records_filter=EventRecordsFilter(event_type=event_type),
                     limit=1,
                 )
@@ -346,7 +346,8 @@ def next_version_record(
     ) -> Optional["EventLogRecord"]:
         from dagster._core.event_api import EventRecordsFilter
 
-        for record in self.instance.get_event_records(
+        # stream the observations so that only the pages up to the first new version are fetched
+        for record in self.instance.iterate_event_records(
             EventRecordsFilter(
                 event_type=DagsterEventType.ASSET_OBSERVATION,
                 asset_key=asset_key,
@@ -389,10 +390,10 @@ def _get_planned_materializations_for_run_from_events(
         Args:
             run_id (str): The run id
         """
-        materializations_planned = self.instance.get_records_for_run(
+        materializations_planned = self.instance.get_record_views_for_run(
             run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
-        ).records
-        return set(cast(AssetKey, record.asset_key) for record in materializations_planned)
+        )
+        return set(cast(AssetKey, view.asset_key) for view in materializations_planned)
 
     def get_planned_materializations_for_run(self, run_id: str) -> AbstractSet[AssetKey]:
         """Returns the set of asset keys that are planned to be materialized by the run.
@@ -433,11 +434,11 @@ def get_current_materializations_for_run(self, *, run_id: str) -> AbstractSet[As
         Args:
             run_id (str): The run id
         """
-        materializations = self.instance.get_records_for_run(
+        materializations = self.instance.get_record_views_for_run(
             run_id=run_id,
             of_type=DagsterEventType.ASSET_MATERIALIZATION,
-        ).records
-        return set(cast(AssetKey, record.asset_key) for record in materializations)
+        )
+        return set(cast(AssetKey, view.asset_key) for view in materializations)
 
     ####################
     # BACKFILLS
@@ -7,13 +7,14 @@
 )
 
 import pytest
-from dagster import job, op
+from dagster import DynamicOut, DynamicOutput, job, op
 from dagster._core.errors import DagsterExecutionInterruptedError, DagsterInvariantViolationError
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.objects import StepRetryData, StepSuccessData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
 from dagster._core.test_utils import instance_for_test
@@ -354,3 +355,142 @@ def test_active_concurrency_sleep():
             )
             assert math.isclose(active_execution.sleep_interval(), 2.0, abs_tol=0.1)
             active_execution.mark_interrupted()
+
+
+def test_known_state_for_steps():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(3):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(num):
+        return num * 2
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @job
+    def dynamic_job():
+        total(emit().map(double).collect())
+
+    ready_outputs = {StepOutputHandle("emit", "result", str(i)) for i in range(3)}
+    plan = create_execution_plan(
+        dynamic_job,
+        step_keys_to_execute=["double[0]", "double[1]", "double[2]", "total"],
+        known_state=KnownExecutionState(
+            previous_retry_attempts={"double[1]": 1},
+            dynamic_mappings={"emit": {"result": ["0", "1", "2"]}},
+            ready_outputs=ready_outputs,
+        ),
+    )
+
+    with plan.start(RetryMode.ENABLED) as active_execution:
+        steps_by_key = {step.key: step for step in active_execution.get_steps_to_execute()}
+        assert set(steps_by_key.keys()) == {"double[0]", "double[1]", "double[2]"}
+
+        known_state = active_execution.get_known_state_for_steps([steps_by_key["double[1]"]])
+        assert known_state.previous_retry_attempts == {"double[1]": 1}
+        assert known_state.dynamic_mappings == {"emit": {"result": ["1"]}}
+        assert known_state.ready_outputs == {StepOutputHandle("emit", "result", "1")}
+
+        known_state = active_execution.get_known_state_for_steps(
+            [steps_by_key["double[0]"], steps_by_key["double[2]"]]
+        )
+        assert known_state.previous_retry_attempts == {}
+        assert known_state.dynamic_mappings == {"emit": {"result": ["0", "2"]}}
+
+        # full state is still available for everything else
+        assert active_execution.get_known_state().ready_outputs == ready_outputs
+
+        for step in steps_by_key.values():
+            active_execution.mark_step_produced_output(StepOutputHandle(step.key, "result"))
+            active_execution.mark_success(step.key)
+
+        [total_step] = active_execution.get_steps_to_execute()
+        assert total_step.key == "total"
+        known_state = active_execution.get_known_state_for_steps([total_step])
+        assert known_state.dynamic_mappings == {"emit": {"result": ["0", "1", "2"]}}
+        assert known_state.ready_outputs == {
+            StepOutputHandle(f"double[{i}]", "result") for i in range(3)
+        }
+        active_execution.mark_success("total")
+
+
+def test_large_dynamic_fan_out():
+    @op(out=DynamicOut())
+    def emit():
+        yield DynamicOutput(0, mapping_key="0")
+
+    @op
+    def first(x):
+        return x
+
+    @op
+    def second(x):
+        return x
+
+    @op
+    def collect(xs):
+        return len(xs)
+
+    @job
+    def fan_out_job():
+        collect(emit().map(first).map(second).collect())
+
+    num_keys = 500
+    with create_execution_plan(fan_out_job).start(RetryMode.DISABLED) as active_execution:
+        [emit_step] = active_execution.get_steps_to_execute()
+        for i in range(num_keys):
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    job_name=fan_out_job.name,
+                    step_key=emit_step.key,
+                    event_specific_data=StepOutputData(
+                        StepOutputHandle(emit_step.key, "result", str(i))
+                    ),
+                )
+            )
+        active_execution.handle_event(
+            DagsterEvent(
+                DagsterEventType.STEP_SUCCESS.value,
+                job_name=fan_out_job.name,
+                step_key=emit_step.key,
+                event_specific_data=StepSuccessData(duration_ms=10.0),
+            )
+        )
+
+        # mapped steps are vended in the order their mapping keys were yielded
+        steps = active_execution.get_steps_to_execute(limit=4)
+        assert [step.key for step in steps] == [f"first[{i}]" for i in range(4)]
+
+        # a downstream step becomes executable as soon as its own upstream step completes, and is
+        # vended after steps that were already executable
+        active_execution.mark_step_produced_output(StepOutputHandle("first[2]", "result"))
+        active_execution.mark_success("first[2]")
+        steps = active_execution.get_steps_to_execute()
+        assert len(steps) == num_keys - 4 + 1
+        assert steps[0].key == "first[4]"
+        assert steps[-1].key == "second[2]"
+
+        # a step whose upstream step yielded no output is skipped
+        active_execution.mark_success("first[3]")
+        assert [step.key for step in active_execution.get_steps_to_skip()] == ["second[3]"]
+        active_execution.mark_skipped("second[3]")
+
+        for i in range(num_keys):
+            if i in (2, 3):
+                continue
+            active_execution.mark_step_produced_output(StepOutputHandle(f"first[{i}]", "result"))
+            active_execution.mark_success(f"first[{i}]")
+
+        for step in active_execution.get_steps_to_execute() + [steps[-1]]:
+            active_execution.mark_step_produced_output(StepOutputHandle(step.key, "result"))
+            active_execution.mark_success(step.key)
+
+        [collect_step] = active_execution.get_steps_to_execute()
+        assert collect_step.key == "collect"
+        active_execution.mark_success(collect_step.key)
+        assert active_execution.is_complete
@@ -320,6 +320,117 @@ def test_submit_run():
             assert instance.run_coordinator.queue()[0].run_id == "foo-bar"
 
 
+def _create_run_args(**kwargs) -> Mapping[str, Any]:
+    return {
+        "job_name": "foo",
+        "run_id": None,
+        "run_config": None,
+        "resolved_op_selection": None,
+        "step_keys_to_execute": None,
+        "status": None,
+        "tags": None,
+        "root_run_id": None,
+        "parent_run_id": None,
+        "job_snapshot": None,
+        "execution_plan_snapshot": None,
+        "parent_job_snapshot": None,
+        "external_job_origin": None,
+        "job_code_origin": None,
+        "asset_selection": None,
+        "asset_check_selection": None,
+        "op_selection": None,
+        **kwargs,
+    }
+
+
+def test_create_runs():
+    with instance_for_test() as instance:
+        execution_plan = create_execution_plan(noop_asset_job)
+        job_snapshot = noop_asset_job.get_job_snapshot()
+        ep_snapshot = snapshot_from_execution_plan(
+            execution_plan, noop_asset_job.get_job_snapshot_id()
+        )
+
+        with patch.object(
+            instance.run_storage, "has_job_snapshot", wraps=instance.run_storage.has_job_snapshot
+        ) as has_job_snapshot, patch.object(
+            instance.run_storage,
+            "has_execution_plan_snapshot",
+            wraps=instance.run_storage.has_execution_plan_snapshot,
+        ) as has_execution_plan_snapshot:
+            runs = instance.create_runs(
+                [
+                    _create_run_args(
+                        job_name=noop_asset_job.name,
+                        tags={"foo": str(i)},
+                        job_snapshot=job_snapshot,
+                        execution_plan_snapshot=ep_snapshot,
+                    )
+                    for i in range(3)
+                ]
+            )
+
+            # the shared snapshots are only checked and persisted once for the whole batch
+            assert has_job_snapshot.call_count == 1
+            assert has_execution_plan_snapshot.call_count == 1
+
+        assert len(runs) == 3
+        assert [run.tags["foo"] for run in runs] == ["0", "1", "2"]
+        for run in runs:
+            assert instance.get_run_by_id(run.run_id) == run
+            assert run.job_snapshot_id == create_job_snapshot_id(job_snapshot)
+            assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
+            assert (
+                len(
+                    instance.get_records_for_run(
+                        run.run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
+                    ).records
+                )
+                == 1
+            )
+
+        assert instance.create_runs([]) == []
+
+
+def test_submit_runs():
+    with instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster._core.test_utils",
+                "class": "MockedRunCoordinator",
+            }
+        }
+    ) as instance:
+        with get_bar_workspace(instance) as workspace:
+            external_job = (
+                workspace.get_code_location("bar_code_location")
+                .get_repository("bar_repo")
+                .get_full_external_job("foo")
+            )
+
+            runs = instance.create_runs(
+                [
+                    _create_run_args(
+                        job_name=external_job.name,
+                        run_id=run_id,
+                        external_job_origin=external_job.get_external_origin(),
+                        job_code_origin=external_job.get_python_origin(),
+                    )
+                    for run_id in ["foo-bar", "foo-baz"]
+                ]
+            )
+
+            instance.submit_runs([run.run_id for run in runs], workspace)
+
+            assert [run.run_id for run in instance.run_coordinator.queue()] == [
+                "foo-bar",
+                "foo-baz",
+            ]
+
+            with pytest.raises(DagsterInvariantViolationError):
+                instance.submit_runs(["does-not-exist"], workspace)
+
+
 def test_create_run_with_asset_partitions():
     with instance_for_test() as instance:
         execution_plan = create_execution_plan(noop_asset_job)
@@ -149,6 +149,29 @@ def test_submit_run(self, instance, coordinator, workspace, external_pipeline):
         stored_run = instance.get_run_by_id("foo-1")
         assert stored_run.status == DagsterRunStatus.QUEUED
 
+    def test_submit_runs(self, instance, coordinator, workspace, external_pipeline):
+        runs = [
+            self.create_run_for_test(
+                instance, external_pipeline, run_id="foo-1", status=DagsterRunStatus.NOT_STARTED
+            ),
+            self.create_run_for_test(
+                instance, external_pipeline, run_id="foo-2", status=DagsterRunStatus.QUEUED
+            ),
+        ]
+        returned_runs = coordinator.submit_runs([SubmitRunContext(run, workspace) for run in runs])
+        assert [run.run_id for run in returned_runs] == ["foo-1", "foo-2"]
+        assert [run.status for run in returned_runs] == [DagsterRunStatus.QUEUED] * 2
+
+        # only the run that was not yet submitted is enqueued
+        assert [
+            len(
+                instance.get_records_for_run(
+                    run_id, of_type=DagsterEventType.PIPELINE_ENQUEUED
+                ).records
+            )
+            for run_id in ["foo-1", "foo-2"]
+        ] == [1, 0]
+
     def test_submit_run_checks_status(self, instance, coordinator, workspace, external_pipeline):
         run = self.create_run_for_test(
             instance, external_pipeline, run_id="foo-1", status=DagsterRunStatus.QUEUED
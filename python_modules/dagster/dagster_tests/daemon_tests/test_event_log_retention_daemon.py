@@ -0,0 +1,229 @@
+import datetime
+import gzip
+import json
+import os
+import tempfile
+from logging import Logger
+
+import mock
+import pendulum
+import pytest
+from dagster import AssetKey, DagsterEventType, Failure, asset, job, materialize, op
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.retention import (
+    PROTECTED_EVENT_TYPES,
+    EventLogRetentionSettings,
+)
+from dagster._core.test_utils import create_test_daemon_workspace_context, instance_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster._daemon import get_default_daemon_logger
+from dagster._daemon.daemon import EventLogRetentionDaemon
+from dagster._daemon.event_log_retention import (
+    _get_new_cursor,
+    execute_event_log_retention_iteration,
+)
+from dagster._serdes import deserialize_value
+
+
+@pytest.fixture
+def archive_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+@pytest.fixture
+def instance(archive_dir):
+    with instance_for_test(
+        overrides={
+            "retention": {
+                "event_log": {
+                    "purge_after_days": {"success": 7},
+                    "batch_size": 5,
+                    "archive": {"base_dir": archive_dir},
+                }
+            }
+        },
+    ) as instance:
+        yield instance
+
+
+@pytest.fixture
+def workspace_context(instance):
+    with create_test_daemon_workspace_context(
+        workspace_load_target=EmptyWorkspaceTarget(), instance=instance
+    ) as workspace:
+        yield workspace
+
+
+@pytest.fixture
+def logger():
+    return get_default_daemon_logger("EventLogRetentionDaemon")
+
+
+@asset
+def retained_asset(context):
+    context.log.info("materializing")
+    return 1
+
+
+@op
+def failing_op(context):
+    context.log.info("failing")
+    raise Failure("oops")
+
+
+@job
+def failing_job():
+    failing_op()
+
+
+def _event_types(instance: DagsterInstance, run_id: str):
+    return [
+        record.event_log_entry.dagster_event_type
+        for record in instance.get_records_for_run(run_id).records
+    ]
+
+
+def _read_archive(archive_dir: str, run_id: str):
+    run_dir = os.path.join(archive_dir, f"run_id={run_id}")
+    entries = []
+    for filename in sorted(os.listdir(run_dir), key=lambda name: int(name.split("-")[0])):
+        with gzip.open(os.path.join(run_dir, filename), "rt") as f:
+            for line in f:
+                row = json.loads(line)
+                entries.append((row["storage_id"], deserialize_value(row["event"], EventLogEntry)))
+    return entries
+
+
+def test_event_log_retention_required(instance: DagsterInstance):
+    assert EventLogRetentionDaemon.daemon_type() in instance.get_required_daemon_types()
+
+    with instance_for_test() as default_instance:
+        assert default_instance.event_log_retention_settings is None
+        assert (
+            EventLogRetentionDaemon.daemon_type()
+            not in default_instance.get_required_daemon_types()
+        )
+
+
+def test_event_log_retention_settings():
+    settings = EventLogRetentionSettings.from_config(
+        {"purge_after_days": 3, "event_types": ["ENGINE_EVENT"]}
+    )
+    assert set(settings.purge_after_days.values()) == {3}
+    assert settings.event_types == {DagsterEventType.ENGINE_EVENT}
+    assert settings.purge_log_messages
+    assert settings.archive is None
+
+    for protected_event_type in PROTECTED_EVENT_TYPES:
+        with pytest.raises(DagsterInvariantViolationError, match="cannot be purged"):
+            EventLogRetentionSettings.from_config(
+                {"purge_after_days": 3, "event_types": [protected_event_type.name]}
+            )
+
+    with pytest.raises(DagsterInvariantViolationError, match="Unknown event type"):
+        EventLogRetentionSettings.from_config({"purge_after_days": 3, "event_types": ["FOO"]})
+
+
+def test_event_log_retention_iteration(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    logger: Logger,
+    archive_dir: str,
+):
+    freeze_datetime = pendulum.now("UTC")
+
+    result = materialize([retained_asset], instance=instance)
+    run_id = result.run_id
+    failed_run_id = failing_job.execute_in_process(instance=instance, raise_on_error=False).run_id
+
+    records_before = instance.get_records_for_run(run_id).records
+    stats_before = instance.get_run_stats(run_id)
+    step_stats_before = instance.get_run_step_stats(run_id)
+    failed_event_types_before = _event_types(instance, failed_run_id)
+
+    # runs are not purged before their retention period is over
+    with pendulum.test(freeze_datetime.add(days=6)):
+        list(execute_event_log_retention_iteration(workspace_context, logger))
+    assert len(instance.get_records_for_run(run_id).records) == len(records_before)
+    assert not os.path.exists(os.path.join(archive_dir, f"run_id={run_id}"))
+
+    with pendulum.test(freeze_datetime.add(days=8)):
+        list(execute_event_log_retention_iteration(workspace_context, logger))
+
+    event_types_after = _event_types(instance, run_id)
+    assert DagsterEventType.ENGINE_EVENT not in event_types_after
+    assert None not in event_types_after  # log messages
+    assert set(event_types_after) <= PROTECTED_EVENT_TYPES
+    assert instance.get_run_stats(run_id) == stats_before
+    assert instance.get_run_step_stats(run_id) == step_stats_before
+    assert instance.get_latest_materialization_event(AssetKey("retained_asset"))
+
+    # runs in statuses without a retention period are untouched
+    assert _event_types(instance, failed_run_id) == failed_event_types_before
+
+    # every purged event was archived, in batches
+    remaining_ids = {record.storage_id for record in instance.get_records_for_run(run_id).records}
+    archived = _read_archive(archive_dir, run_id)
+    assert len(os.listdir(os.path.join(archive_dir, f"run_id={run_id}"))) > 1
+    assert archived == [
+        (record.storage_id, record.event_log_entry)
+        for record in records_before
+        if record.storage_id not in remaining_ids
+    ]
+
+    # the cursor moved past the purged run
+    with pendulum.test(freeze_datetime.add(days=9)):
+        list(execute_event_log_retention_iteration(workspace_context, logger))
+    assert _read_archive(archive_dir, run_id) == archived
+
+
+def test_event_log_retention_cursor():
+    def _records(*days):
+        return [mock.Mock(update_timestamp=datetime.datetime(2023, 1, day)) for day in days]
+
+    # a partial batch moves the cursor past every processed run
+    assert _get_new_cursor(_records(1, 2), 2, 3) == datetime.datetime(2023, 1, 2)
+    # runs updated at the same time as the last run of a full batch are scanned again
+    assert _get_new_cursor(_records(1, 2, 2), 3, 3) == datetime.datetime(2023, 1, 1)
+    # as are runs updated at the same time as a run that failed to be purged
+    assert _get_new_cursor(_records(1, 2, 2), 1, 3) == datetime.datetime(2023, 1, 1)
+    assert _get_new_cursor(_records(1, 1, 2), 1, 3) is None
+    # a full batch of runs that share an update timestamp is moved past
+    assert _get_new_cursor(_records(1, 1, 1), 3, 3) == datetime.datetime(2023, 1, 1)
+    assert _get_new_cursor(_records(1, 1, 1), 0, 3) is None
+
+
+def test_event_log_retention_parquet_archive(logger: Logger):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        with instance_for_test(
+            overrides={
+                "retention": {
+                    "event_log": {
+                        "purge_after_days": 1,
+                        "archive": {"base_dir": archive_dir, "format": "parquet"},
+                    }
+                }
+            },
+        ) as instance:
+            with create_test_daemon_workspace_context(
+                workspace_load_target=EmptyWorkspaceTarget(), instance=instance
+            ) as parquet_workspace_context:
+                run_id = materialize([retained_asset], instance=instance).run_id
+                num_records = len(instance.get_records_for_run(run_id).records)
+
+                with pendulum.test(pendulum.now("UTC").add(days=2)):
+                    list(execute_event_log_retention_iteration(parquet_workspace_context, logger))
+
+                run_dir = os.path.join(archive_dir, f"run_id={run_id}")
+                (filename,) = os.listdir(run_dir)
+                table = pq.read_table(os.path.join(run_dir, filename))
+                assert table.num_rows == num_records - len(
+                    instance.get_records_for_run(run_id).records
+                )
+                assert set(table.column("run_id").to_pylist()) == {run_id}
@@ -544,6 +544,27 @@ def double():
     assert result.output_for_node("fan_in") == [0, 1, 2, 0, 1, 2]
 
 
+def test_map_downstream_of_collect():
+    @op
+    def total(_, xs):
+        return sum(xs)
+
+    @op
+    def add(_, x, y):
+        return x + y
+
+    @job
+    def mapped_after_collect():
+        # the steps mapped over the output of emit resolve while the steps downstream of the
+        # collected output of emit_later are still waiting on it to resolve
+        offset = echo.alias("after_collect")(total(emit.alias("emit_later")().map(echo).collect()))
+        emit().map(lambda x: add(x, offset)).collect()
+
+    result = mapped_after_collect.execute_in_process()
+    assert result.success
+    assert result.output_for_node("add") == {"0": 3, "1": 4, "2": 5}
+
+
 def test_fan_in_skips():
     @op(
         out={
@@ -0,0 +1,219 @@
+import asyncio
+import threading
+import time
+
+from dagster import (
+    DynamicOut,
+    DynamicOutput,
+    Failure,
+    RetryPolicy,
+    in_process_executor,
+    job,
+    op,
+    reconstructable,
+)
+from dagster._core.events import DagsterEventType
+from dagster._core.execution.api import execute_job, execute_run_iterator
+from dagster._core.test_utils import instance_for_test
+
+FAN_OUT = 4
+
+_barrier = threading.Barrier(FAN_OUT, timeout=10)
+_lock = threading.Lock()
+_running = {"current": 0, "max": 0}
+
+
+@op(out=DynamicOut())
+def emit():
+    for i in range(FAN_OUT):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def wait_for_peers(x):
+    # only passes if every mapped step is running at the same time
+    _barrier.wait()
+    return x
+
+
+_started = set()
+
+
+@op
+async def await_peers(x):
+    # only completes if every mapped step is awaiting on the run's event loop at the same time
+    _started.add(x)
+    for _ in range(1000):
+        if len(_started) == FAN_OUT:
+            return x
+        await asyncio.sleep(0.01)
+    raise Exception("Timed out waiting for peers")
+
+
+@op(tags={"database": "tiny"})
+def limited(x):
+    with _lock:
+        _running["current"] += 1
+        _running["max"] = max(_running["max"], _running["current"])
+    time.sleep(0.1)
+    with _lock:
+        _running["current"] -= 1
+    return x
+
+
+_retried = set()
+
+
+@op(retry_policy=RetryPolicy(max_retries=1, delay=0.05))
+def retry_once(x):
+    if x not in _retried:
+        _retried.add(x)
+        raise Exception("retry me")
+    return x
+
+
+_finished = set()
+
+
+@op
+def slow(x):
+    time.sleep(0.5)
+    _finished.add(x)
+    return x
+
+
+@op
+def total(xs):
+    return sum(xs)
+
+
+@op
+def fail(x):
+    if x == 2:
+        raise Failure("boom")
+    return x
+
+
+@job(executor_def=in_process_executor)
+def barrier_job():
+    total(emit().map(wait_for_peers).collect())
+
+
+@job(executor_def=in_process_executor)
+def async_job():
+    total(emit().map(await_peers).collect())
+
+
+@job(executor_def=in_process_executor)
+def limited_job():
+    total(emit().map(limited).collect())
+
+
+@job(executor_def=in_process_executor)
+def retry_job():
+    total(emit().map(retry_once).collect())
+
+
+@job(executor_def=in_process_executor)
+def slow_job():
+    total(emit().map(slow).collect())
+
+
+@job(executor_def=in_process_executor)
+def failure_job():
+    total(emit().map(fail).collect())
+
+
+def test_concurrent_steps():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(barrier_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": FAN_OUT}}},
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == 6
+
+
+def test_concurrent_async_steps():
+    _started.clear()
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(async_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": FAN_OUT}}},
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == 6
+
+
+def test_concurrent_tag_limits():
+    _running["max"] = 0
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(limited_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {
+                        "max_concurrent": FAN_OUT,
+                        "tag_concurrency_limits": [
+                            {"key": "database", "value": "tiny", "limit": 1}
+                        ],
+                    }
+                }
+            },
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == 6
+    assert _running["max"] == 1
+
+
+def test_concurrent_failure():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(failure_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": FAN_OUT}}},
+        ) as result:
+            assert not result.success
+            step_events = {
+                event.step_key: event.event_type
+                for event in result.all_events
+                if event.event_type
+                in (DagsterEventType.STEP_SUCCESS, DagsterEventType.STEP_FAILURE)
+            }
+            assert step_events["fail[2]"] == DagsterEventType.STEP_FAILURE
+            assert step_events["fail[0]"] == DagsterEventType.STEP_SUCCESS
+            assert "total" not in step_events
+
+
+def test_concurrent_retries():
+    # steps waiting to be retried bound how long the plan waits on the running steps
+    _retried.clear()
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(retry_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent": 2}}},
+        ) as result:
+            assert result.success
+            assert result.output_for_node("total") == 6
+    assert _retried == set(range(FAN_OUT))
+
+
+def test_concurrent_steps_finish_before_teardown():
+    _finished.clear()
+    with instance_for_test() as instance:
+        run = instance.create_run_for_job(
+            slow_job,
+            run_config={"execution": {"config": {"max_concurrent": 2}}},
+        )
+        run_iterator = execute_run_iterator(reconstructable(slow_job), run, instance)
+        for event in run_iterator:
+            if event.event_type == DagsterEventType.STEP_START and event.step_key == "slow[0]":
+                break
+
+        # closing the run waits for the running steps, and drops the ones that have not started
+        run_iterator.close()
+        assert _finished == {0, 1}
@@ -1,4 +1,5 @@
 import subprocess
+import threading
 import time
 
 import pytest
@@ -50,11 +51,30 @@ class TestStepHandler(StepHandler):
     terminate_step_count = 0
     verify_step_count = 0
 
+    # set by tests to hold the launch of a step until the other steps launched with it have been
+    held_step_key = None
+    held_step_batch_size = 0
+    held_step_released = threading.Event()
+    held_step_released_in_time = False
+    launched_while_held = 0
+
     @property
     def name(self):
         return "TestStepHandler"
 
     def launch_step(self, step_handler_context):
+        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+        if step_key == TestStepHandler.held_step_key:
+            TestStepHandler.held_step_released_in_time = TestStepHandler.held_step_released.wait(
+                timeout=5
+            )
+        elif TestStepHandler.held_step_key and step_key.startswith(
+            TestStepHandler.held_step_key.split("[")[0]
+        ):
+            TestStepHandler.launched_while_held += 1
+            if TestStepHandler.launched_while_held == TestStepHandler.held_step_batch_size - 1:
+                TestStepHandler.held_step_released.set()
+
         if step_handler_context.execute_step_args.should_verify_step:
             TestStepHandler.verify_step_count += 1
         if step_handler_context.execute_step_args.step_keys_to_execute[0] == "baz_op":
@@ -83,6 +103,11 @@ def reset(cls):
         cls.check_step_health_count = 0
         cls.terminate_step_count = 0
         cls.verify_step_count = 0
+        cls.held_step_key = None
+        cls.held_step_batch_size = 0
+        cls.held_step_released = threading.Event()
+        cls.held_step_released_in_time = False
+        cls.launched_while_held = 0
 
     @classmethod
     def wait_for_processes(cls):
@@ -178,6 +203,52 @@ def test_dynamic_execute():
     )
 
 
+def test_dynamic_execute_concurrent_launches():
+    from .test_jobs import define_dynamic_job
+
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(define_dynamic_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent_launches": 4}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 11
+    assert (
+        len(
+            [
+                e
+                for e in result.all_events
+                if e.event_type_value == DagsterEventType.STEP_START.value
+            ]
+        )
+        == 11
+    )
+
+
+def test_slow_launch_does_not_hold_up_others():
+    from .test_jobs import define_dynamic_job
+
+    TestStepHandler.reset()
+    # the launch of final[0] only completes once all the other mapped steps have launched
+    TestStepHandler.held_step_key = "final[0]"
+    TestStepHandler.held_step_batch_size = 10
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(define_dynamic_job),
+            instance=instance,
+            run_config={"execution": {"config": {"max_concurrent_launches": 4}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.held_step_released_in_time
+    assert TestStepHandler.launched_while_held == 9
+
+
 def test_skipping():
     from .test_jobs import define_skpping_job
 
@@ -1,6 +1,8 @@
 import pytest
 from dagster import (
     DagsterInstance,
+    DynamicOut,
+    DynamicOutput,
     Int,
     Out,
     Output,
@@ -18,8 +20,11 @@
 )
 from dagster._core.execution.api import create_execution_plan, execute_plan
 from dagster._core.execution.plan.outputs import StepOutputHandle
-from dagster._core.execution.plan.plan import should_skip_step
+from dagster._core.execution.plan.plan import ExecutionPlan, should_skip_step
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
+from dagster._core.snap import snapshot_from_execution_plan
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._core.utils import make_new_run_id
 
@@ -621,3 +626,77 @@ def my_job():
         instance,
         run.run_id,
     )
+
+
+def test_rebuild_subset_from_snapshot():
+    job_def = define_diamond_job()
+    snapshot = snapshot_from_execution_plan(
+        create_execution_plan(job_def), job_def.get_job_snapshot_id()
+    )
+
+    full_plan = create_execution_plan(job_def, step_keys_to_execute=["add_three"])
+    plan = ExecutionPlan.rebuild_subset_from_snapshot(job_def.name, snapshot, ["add_three"])
+
+    assert plan.step_keys_to_execute == ["add_three"]
+    assert plan.get_executable_step_deps() == full_plan.get_executable_step_deps()
+    assert [step.key for step in plan.steps] == ["add_three"]
+
+    # upstream steps are rebuilt from the snapshot when looked up
+    upstream_handle = StepOutputHandle("return_two", "result")
+    assert plan.get_step_output(upstream_handle) == full_plan.get_step_output(upstream_handle)
+    assert plan.get_manager_key(upstream_handle, job_def) == "io_manager"
+    assert {step.key for step in plan.steps} == {"add_three", "return_two"}
+
+    # the steps that have not been loaded still count as part of the plan
+    assert plan.loads_steps_lazily
+    assert not full_plan.loads_steps_lazily
+    assert plan.get_all_step_keys() == full_plan.get_all_step_keys()
+    assert len(plan.get_all_step_keys()) == 4
+
+
+def test_rebuild_subset_from_snapshot_dynamic():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(3):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(num):
+        return num * 2
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @job
+    def dynamic_job():
+        total(emit().map(double).collect())
+
+    snapshot = snapshot_from_execution_plan(
+        create_execution_plan(dynamic_job), dynamic_job.get_job_snapshot_id()
+    )
+    known_state = KnownExecutionState(dynamic_mappings={"emit": {"result": ["0", "1", "2"]}})
+
+    plan = ExecutionPlan.rebuild_subset_from_snapshot(
+        dynamic_job.name, snapshot, ["double[1]"], known_state
+    )
+    full_plan = create_execution_plan(
+        dynamic_job, step_keys_to_execute=["double[1]"], known_state=known_state
+    )
+    step = plan.get_executable_step_by_key("double[1]")
+    assert step == full_plan.get_executable_step_by_key("double[1]")
+    # only the requested mapping key is resolved
+    assert {step.key for step in plan.steps} == {"double[?]", "double[1]"}
+
+    plan = ExecutionPlan.rebuild_subset_from_snapshot(
+        dynamic_job.name, snapshot, ["total"], known_state
+    )
+    full_plan = create_execution_plan(
+        dynamic_job, step_keys_to_execute=["total"], known_state=known_state
+    )
+    assert isinstance(plan.get_step_by_key("total"), ExecutionStep)
+    assert plan.get_step_by_key("total") == full_plan.get_step_by_key("total")
+    assert plan.get_executable_step_deps() == full_plan.get_executable_step_deps()
+
+    with pytest.raises(check.CheckError):
+        plan.get_step_by_key("double[3]")
@@ -1,7 +1,11 @@
 import asyncio
+import concurrent.futures
 
-from dagster import Output
+import mock
+import pytest
+from dagster import IOManager, IOManagerDefinition, Output, build_resources, job, resource
 from dagster._core.definitions.decorators import op
+from dagster._core.execution.event_loop import RunEventLoop
 from dagster._utils.test import wrap_op_in_graph_and_execute
 
 
@@ -23,3 +27,145 @@ async def aio_gen(_):
 
     result = wrap_op_in_graph_and_execute(aio_gen)
     assert result.output_value() == "done"
+
+
+def test_aio_ops_share_run_loop():
+    loops = []
+
+    @op
+    async def first():
+        loops.append(asyncio.get_running_loop())
+        return 1
+
+    @op
+    async def second(x):
+        loops.append(asyncio.get_running_loop())
+        yield Output(x + 1)
+
+    @job
+    def two_aio_ops():
+        second(first())
+
+    result = two_aio_ops.execute_in_process()
+    assert result.success
+    assert result.output_for_node("second") == 2
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    assert loops[0].is_closed()
+
+
+def test_run_loop_closes_async_gen():
+    cleanup = []
+
+    async def aio_gen():
+        try:
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+        finally:
+            cleanup.append(asyncio.get_running_loop())
+
+    event_loop = RunEventLoop()
+    try:
+        sync_gen = event_loop.iterate(aio_gen())
+        assert next(sync_gen) == 0
+        sync_gen.close()
+
+        # the async generator is closed on the run loop when the sync generator is closed early
+        assert cleanup == [event_loop.loop]
+    finally:
+        event_loop.close()
+
+
+def test_run_loop_cancels_on_interrupt():
+    cancelled = []
+
+    async def wait_forever():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    event_loop = RunEventLoop()
+    try:
+        with mock.patch.object(
+            concurrent.futures.Future, "result", side_effect=KeyboardInterrupt
+        ), pytest.raises(KeyboardInterrupt):
+            event_loop.run(wait_forever())
+
+        event_loop.run(asyncio.sleep(0.01))
+        assert cancelled == [True]
+    finally:
+        event_loop.close()
+
+
+def test_aio_resource():
+    events = []
+
+    @resource
+    async def aio_client():
+        await asyncio.sleep(0.01)
+        return {"loop": asyncio.get_running_loop()}
+
+    @resource
+    async def aio_gen_client():
+        events.append("setup")
+        yield asyncio.get_running_loop()
+        events.append("teardown")
+
+    @op(required_resource_keys={"client", "gen_client"})
+    async def uses_client(context):
+        assert context.resources.client["loop"] is asyncio.get_running_loop()
+        assert context.resources.gen_client is asyncio.get_running_loop()
+        return "done"
+
+    @job(resource_defs={"client": aio_client, "gen_client": aio_gen_client})
+    def aio_resource_job():
+        uses_client()
+
+    result = aio_resource_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("uses_client") == "done"
+    assert events == ["setup", "teardown"]
+
+
+def test_aio_resource_outside_run():
+    @resource
+    async def aio_gen_client():
+        yield "client"
+
+    with build_resources({"client": aio_gen_client}) as resources:
+        assert resources.client == "client"
+
+
+def test_aio_io_manager():
+    class AsyncIOManager(IOManager):
+        def __init__(self):
+            self.values = {}
+
+        async def handle_output(self, context, obj):
+            await asyncio.sleep(0.01)
+            self.values[context.step_key] = obj
+
+        async def load_input(self, context):
+            await asyncio.sleep(0.01)
+            return self.values[context.upstream_output.step_key]
+
+    io_manager_obj = AsyncIOManager()
+
+    @op
+    def emit():
+        return 1
+
+    @op
+    async def add_one(x):
+        return x + 1
+
+    @job(resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(io_manager_obj)})
+    def aio_io_manager_job():
+        add_one(emit())
+
+    result = aio_io_manager_job.execute_in_process()
+    assert result.success
+    assert io_manager_obj.values == {"emit": 1, "add_one": 2}
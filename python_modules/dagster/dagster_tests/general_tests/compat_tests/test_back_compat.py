@@ -38,10 +38,12 @@
 from dagster._core.storage.event_log.migration import migrate_event_log_data
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.utils import upgrading_instance
+from dagster._core.storage.runs.migration import RUN_SUMMARY_COLUMNS
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.sqlalchemy_compat import db_select
-from dagster._core.storage.tags import REPOSITORY_LABEL_TAG
+from dagster._core.storage.tags import BACKFILL_ID_TAG, REPOSITORY_LABEL_TAG
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import create_snapshot_id
+from dagster._serdes import create_snapshot_id, serialize_pp
 from dagster._serdes.serdes import (
     WhitelistMap,
     _whitelist_for_serdes,
@@ -1166,6 +1168,154 @@ def test_add_primary_keys():
             assert daemon_heartbeats_id_count == daemon_heartbeats_row_count
 
 
+def test_add_run_stats_rollup_tables():
+    src_dir = file_relative_path(__file__, "snapshot_1_5_4_pre_run_stats_rollups/sqlite")
+    run_id = "804c64c0-26a6-457d-ac59-0703947d76d6"
+
+    with copy_directory(src_dir) as test_dir:
+        index_db_path = os.path.join(test_dir, "history", "runs", "index.db")
+        run_db_path = os.path.join(test_dir, "history", "runs", f"{run_id}.db")
+        assert get_current_alembic_version(index_db_path) == "ec80dd91891a"
+        assert get_current_alembic_version(run_db_path) == "ec80dd91891a"
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            event_log_storage = instance.event_log_storage
+            assert isinstance(event_log_storage, SqlEventLogStorage)
+            assert "run_stats" not in get_sqlite3_tables(index_db_path)
+            assert "run_step_stats" not in get_sqlite3_tables(run_db_path)
+            assert not event_log_storage.has_stats_rollups(run_id)
+
+            # stats are read from the events until the rollups are built
+            step_stats = instance.get_run_step_stats(run_id)
+            assert [stats.step_key for stats in step_stats] == ["materialize", "downstream"]
+            run_stats = instance.get_run_stats(run_id)
+            assert run_stats.steps_succeeded == 2
+            assert run_stats.materializations == 1
+            assert run_stats.expectations == 1
+
+            instance.upgrade()
+
+            for db_path in [index_db_path, run_db_path]:
+                assert get_current_alembic_version(db_path) != "ec80dd91891a"
+                assert "run_stats" in get_sqlite3_tables(db_path)
+                assert "run_step_stats" in get_sqlite3_tables(db_path)
+            assert not event_log_storage.has_stats_rollups(run_id)
+
+            instance.reindex()
+
+            assert event_log_storage.has_stats_rollups(run_id)
+            assert instance.get_run_step_stats(run_id) == step_stats
+            assert instance.get_run_stats(run_id).steps_succeeded == 2
+
+
+def test_run_stats_rollups_with_unmigrated_run_shards():
+    src_dir = file_relative_path(__file__, "snapshot_1_5_4_pre_run_stats_rollups/sqlite")
+    run_id = "804c64c0-26a6-457d-ac59-0703947d76d6"
+
+    with copy_directory(src_dir) as test_dir:
+        # a missing index shard is recreated at the latest revision, next to the old run shards
+        os.unlink(os.path.join(test_dir, "history", "runs", "index.db"))
+        run_db_path = os.path.join(test_dir, "history", "runs", f"{run_id}.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            event_log_storage = instance.event_log_storage
+            assert isinstance(event_log_storage, SqlEventLogStorage)
+            assert "run_step_stats" not in get_sqlite3_tables(run_db_path)
+            assert not event_log_storage.has_stats_rollups(run_id)
+
+            assert len(instance.get_run_step_stats(run_id)) == 2
+            assert instance.get_run_stats(run_id).steps_succeeded == 2
+
+            # the rollups are not built until every run shard is migrated
+            instance.reindex()
+            assert not event_log_storage.has_stats_rollups(run_id)
+
+            event_log_storage.delete_events(run_id)
+            assert instance.get_run_step_stats(run_id) == []
+
+
+def test_add_run_summary_columns():
+    src_dir = file_relative_path(__file__, "snapshot_1_5_4_pre_run_stats_rollups/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+        assert "backfill_id" not in set(get_sqlite3_columns(db_path, "runs"))
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            run_storage = instance.run_storage
+            assert isinstance(run_storage, SqlRunStorage)
+            assert not run_storage.has_run_summary_cols()
+
+            backfill_run = instance.add_run(
+                DagsterRun(job_name="some_job", tags={BACKFILL_ID_TAG: "backfill_one"})
+            )
+
+            # summaries are built from the runs until the columns are added and populated
+            summaries = instance.get_run_summaries()
+            assert [summary.backfill_id for summary in summaries] == ["backfill_one", None]
+
+            instance.reindex()
+            assert not run_storage.has_built_index(RUN_SUMMARY_COLUMNS)
+
+            instance.upgrade()
+            assert "backfill_id" in set(get_sqlite3_columns(db_path, "runs"))
+            assert run_storage.has_run_summary_cols()
+            assert not run_storage.has_built_index(RUN_SUMMARY_COLUMNS)
+            assert instance.get_run_summaries() == summaries
+
+            instance.reindex()
+            assert run_storage.has_built_index(RUN_SUMMARY_COLUMNS)
+            assert instance.get_run_summaries() == summaries
+
+            assert [
+                summary.run_id
+                for summary in instance.get_run_summaries(
+                    RunsFilter(tags={BACKFILL_ID_TAG: "backfill_one"})
+                )
+            ] == [backfill_run.run_id]
+
+
+def test_add_snapshot_chunks_table():
+    src_dir = file_relative_path(__file__, "snapshot_1_5_4_pre_run_stats_rollups/sqlite")
+
+    @op
+    def noop_op():
+        pass
+
+    @job
+    def old_job():
+        noop_op()
+
+    @job
+    def new_job():
+        noop_op()
+        noop_op.alias("other_op")()
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+        assert "snapshot_chunks" not in get_sqlite3_tables(db_path)
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            run_storage = instance.run_storage
+            assert isinstance(run_storage, SqlRunStorage)
+
+            # snapshots are stored whole until the chunks table is added
+            old_snapshot_id = run_storage.add_job_snapshot(old_job.get_job_snapshot())
+
+            instance.upgrade()
+            assert "snapshot_chunks" in get_sqlite3_tables(db_path)
+
+            new_snapshot_id = run_storage.add_job_snapshot(new_job.get_job_snapshot())
+
+            run_storage._snapshot_cache.clear()
+            assert serialize_pp(run_storage.get_job_snapshot(old_snapshot_id)) == serialize_pp(
+                old_job.get_job_snapshot()
+            )
+            assert serialize_pp(run_storage.get_job_snapshot(new_snapshot_id)) == serialize_pp(
+                new_job.get_job_snapshot()
+            )
+
+
 # Prior to 0.10.0, it was possible to have `Materialization` events with no asset key.
 # `AssetMaterialization` is _supposed_ to runtime-check for null `AssetKey`, but it doesn't, so we
 # can deserialize a `Materialization` with a null asset key directly to an `AssetMaterialization`.
@@ -1,5 +1,6 @@
 import datetime
-import logging  # noqa: F401; used by mock in string form
+import logging
+import math
 import re
 import sys
 import time
@@ -62,7 +63,12 @@
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import (
+    STEP_STATS_EVENT_TYPES,
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.host_representation.origin import (
     ExternalJobOrigin,
     ExternalRepositoryOrigin,
@@ -78,6 +84,10 @@
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
+from dagster._core.storage.event_log.retention import (
+    DEFAULT_PURGEABLE_EVENT_TYPES,
+    PROTECTED_EVENT_TYPES,
+)
 from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -1283,6 +1293,256 @@ def _pipeline():
         assert len(step_stats[0].markers) == 1
         assert step_stats[0].markers[0].end_time >= step_stats[0].markers[0].start_time + 0.1
 
+    def _synthesize_stats_events(self, run_id):
+        @op(required_resource_keys={"foo"})
+        def materialize_op():
+            yield AssetMaterialization(asset_key="rollup_asset")
+            yield ExpectationResult(success=True, label="rollup_expectation")
+            yield Output(1)
+
+        @op
+        def retry_op(context, _input):
+            if context.retry_number < 2:
+                raise RetryRequested(max_retries=2)
+
+        def _ops():
+            retry_op(materialize_op())
+            should_succeed()
+
+        events, _ = _synthesize_events(_ops, run_id=run_id)
+        now = time.time()
+        return [
+            *events,
+            _event_record(
+                run_id,
+                "should_succeed",
+                now,
+                DagsterEventType.ENGINE_EVENT,
+                EngineEventData(marker_start="rollup_marker"),
+            ),
+            _event_record(
+                run_id,
+                "should_succeed",
+                now + 1,
+                DagsterEventType.ENGINE_EVENT,
+                EngineEventData(marker_end="rollup_marker"),
+            ),
+        ]
+
+    def _assert_stats_match_events(self, storage, run_id):
+        events = [record.event_log_entry for record in storage.get_records_for_run(run_id).records]
+
+        step_stats = storage.get_step_stats_for_run(run_id)
+        assert step_stats == build_run_step_stats_from_events(run_id, events)
+        assert storage.get_step_stats_for_run(
+            run_id, step_keys=["retry_op"]
+        ) == build_run_step_stats_from_events(
+            run_id, [event for event in events if event.step_key == "retry_op"]
+        )
+
+        run_stats = storage.get_stats_for_run(run_id)
+        expected_run_stats = build_run_stats_from_events(run_id, events)
+        for field in ["steps_succeeded", "steps_failed", "materializations", "expectations"]:
+            assert getattr(run_stats, field) == getattr(expected_run_stats, field)
+        for field in ["enqueued_time", "launch_time", "start_time", "end_time"]:
+            if getattr(expected_run_stats, field) is None:
+                assert getattr(run_stats, field) is None
+            else:
+                assert math.isclose(
+                    getattr(run_stats, field), getattr(expected_run_stats, field), abs_tol=1e-3
+                )
+
+        return step_stats
+
+    def test_run_stats_rollups(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_stats_rollups():
+            pytest.skip("This test is for SQL-backed stats rollups")
+
+        for event in self._synthesize_stats_events(test_run_id):
+            storage.store_event(event)
+
+        step_stats = self._assert_stats_match_events(storage, test_run_id)
+        assert [stats.step_key for stats in step_stats] == [
+            "materialize_op",
+            "should_succeed",
+            "retry_op",
+        ]
+        materialize_stats, succeed_stats, retry_stats = step_stats
+        assert len(materialize_stats.materialization_events) == 1
+        assert len(materialize_stats.expectation_results) == 1
+        assert len(succeed_stats.markers) == 1
+        assert succeed_stats.markers[0].end_time == succeed_stats.markers[0].start_time + 1
+        assert retry_stats.status == StepEventStatus.SUCCESS
+        assert retry_stats.attempts == 3
+        assert len(retry_stats.attempts_list) == 3
+
+        # rebuilding from the events produces the same rollups
+        storage.rebuild_stats_rollups_for_run(test_run_id)
+        assert self._assert_stats_match_events(storage, test_run_id) == step_stats
+
+        storage.delete_events(test_run_id)
+        assert storage.get_step_stats_for_run(test_run_id) == []
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+
+    def test_record_views_for_run(self, storage, test_run_id):
+        for event in self._synthesize_stats_events(test_run_id):
+            storage.store_event(event)
+
+        records = storage.get_records_for_run(test_run_id).records
+        views = storage.get_record_views_for_run(test_run_id)
+        assert [view.storage_id for view in views] == [record.storage_id for record in records]
+        if isinstance(storage, SqlEventLogStorage):
+            assert not any(view.is_event_log_entry_loaded for view in views)
+
+        for view, record in zip(views, records):
+            entry = record.event_log_entry
+            assert view.run_id == test_run_id
+            assert view.timestamp == pytest.approx(entry.timestamp, abs=1e-3)
+            assert view.dagster_event_type == entry.dagster_event_type
+            assert view.step_key == (
+                entry.dagster_event.step_key if entry.dagster_event else entry.step_key
+            )
+            assert view.asset_key == record.asset_key
+            assert view.partition_key == record.partition_key
+            assert view.event_log_entry == entry
+            assert view.is_event_log_entry_loaded
+
+        materialization_views = storage.get_record_views_for_run(
+            test_run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION
+        )
+        assert len(materialization_views) == 1
+        assert materialization_views[0].asset_key is not None
+
+        retry_views = storage.get_record_views_for_run(
+            test_run_id,
+            of_type={DagsterEventType.STEP_START, DagsterEventType.STEP_UP_FOR_RETRY},
+            step_keys=["retry_op"],
+        )
+        assert [view.storage_id for view in retry_views] == [
+            record.storage_id
+            for record in records
+            if record.event_log_entry.dagster_event_type
+            in {DagsterEventType.STEP_START, DagsterEventType.STEP_UP_FOR_RETRY}
+            and record.event_log_entry.step_key == "retry_op"
+        ]
+        assert [view.dagster_event_type for view in retry_views].count(
+            DagsterEventType.STEP_UP_FOR_RETRY
+        ) == 2
+
+    def test_purge_event_records(self, storage, test_run_id):
+        if not storage.supports_event_log_retention:
+            pytest.skip("storage does not support event log retention")
+
+        events = self._synthesize_stats_events(test_run_id)
+        events.append(
+            EventLogEntry(
+                error_info=None,
+                user_message="a log message",
+                level=logging.INFO,
+                run_id=test_run_id,
+                timestamp=time.time(),
+                step_key="should_succeed",
+                job_name="foo",
+            )
+        )
+        for event in events:
+            storage.store_event(event)
+
+        stats = storage.get_stats_for_run(test_run_id)
+        step_stats = storage.get_step_stats_for_run(test_run_id)
+        records = storage.get_records_for_run(test_run_id).records
+
+        purgeable = storage.get_purgeable_records_for_run(
+            test_run_id,
+            event_types=set(DEFAULT_PURGEABLE_EVENT_TYPES),
+            include_log_messages=True,
+            limit=1000,
+        )
+        assert purgeable
+        assert [record.storage_id for record in purgeable] == sorted(
+            record.storage_id for record in purgeable
+        )
+        assert any(not record.event_log_entry.is_dagster_event for record in purgeable)
+        assert not any(
+            record.event_log_entry.dagster_event_type in PROTECTED_EVENT_TYPES
+            for record in purgeable
+        )
+        if isinstance(storage, SqlEventLogStorage) and not storage.has_stats_rollups(test_run_id):
+            # the events behind run and step stats are kept when stats are computed from them
+            assert not any(
+                record.event_log_entry.dagster_event_type in STEP_STATS_EVENT_TYPES
+                for record in purgeable
+            )
+
+        assert (
+            storage.get_purgeable_records_for_run(
+                test_run_id,
+                event_types=set(DEFAULT_PURGEABLE_EVENT_TYPES),
+                include_log_messages=True,
+                limit=2,
+            )
+            == purgeable[:2]
+        )
+        assert not storage.get_purgeable_records_for_run(
+            test_run_id, event_types=set(), include_log_messages=False, limit=1000
+        )
+
+        storage.delete_event_records(test_run_id, [record.storage_id for record in purgeable])
+
+        purged_ids = {record.storage_id for record in purgeable}
+        assert [
+            record.storage_id for record in storage.get_records_for_run(test_run_id).records
+        ] == [record.storage_id for record in records if record.storage_id not in purged_ids]
+        assert not storage.get_purgeable_records_for_run(
+            test_run_id,
+            event_types=set(DEFAULT_PURGEABLE_EVENT_TYPES),
+            include_log_messages=True,
+            limit=1000,
+        )
+        assert storage.get_stats_for_run(test_run_id) == stats
+        assert storage.get_step_stats_for_run(test_run_id) == step_stats
+        assert storage.get_latest_materialization_events([AssetKey("rollup_asset")])[
+            AssetKey("rollup_asset")
+        ]
+
+    def test_run_stats_rollups_concurrent_writers(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_stats_rollups():
+            pytest.skip("This test is for SQL-backed stats rollups")
+        if isinstance(storage, InMemoryEventLogStorage):
+            pytest.skip("In-memory storage does not support concurrent writers")
+
+        events = self._synthesize_stats_events(test_run_id)
+
+        # each writer stores the events of one step in order, like a step worker does, while the
+        # run events are stored by another writer
+        events_by_writer = {}
+        for event in events:
+            events_by_writer.setdefault(event.step_key, []).append(event)
+
+        def _store_events(writer_events):
+            for event in writer_events:
+                storage.store_event(event)
+
+        with ThreadPoolExecutor(max_workers=len(events_by_writer)) as executor:
+            list(executor.map(_store_events, events_by_writer.values()))
+
+        self._assert_stats_match_events(storage, test_run_id)
+
+    def test_run_stats_rollups_rebuilt_after_failed_update(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_stats_rollups():
+            pytest.skip("This test is for SQL-backed stats rollups")
+
+        # every read-modify-write update of the step stats gives up, so the run is flagged and its
+        # rollups are rebuilt from the events on read
+        with mock.patch(
+            "dagster._core.storage.event_log.sql_event_log.MAX_STEP_STATS_UPDATE_ATTEMPTS", 0
+        ):
+            for event in self._synthesize_stats_events(test_run_id):
+                storage.store_event(event)
+
+        step_stats = self._assert_stats_match_events(storage, test_run_id)
+        assert len(step_stats) == 3
+
     @pytest.mark.parametrize(
         "cursor_dt", cursor_datetime_args()
     )  # test both tz-aware and naive datetimes
@@ -1890,6 +2150,97 @@ def op_partitioned(context):
                 )
                 assert len(records) == 3
 
+                views = storage.get_event_record_views(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                        asset_key=AssetKey("asset_key"),
+                        asset_partitions=["partition_a", "partition_b"],
+                    )
+                )
+                assert [view.storage_id for view in views] == [
+                    record.storage_id for record in records
+                ]
+                assert [view.partition_key for view in views] == [
+                    record.partition_key for record in records
+                ]
+                assert all(view.asset_key == AssetKey("asset_key") for view in views)
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iterate_event_records(self, storage, instance, prefetch):
+        asset_key = AssetKey(["iterated"])
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            for i in range(7):
+                storage.store_event(
+                    EventLogEntry(
+                        error_info=None,
+                        level="debug",
+                        user_message="",
+                        run_id=run_id,
+                        timestamp=time.time(),
+                        dagster_event=DagsterEvent(
+                            DagsterEventType.ASSET_MATERIALIZATION.value,
+                            "nonce",
+                            event_specific_data=StepMaterializationData(
+                                AssetMaterialization(asset_key=asset_key, partition=str(i))
+                            ),
+                        ),
+                    )
+                )
+
+            records_filter = EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+            )
+            ascending_ids = [
+                record.storage_id
+                for record in storage.get_event_records(records_filter, ascending=True)
+            ]
+            assert len(ascending_ids) == 7
+
+            for page_size in [1, 3, 7, 10]:
+                assert [
+                    record.storage_id
+                    for record in storage.iterate_event_records(
+                        records_filter, page_size=page_size, prefetch=prefetch
+                    )
+                ] == ascending_ids
+                assert [
+                    record.storage_id
+                    for record in storage.iterate_event_records(
+                        records_filter, ascending=False, page_size=page_size, prefetch=prefetch
+                    )
+                ] == list(reversed(ascending_ids))
+
+            # cursors on the filter bound the pages
+            assert [
+                record.storage_id
+                for record in storage.iterate_event_records(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                        asset_key=asset_key,
+                        after_cursor=ascending_ids[1],
+                        before_cursor=ascending_ids[5],
+                    ),
+                    ascending=False,
+                    page_size=2,
+                    prefetch=prefetch,
+                )
+            ] == list(reversed(ascending_ids[2:5]))
+
+            # consumers can stop early
+            records = storage.iterate_event_records(records_filter, page_size=2, prefetch=prefetch)
+            assert next(records).storage_id == ascending_ids[0]
+            records.close()
+
+            run_records = storage.get_records_for_run(run_id).records
+            for page_size in [1, 3, 10]:
+                assert [
+                    record.storage_id
+                    for record in storage.iterate_records_for_run(
+                        run_id, page_size=page_size, prefetch=prefetch
+                    )
+                ] == [record.storage_id for record in run_records]
+
     def test_get_asset_keys(self, storage, test_run_id):
         @op
         def gen_op():
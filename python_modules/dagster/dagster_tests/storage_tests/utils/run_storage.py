@@ -6,6 +6,7 @@
 
 import pendulum
 import pytest
+import sqlalchemy as db
 from dagster import _seven, job, op
 from dagster._core.definitions import GraphDefinition
 from dagster._core.errors import (
@@ -27,14 +28,21 @@
     DagsterRun,
     DagsterRunStatus,
     RunsFilter,
+    RunSummary,
 )
 from dagster._core.storage.event_log import InMemoryEventLogStorage
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
-from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.migration import (
+    REQUIRED_DATA_MIGRATIONS,
+    migrate_run_summary_columns,
+)
+from dagster._core.storage.runs.schema import RunsTable, SnapshotChunksTable
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.tags import (
+    BACKFILL_ID_TAG,
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
@@ -588,6 +596,122 @@ def test_fetch_by_tags(self, storage):
         some_runs = storage.get_runs(RunsFilter(tags={}))
         assert len(some_runs) == 3
 
+    def test_run_summaries(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        origin = self.fake_job_origin("some_job", "fake_repo_one")
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                job_name="some_job",
+                tags={BACKFILL_ID_TAG: "backfill_one", "mytag": "hello"},
+                external_job_origin=origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                job_name="some_job",
+                tags={BACKFILL_ID_TAG: "backfill_two", "mytag": "hello"},
+                status=DagsterRunStatus.SUCCESS,
+                external_job_origin=origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                job_name="other_job",
+                tags={
+                    PARTITION_NAME_TAG: "a",
+                    PARTITION_SET_TAG: "some_partition_set",
+                    ROOT_RUN_ID_TAG: one,
+                    PARENT_RUN_ID_TAG: one,
+                },
+            )
+        )
+
+        summaries = storage.get_run_summaries()
+        assert [summary.run_id for summary in summaries] == [three, two, one]
+        assert summaries == [
+            RunSummary.from_run_record(record) for record in storage.get_run_records()
+        ]
+
+        summary = summaries[2]
+        assert summary.job_name == "some_job"
+        assert summary.status == DagsterRunStatus.NOT_STARTED
+        assert summary.backfill_id == "backfill_one"
+        assert summary.repository_label == "fake_repo_one@fake:fake"
+        assert summary.root_run_id is None
+
+        summary = summaries[0]
+        assert summary.partition == "a"
+        assert summary.partition_set == "some_partition_set"
+        assert summary.backfill_id is None
+        assert summary.root_run_id == one
+
+        def _run_ids(filters):
+            summaries = storage.get_run_summaries(filters)
+            assert storage.get_runs_count(filters) == len(summaries)
+            assert [summary.run_id for summary in summaries] == [
+                run.run_id for run in storage.get_runs(filters)
+            ]
+            return [summary.run_id for summary in summaries]
+
+        assert _run_ids(RunsFilter(tags={BACKFILL_ID_TAG: "backfill_one"})) == [one]
+        assert _run_ids(RunsFilter(tags={BACKFILL_ID_TAG: ["backfill_one", "backfill_two"]})) == [
+            two,
+            one,
+        ]
+        assert _run_ids(
+            RunsFilter(
+                job_name="some_job",
+                statuses=[DagsterRunStatus.SUCCESS],
+                tags={REPOSITORY_LABEL_TAG: "fake_repo_one@fake:fake", "mytag": "hello"},
+            )
+        ) == [two]
+        assert _run_ids(RunsFilter(tags={ROOT_RUN_ID_TAG: one})) == [three]
+        assert _run_ids(RunsFilter(tags={BACKFILL_ID_TAG: "backfill_one", "mytag": "bye"})) == []
+
+        # tag updates are reflected in the summaries
+        storage.add_run_tags(three, {BACKFILL_ID_TAG: "backfill_one"})
+        assert _run_ids(RunsFilter(tags={BACKFILL_ID_TAG: "backfill_one"})) == [three, one]
+
+        assert [summary.run_id for summary in storage.get_run_summaries(limit=1, cursor=two)] == [
+            one
+        ]
+
+    def test_migrate_run_summary_columns(self, storage):
+        assert storage
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("storage does not denormalize run summary columns")
+
+        one = make_new_run_id()
+        two = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                job_name="some_job",
+                tags={BACKFILL_ID_TAG: "backfill_one"},
+                external_job_origin=self.fake_job_origin("some_job", "fake_repo_one"),
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(run_id=two, job_name="some_job", tags={ROOT_RUN_ID_TAG: one})
+        )
+        expected = storage.get_run_summaries()
+
+        # clear the columns, as for runs written before they were added
+        with storage.connect() as conn:
+            conn.execute(
+                RunsTable.update().values(backfill_id=None, repository_label=None, root_run_id=None)
+            )
+        assert storage.get_run_summaries() != expected
+
+        migrate_run_summary_columns(storage)
+        assert storage.get_run_summaries() == expected
+
     def test_paginated_fetch(self, storage):
         assert storage
         one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
@@ -914,6 +1038,106 @@ def test_write_conflicting_run_id(self, storage: RunStorage):
         with pytest.raises(DagsterRunAlreadyExists):
             storage.add_run(run)
 
+    def test_add_runs(self, storage: RunStorage):
+        job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
+        job_snapshot_id = storage.add_job_snapshot(job_def.get_job_snapshot())
+
+        runs = [
+            DagsterRun(
+                run_id=make_new_run_id(),
+                job_name=job_def.name,
+                job_snapshot_id=job_snapshot_id,
+                tags={"foo": str(i)},
+            )
+            for i in range(3)
+        ]
+        assert storage.add_runs(runs) == runs
+        assert storage.add_runs([]) == []
+
+        for run in runs:
+            assert _get_run_by_id(storage, run.run_id) == run
+        assert dict(storage.get_run_tags()) == {"foo": {"0", "1", "2"}}
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs([DagsterRun(run_id=make_new_run_id(), job_name="other"), runs[0]])
+
+        with pytest.raises(DagsterSnapshotDoesNotExist):
+            storage.add_runs(
+                [DagsterRun(run_id=make_new_run_id(), job_name="other", job_snapshot_id="nope")]
+            )
+
+    def test_snapshot_chunks(self, storage):
+        from dagster._core.execution.api import create_execution_plan
+        from dagster._core.snap import snapshot_from_execution_plan
+
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("storage does not store snapshots in chunks")
+
+        @op
+        def op_one():
+            return 1
+
+        @op
+        def op_two(x):
+            return x
+
+        @job
+        def job_one():
+            op_two(op_one())
+
+        @job
+        def job_two():
+            op_two(op_one())
+            op_one()
+
+        def _count_chunks():
+            with storage.connect() as conn:
+                return conn.execute(
+                    db_select([db.func.count()]).select_from(SnapshotChunksTable)
+                ).scalar()
+
+        job_one_snapshot_id = storage.add_job_snapshot(job_one.get_job_snapshot())
+        chunk_count = _count_chunks()
+        assert chunk_count > 0
+
+        # the config schema, types and op definitions of the two jobs are stored once
+        job_two_snapshot_id = storage.add_job_snapshot(job_two.get_job_snapshot())
+        assert 0 < _count_chunks() - chunk_count < chunk_count
+
+        # the steps shared between execution plans of the same job are stored once
+        chunk_count = _count_chunks()
+        full_plan_snapshot = snapshot_from_execution_plan(
+            create_execution_plan(job_two), job_two.get_job_snapshot_id()
+        )
+        subset_plan_snapshot = snapshot_from_execution_plan(
+            create_execution_plan(job_two, step_keys_to_execute=["op_one"]),
+            job_two.get_job_snapshot_id(),
+        )
+        full_plan_snapshot_id = storage.add_execution_plan_snapshot(full_plan_snapshot)
+        steps_chunk_count = _count_chunks() - chunk_count
+        subset_plan_snapshot_id = storage.add_execution_plan_snapshot(subset_plan_snapshot)
+        assert _count_chunks() - chunk_count == steps_chunk_count
+
+        # read back through a fresh cache
+        storage._snapshot_cache.clear()  # noqa: SLF001
+        assert serialize_pp(storage.get_job_snapshot(job_one_snapshot_id)) == serialize_pp(
+            job_one.get_job_snapshot()
+        )
+        assert serialize_pp(storage.get_job_snapshot(job_two_snapshot_id)) == serialize_pp(
+            job_two.get_job_snapshot()
+        )
+        assert storage.get_execution_plan_snapshot(full_plan_snapshot_id) == full_plan_snapshot
+        assert storage.get_execution_plan_snapshot(subset_plan_snapshot_id) == (
+            subset_plan_snapshot
+        )
+        assert storage.has_execution_plan_snapshot(subset_plan_snapshot_id)
+        assert not storage.has_execution_plan_snapshot("nope")
+
+        if self.can_delete_runs():
+            storage.wipe()
+            assert _count_chunks() == 0
+            assert not storage.has_job_snapshot(job_one_snapshot_id)
+
     def test_add_get_snapshot(self, storage):
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
         job_snapshot = job_def.get_job_snapshot()
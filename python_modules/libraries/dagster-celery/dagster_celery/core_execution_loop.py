@@ -137,7 +137,7 @@ def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
                         step,
                         queue,
                         priority,
-                        active_execution.get_known_state(),
+                        active_execution.get_known_state_for_steps([step]),
                     )
 
                 except Exception:
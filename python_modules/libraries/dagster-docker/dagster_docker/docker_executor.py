@@ -43,6 +43,14 @@
                 ),
             ),
             "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+            "max_concurrent_launches": Field(
+                IntSource,
+                is_required=False,
+                description=(
+                    "Number of threads used to start containers for steps that become ready at"
+                    " the same time. Defaults to launching one step at a time."
+                ),
+            ),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -82,6 +90,7 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
     retries = check.dict_elem(config, "retries", key_type=str)
     max_concurrent = check.opt_int_elem(config, "max_concurrent")
     tag_concurrency_limits = check.opt_list_elem(config, "tag_concurrency_limits")
+    max_concurrent_launches = check.opt_int_elem(config, "max_concurrent_launches")
 
     validate_docker_config(network, networks, container_kwargs)
 
@@ -100,6 +109,7 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
         retries=check.not_none(RetryMode.from_config(retries)),
         max_concurrent=max_concurrent,
         tag_concurrency_limits=tag_concurrency_limits,
+        max_concurrent_launches=max_concurrent_launches,
     )
 
 
@@ -69,6 +69,15 @@
             ),
         ),
         "tag_concurrency_limits": get_tag_concurrency_limits_config(),
+        "max_concurrent_launches": Field(
+            IntSource,
+            is_required=False,
+            description=(
+                "Number of threads used to create Kubernetes Jobs for steps that become ready at"
+                " the same time, e.g. after a large dynamic fan-out. Defaults to launching one"
+                " step at a time."
+            ),
+        ),
         "step_k8s_config": Field(
             USER_DEFINED_K8S_CONFIG_SCHEMA,
             is_required=False,
@@ -166,6 +175,7 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
         max_concurrent=check.opt_int_elem(exc_cfg, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(exc_cfg, "tag_concurrency_limits"),
         should_verify_step=True,
+        max_concurrent_launches=check.opt_int_elem(exc_cfg, "max_concurrent_launches"),
     )
 
 
@@ -105,6 +105,7 @@ def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._reset_stats_rollup_tables_cache()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
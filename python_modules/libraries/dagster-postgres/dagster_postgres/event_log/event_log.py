@@ -1,8 +1,11 @@
+import logging
+from datetime import datetime
 from typing import Any, ContextManager, Mapping, Optional, Sequence
 
 import dagster._check as check
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
+import sqlalchemy.exc as db_exc
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
@@ -11,6 +14,7 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
+    AssetEventTagsTable,
     AssetKeyTable,
     DynamicPartitionsTable,
     SqlEventLogStorage,
@@ -29,6 +33,7 @@
 )
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_value
+from dagster._utils import PrintFn
 from sqlalchemy.engine import Connection
 
 from ..utils import (
@@ -39,9 +44,21 @@
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .partitioning import (
+    EventLogPartitioningSettings,
+    build_partitioned_event_log_metadata,
+    create_default_partition,
+    create_partitions,
+    get_partition_bounds,
+    is_event_logs_partitioned,
+    next_partition_start,
+    partition_start,
+)
 
 CHANNEL_NAME = "run_events"
 
+UNPARTITIONED_EVENT_LOGS_TABLE = "event_logs_unpartitioned"
+
 
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """Postgres-backed event log storage.
@@ -70,6 +87,12 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
 
+    Setting ``event_log_partitioning`` creates the ``event_logs`` table range-partitioned by event
+    timestamp, with a partition per ``interval`` created ahead of the events being stored. Queries
+    with a bound on the event timestamp then only scan the matching partitions, and old partitions
+    can be detached or dropped without bloating the indexes of the others. Existing tables can be
+    converted with :py:meth:`migrate_to_partitioned_event_logs`.
+
     """
 
     def __init__(
@@ -77,12 +100,24 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        event_log_partitioning: Optional[Mapping[str, Any]] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        event_log_partitioning = check.opt_mapping_param(
+            event_log_partitioning, "event_log_partitioning"
+        )
+        self._partitioning_settings = (
+            EventLogPartitioningSettings.from_config(event_log_partitioning)
+            if event_log_partitioning is not None
+            else None
+        )
+        self._event_logs_partitioned: Optional[bool] = None
+        # exclusive upper bound of the partitions known to exist
+        self._partition_horizon: Optional[datetime] = None
 
         self._disposed = False
 
@@ -104,12 +139,23 @@ def __init__(
                 self.reindex_events()
                 self.reindex_assets()
 
+        if self._partitioning_settings and not self.is_event_logs_partitioned:
+            logging.getLogger("dagster").warning(
+                "event_log_partitioning is configured, but the existing event_logs table is not"
+                " partitioned. Run PostgresEventLogStorage.migrate_to_partitioned_event_logs to"
+                " convert it."
+            )
+
         super().__init__()
 
     def _init_db(self) -> None:
         with self._connect() as conn:
             with conn.begin():
-                SqlEventLogStorageMetadata.create_all(conn)
+                if self._partitioning_settings:
+                    build_partitioned_event_log_metadata().create_all(conn)
+                    create_default_partition(conn)
+                else:
+                    SqlEventLogStorageMetadata.create_all(conn)
                 stamp_alembic_rev(pg_alembic_config(__file__), conn)
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
@@ -132,6 +178,7 @@ def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._reset_stats_rollup_tables_cache()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -149,21 +196,81 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            event_log_partitioning=config_value.get("event_log_partitioning"),
         )
 
     @staticmethod
     def create_clean_storage(
-        conn_string: str, should_autocreate_tables: bool = True
+        conn_string: str,
+        should_autocreate_tables: bool = True,
+        event_log_partitioning: Optional[Mapping[str, Any]] = None,
     ) -> "PostgresEventLogStorage":
         engine = create_engine(
             conn_string, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
         try:
             SqlEventLogStorageMetadata.drop_all(engine)
+            with engine.connect() as conn:
+                conn.execute(db.text(f"DROP TABLE IF EXISTS {UNPARTITIONED_EVENT_LOGS_TABLE}"))
         finally:
             engine.dispose()
 
-        return PostgresEventLogStorage(conn_string, should_autocreate_tables)
+        return PostgresEventLogStorage(
+            conn_string, should_autocreate_tables, event_log_partitioning=event_log_partitioning
+        )
+
+    @property
+    def is_event_logs_partitioned(self) -> bool:
+        """Whether the event_logs table is range-partitioned by event timestamp."""
+        if self._event_logs_partitioned is None:
+            with self._connect() as conn:
+                self._event_logs_partitioned = is_event_logs_partitioned(conn)
+        return self._event_logs_partitioned
+
+    def get_event_log_partitions(self) -> Mapping[str, Optional[str]]:
+        """The names of the partitions of the event_logs table, mapped to their bounds, or to None
+        for the default partition that holds events outside of every other partition.
+        """
+        if not self.is_event_logs_partitioned:
+            return {}
+        with self._connect() as conn:
+            return dict(get_partition_bounds(conn))
+
+    def _ensure_event_log_partitions(self, timestamp: float) -> None:
+        settings = check.not_none(self._partitioning_settings)
+        event_datetime = datetime.utcfromtimestamp(timestamp)
+
+        # keep `premake` partitions ahead of the partition of the event being stored, so that
+        # partitions are created well before any event lands in them
+        required_horizon = partition_start(event_datetime, settings.interval)
+        for _ in range(settings.premake + 1):
+            required_horizon = next_partition_start(required_horizon, settings.interval)
+        if self._partition_horizon and required_horizon <= self._partition_horizon:
+            return
+
+        start = (
+            max(event_datetime, self._partition_horizon)
+            if self._partition_horizon
+            else event_datetime
+        )
+        for attempt in range(2):
+            try:
+                with self._connect() as conn:
+                    self._partition_horizon = create_partitions(
+                        conn, start, required_horizon, settings.interval
+                    )
+                return
+            except db_exc.DatabaseError:
+                # concurrent writers may race to create the same partition, in which case the
+                # retry finds it in place
+                if attempt:
+                    logging.getLogger("dagster").warning(
+                        "Could not create event_logs partitions up to"
+                        f" {required_horizon.isoformat()}, events outside of the existing"
+                        " partitions will be stored in the default partition.",
+                        exc_info=True,
+                    )
+                    self._partition_horizon = required_horizon
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a run.
@@ -172,6 +279,9 @@ def store_event(self, event: EventLogEntry) -> None:
             event (EventLogEntry): The event to store.
         """
         check.inst_param(event, "event", EventLogEntry)
+        if self._partitioning_settings and self.is_event_logs_partitioned:
+            self._ensure_event_log_partitions(event.timestamp)
+
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
         with self._connect() as conn:
             result = conn.execute(
@@ -189,6 +299,8 @@ def store_event(self, event: EventLogEntry) -> None:
             )
             event_id = int(res[1])  # type: ignore
 
+        self.update_stats_rollups(event, event_id)
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -278,6 +390,115 @@ def add_dynamic_partitions(
                 .on_conflict_do_nothing(),
             )
 
+    def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
+        if self.is_event_logs_partitioned:
+            # the tags of the deleted events are not removed by a cascading foreign key, which a
+            # partitioned event_logs table cannot be referenced by
+            conn.execute(
+                AssetEventTagsTable.delete().where(
+                    AssetEventTagsTable.c.event_id.in_(
+                        db_select([SqlEventLogStorageTable.c.id]).where(
+                            SqlEventLogStorageTable.c.run_id == run_id
+                        )
+                    )
+                )
+            )
+        super().delete_events_for_run(conn, run_id)
+
+    def migrate_to_partitioned_event_logs(
+        self, print_fn: Optional[PrintFn] = None, batch_size: int = 100000
+    ) -> None:
+        """Converts an existing event_logs table into a table range-partitioned by event
+        timestamp, using the configured `event_log_partitioning` settings. All events are copied
+        into the new table, in batches of storage ids, within a single transaction, so this should
+        be run while no runs are writing events.
+        """
+        settings = check.not_none(
+            self._partitioning_settings,
+            "event_log_partitioning must be configured to migrate to a partitioned event_logs"
+            " table",
+        )
+        check.int_param(batch_size, "batch_size")
+        if self.is_event_logs_partitioned:
+            if print_fn:
+                print_fn("The event_logs table is already partitioned.")
+            return
+
+        event_logs = build_partitioned_event_log_metadata().tables[SqlEventLogStorageTable.name]
+        column_names = ", ".join(f'"{column.name}"' for column in event_logs.columns)
+        source_column_names = column_names.replace(
+            '"timestamp"', "COALESCE(\"timestamp\", TIMESTAMP 'epoch')"
+        )
+
+        with self._connect() as conn:
+            with conn.begin():
+                # move the existing table, and its index and constraint names, out of the way
+                conn.execute(
+                    db.text(
+                        f"ALTER TABLE {SqlEventLogStorageTable.name} RENAME TO"
+                        f" {UNPARTITIONED_EVENT_LOGS_TABLE}"
+                    )
+                )
+                conn.execute(
+                    db.text(
+                        f"ALTER TABLE {UNPARTITIONED_EVENT_LOGS_TABLE} RENAME CONSTRAINT"
+                        f" {SqlEventLogStorageTable.name}_pkey TO"
+                        f" {UNPARTITIONED_EVENT_LOGS_TABLE}_pkey"
+                    )
+                )
+                for index in SqlEventLogStorageTable.indexes:
+                    conn.execute(
+                        db.text(
+                            f"ALTER INDEX IF EXISTS {index.name} RENAME TO"
+                            f" {index.name}_unpartitioned"
+                        )
+                    )
+                conn.execute(
+                    db.text(
+                        f"ALTER TABLE {AssetEventTagsTable.name} DROP CONSTRAINT IF EXISTS"
+                        f" {AssetEventTagsTable.name}_event_id_fkey"
+                    )
+                )
+
+                event_logs.create(conn)
+                create_default_partition(conn)
+                min_timestamp, min_id, max_id = conn.execute(db.text(f'SELECT MIN("timestamp"), MIN(id), MAX(id) FROM {UNPARTITIONED_EVENT_LOGS_TABLE}')).fetchone()  # type: ignore
+                now = datetime.utcnow()
+                until = partition_start(now, settings.interval)
+                for _ in range(settings.premake + 1):
+                    until = next_partition_start(until, settings.interval)
+                create_partitions(conn, min_timestamp or now, until, settings.interval)
+
+                if max_id is not None:
+                    for batch_start in range(min_id, max_id + 1, batch_size):
+                        conn.execute(
+                            db.text(
+                                f"INSERT INTO {SqlEventLogStorageTable.name} ({column_names})"
+                                f" SELECT {source_column_names} FROM"
+                                f" {UNPARTITIONED_EVENT_LOGS_TABLE}"
+                                " WHERE id >= :batch_start AND id < :batch_end"
+                            ),
+                            {"batch_start": batch_start, "batch_end": batch_start + batch_size},
+                        )
+                        if print_fn:
+                            print_fn(
+                                "Copied events with storage ids up to"
+                                f" {min(batch_start + batch_size - 1, max_id)} of {max_id}."
+                            )
+                    conn.execute(
+                        db.text(
+                            "SELECT setval(pg_get_serial_sequence(:table_name, 'id'), :max_id)"
+                        ),
+                        {"table_name": SqlEventLogStorageTable.name, "max_id": max_id},
+                    )
+
+                conn.execute(db.text(f"DROP TABLE {UNPARTITIONED_EVENT_LOGS_TABLE}"))
+
+        self._event_logs_partitioned = None
+        self._partition_horizon = None
+        if print_fn:
+            print_fn("Finished migrating to a partitioned event_logs table.")
+
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
 
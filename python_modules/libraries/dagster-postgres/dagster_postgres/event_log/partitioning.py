@@ -0,0 +1,178 @@
+"""Declarative range partitioning of the Postgres ``event_logs`` table by event timestamp.
+
+A partitioned ``event_logs`` table keeps each partition's indexes small, lets old partitions be
+vacuumed, archived, or dropped independently, and lets Postgres skip partitions entirely for queries
+with a bound on the event timestamp. Since Postgres requires the partition key to be part of every
+unique constraint, the partitioned table has a composite ``(id, timestamp)`` primary key, and the
+``asset_event_tags`` table cannot keep its foreign key to ``event_logs.id``.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Mapping, NamedTuple, Optional, Tuple
+
+import dagster._check as check
+import sqlalchemy as db
+from dagster._core.storage.event_log import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from sqlalchemy.engine import Connection
+
+PARTITION_INTERVALS = ("day", "week", "month")
+DEFAULT_PARTITION_INTERVAL = "month"
+DEFAULT_PREMAKE_PARTITIONS = 3
+
+DEFAULT_PARTITION_NAME = "event_logs_default"
+
+
+class EventLogPartitioningSettings(NamedTuple):
+    interval: str
+    premake: int
+
+    @staticmethod
+    def from_config(config: Mapping[str, object]) -> "EventLogPartitioningSettings":
+        interval = check.str_param(config.get("interval", DEFAULT_PARTITION_INTERVAL), "interval")
+        check.invariant(
+            interval in PARTITION_INTERVALS,
+            f"Unexpected event log partition interval {interval}, expected one of"
+            f" {', '.join(PARTITION_INTERVALS)}",
+        )
+        return EventLogPartitioningSettings(
+            interval=interval,
+            premake=check.int_param(config.get("premake", DEFAULT_PREMAKE_PARTITIONS), "premake"),
+        )
+
+
+def partition_start(timestamp: datetime, interval: str) -> datetime:
+    """The inclusive lower bound of the partition holding events with the given (naive, UTC)
+    timestamp.
+    """
+    day = datetime(timestamp.year, timestamp.month, timestamp.day)
+    if interval == "day":
+        return day
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    return datetime(timestamp.year, timestamp.month, 1)
+
+
+def next_partition_start(start: datetime, interval: str) -> datetime:
+    if interval == "day":
+        return start + timedelta(days=1)
+    if interval == "week":
+        return start + timedelta(days=7)
+    if start.month == 12:
+        return datetime(start.year + 1, 1, 1)
+    return datetime(start.year, start.month + 1, 1)
+
+
+def partition_table_name(start: datetime) -> str:
+    return f"event_logs_p{start:%Y%m%d}"
+
+
+def build_partitioned_event_log_metadata() -> db.MetaData:
+    """A copy of the event log storage schema in which ``event_logs`` is range partitioned by
+    timestamp.
+    """
+    metadata = db.MetaData()
+    for table in SqlEventLogStorageMetadata.sorted_tables:
+        if table.name != SqlEventLogStorageTable.name:
+            table.to_metadata(metadata)
+
+    event_logs = db.Table(
+        SqlEventLogStorageTable.name,
+        metadata,
+        *[
+            db.Column(
+                column.name,
+                column.type,
+                primary_key=column.name in ("id", "timestamp"),
+                autoincrement=column.name == "id",
+                nullable=column.nullable and column.name != "timestamp",
+            )
+            for column in SqlEventLogStorageTable.columns
+        ],
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    for index in SqlEventLogStorageTable.indexes:
+        db.Index(
+            index.name,
+            *[event_logs.c[column.name] for column in index.columns],
+            unique=index.unique,
+            **index.kwargs,
+        )
+
+    # foreign keys to a partitioned table must reference all of its partition key columns
+    for table in metadata.tables.values():
+        for constraint in list(table.foreign_key_constraints):
+            if constraint.referred_table is event_logs:
+                table.constraints.discard(constraint)
+                for column in constraint.columns:
+                    column.foreign_keys.clear()
+                table.foreign_keys.difference_update(constraint.elements)
+
+    return metadata
+
+
+def is_event_logs_partitioned(conn: Connection) -> bool:
+    return bool(
+        conn.execute(
+            db.text(
+                "SELECT 1 FROM pg_catalog.pg_partitioned_table pt"
+                " JOIN pg_catalog.pg_class c ON c.oid = pt.partrelid"
+                " WHERE c.relname = :table_name AND pg_catalog.pg_table_is_visible(c.oid)"
+            ),
+            {"table_name": SqlEventLogStorageTable.name},
+        ).scalar()
+    )
+
+
+def get_partition_bounds(conn: Connection) -> List[Tuple[str, Optional[str]]]:
+    """The names and bound expressions of the partitions of ``event_logs``, where the default
+    partition has no bound expression.
+    """
+    rows = conn.execute(
+        db.text(
+            "SELECT child.relname, pg_catalog.pg_get_expr(child.relpartbound, child.oid)"
+            " FROM pg_catalog.pg_inherits i"
+            " JOIN pg_catalog.pg_class parent ON parent.oid = i.inhparent"
+            " JOIN pg_catalog.pg_class child ON child.oid = i.inhrelid"
+            " WHERE parent.relname = :table_name AND pg_catalog.pg_table_is_visible(parent.oid)"
+            " ORDER BY child.relname"
+        ),
+        {"table_name": SqlEventLogStorageTable.name},
+    ).fetchall()
+    return [(name, None if bound == "DEFAULT" else bound) for name, bound in rows]  # type: ignore
+
+
+def create_default_partition(conn: Connection) -> None:
+    conn.execute(
+        db.text(
+            f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION_NAME} PARTITION OF"
+            f" {SqlEventLogStorageTable.name} DEFAULT"
+        )
+    )
+
+
+def create_partition(conn: Connection, start: datetime, interval: str) -> str:
+    """Creates the partition starting at the given timestamp, if it does not exist yet. Fails if
+    the default partition already holds events within its range.
+    """
+    name = partition_table_name(start)
+    end = next_partition_start(start, interval)
+    conn.execute(
+        db.text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {SqlEventLogStorageTable.name}"
+            f" FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    )
+    return name
+
+
+def create_partitions(
+    conn: Connection, start: datetime, until: datetime, interval: str
+) -> datetime:
+    """Creates every partition from the one holding ``start`` up to the exclusive ``until`` bound,
+    which must be a partition boundary. Returns the upper bound of the last partition.
+    """
+    current = partition_start(start, interval)
+    while current < until:
+        create_partition(conn, current, interval)
+        current = next_partition_start(current, interval)
+    return current
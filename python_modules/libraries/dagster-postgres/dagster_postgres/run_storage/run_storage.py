@@ -1,4 +1,3 @@
-import zlib
 from typing import ContextManager, Mapping, Optional
 
 import dagster._check as check
@@ -225,7 +224,7 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 db_dialects.postgresql.insert(SnapshotsTable)
                 .values(
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                    snapshot_body=self._serialize_snapshot_body(conn, snapshot_obj),
                     snapshot_type=snapshot_type.value,
                 )
                 .on_conflict_do_nothing()
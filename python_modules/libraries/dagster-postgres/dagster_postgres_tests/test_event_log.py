@@ -109,3 +109,63 @@ def test_load_from_config(self, hostname):
                 from_explicit = explicit_instance._event_storage  # noqa: SLF001
 
                 assert from_url.postgres_url == from_explicit.postgres_url
+
+
+class TestPartitionedPostgresEventLogStorage(TestPostgresEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self, conn_string):
+        storage = PostgresEventLogStorage.create_clean_storage(
+            conn_string, event_log_partitioning={"interval": "day"}
+        )
+        assert storage
+        assert storage.is_event_logs_partitioned
+        try:
+            yield storage
+        finally:
+            storage.dispose()
+
+    def test_event_log_partitions(self, storage):
+        assert storage.get_event_log_partitions() == {"event_logs_default": None}
+
+        storage.store_event(create_test_event_log_record("1", run_id="foo"))
+        partitions = storage.get_event_log_partitions()
+        # the partition holding the event, plus the premade partitions after it
+        assert len(partitions) == 5
+        assert partitions["event_logs_default"] is None
+
+        storage.store_event(create_test_event_log_record("2", run_id="foo"))
+        assert storage.get_event_log_partitions() == partitions
+        assert len(storage.get_logs_for_run("foo")) == 2
+
+        storage.delete_events("foo")
+        assert len(storage.get_logs_for_run("foo")) == 0
+
+
+def test_migrate_to_partitioned_event_logs(conn_string):
+    storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+    try:
+        for i in range(5):
+            storage.store_event(create_test_event_log_record(str(i), run_id="foo"))
+        assert not storage.is_event_logs_partitioned
+        records = storage.get_records_for_run("foo").records
+    finally:
+        storage.dispose()
+
+    storage = PostgresEventLogStorage(
+        conn_string, event_log_partitioning={"interval": "day", "premake": 1}
+    )
+    try:
+        storage.migrate_to_partitioned_event_logs(batch_size=2)
+        assert storage.is_event_logs_partitioned
+        assert "event_logs_default" in storage.get_event_log_partitions()
+        assert storage.get_records_for_run("foo").records == records
+
+        # new events continue the storage id sequence
+        storage.store_event(create_test_event_log_record("5", run_id="foo"))
+        new_records = storage.get_records_for_run("foo").records
+        assert len(new_records) == 6
+        assert new_records[-1].storage_id > records[-1].storage_id
+    finally:
+        storage.dispose()